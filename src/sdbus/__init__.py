@@ -19,6 +19,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
+from .dbus_common_elements import DbusCallLimiter
 from .dbus_exceptions import (
     DbusAccessDeniedError,
     DbusAddressInUseError,
@@ -126,6 +127,7 @@ __all__ = (
 
     'DbusInterfaceCommonAsync',
     'DbusObjectManagerInterfaceAsync',
+    'DbusCallLimiter',
 
     'dbus_method_async',
     'dbus_method_async_override',
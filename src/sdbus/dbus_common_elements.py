@@ -19,25 +19,50 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
-from inspect import getfullargspec
+from asyncio import get_running_loop
+from collections import deque
+from inspect import getattr_static, getfullargspec
+from math import inf
+from time import monotonic
 from typing import TYPE_CHECKING, Generic, TypeVar
+from weakref import WeakSet
+from weakref import ref as weak_ref
 
 from .dbus_common_funcs import (
+    _count_complete_types,
     _is_property_flags_correct,
     snake_case_to_camel_case,
 )
 from .default_bus import get_default_bus
-from .sd_bus_internals import is_interface_name_valid, is_member_name_valid
+from .sd_bus_internals import (
+    DbusPropertyConstFlag,
+    DbusPropertyEmitsChangeFlag,
+    DbusPropertyEmitsInvalidationFlag,
+    is_interface_name_valid,
+    is_member_name_valid,
+)
 
 if TYPE_CHECKING:
-    from asyncio import Task
-    from collections.abc import Callable, Sequence
+    from asyncio import Future, Task
+    from collections.abc import (
+        Awaitable,
+        Callable,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
     from types import FunctionType
     from typing import Any, Optional
 
     SelfMeta = TypeVar('SelfMeta', bound="DbusInterfaceMetaCommon")
 
-    from .sd_bus_internals import SdBus, SdBusInterface
+    from .dbus_proxy_async_interface_base import DbusInterfaceBaseAsync
+    from .dbus_proxy_async_interfaces import (
+        DBUS_PROPERTIES_CHANGED_TYPING,
+        DbusPropertiesChangedBatch,
+    )
+    from .dbus_proxy_async_signal import DbusSignalAsync, DbusSignalThrottle
+    from .sd_bus_internals import SdBus, SdBusSlot
 
 T = TypeVar('T')
 
@@ -105,6 +130,30 @@ MEMBER_NAME_REQUIREMENTS = (
 )
 
 
+def _create_args_binder(
+    args_names: Sequence[str],
+    args_defaults: tuple[Any, ...],
+    qualified_name: str,
+) -> Callable[..., tuple[Any, ...]]:
+    # Generate a function with the same signature as the method
+    # (without self) that returns arguments in a positional order.
+    # Python itself then takes care of matching positional arguments,
+    # keyword arguments and defaults.
+    args_list = ', '.join(args_names)
+    binder_source = (
+        f"def bind_args({args_list}):\n"
+        f"    return ({args_list}{',' if args_names else ''})\n"
+    )
+    binder_namespace: dict[str, Any] = {}
+    exec(binder_source, binder_namespace)
+    args_binder: FunctionType = binder_namespace['bind_args']
+    args_binder.__qualname__ = qualified_name
+    if args_defaults and args_names:
+        args_binder.__defaults__ = args_defaults[-len(args_names):]
+
+    return args_binder
+
+
 class DbusMethodCommon(DbusMemberCommon):
 
     def __init__(
@@ -142,7 +191,11 @@ class DbusMethodCommon(DbusMemberCommon):
             self.args_spec.defaults
             if self.args_spec.defaults is not None
             else ())
-        self.default_args_start_at = self.num_of_args - len(self.args_defaults)
+        self._bind_args = _create_args_binder(
+            self.args_names,
+            self.args_defaults,
+            original_method.__qualname__,
+        )
 
         self.method_name = method_name
         self.input_signature = input_signature
@@ -157,6 +210,11 @@ class DbusMethodCommon(DbusMemberCommon):
             self.input_args_names = self.args_names
 
         self.result_signature = result_signature
+        # Multiple values are returned as a tuple that should be unpacked
+        # while a single struct is also a tuple but appended as is.
+        self.result_is_multiple_values = (
+            _count_complete_types(result_signature) > 1
+        )
         self.result_args_names: Sequence[str] = ()
         if result_args_names is not None:
             assert not any(' ' in x for x in result_args_names), (
@@ -169,59 +227,6 @@ class DbusMethodCommon(DbusMemberCommon):
 
         self.__doc__ = original_method.__doc__
 
-    def _rebuild_args(
-            self,
-            function: FunctionType,
-            *args: Any,
-            **kwargs: dict[str, Any]) -> list[Any]:
-        # 3 types of arguments
-        # *args - should be passed directly
-        # **kwargs - should be put in a proper order
-        # defaults - should be retrieved and put in proper order
-
-        # Strategy:
-        # Iterate over arg names
-        # Use:
-        # 1. Arg
-        # 2. Kwarg
-        # 3. Default
-
-        # a, b, c, d, e
-        #       ^ defaults start here
-        # 5 - 3 = [2]
-        # ^ total args
-        #     ^ number of default args
-        # First arg that supports default is
-        # (total args - number of default args)
-        passed_args_iter = iter(args)
-        default_args_iter = iter(self.args_defaults)
-
-        new_args_list: list[Any] = []
-
-        for i, a_name in enumerate(self.args_spec.args[1:]):
-            try:
-                next_arg = next(passed_args_iter)
-            except StopIteration:
-                next_arg = None
-
-            if i >= self.default_args_start_at:
-                next_default_arg = next(default_args_iter)
-            else:
-                next_default_arg = None
-
-            next_kwarg = kwargs.get(a_name)
-
-            if next_arg is not None:
-                new_args_list.append(next_arg)
-            elif next_kwarg is not None:
-                new_args_list.append(next_kwarg)
-            elif next_default_arg is not None:
-                new_args_list.append(next_default_arg)
-            else:
-                raise TypeError('Could not flatten the args')
-
-        return new_args_list
-
 
 class DbusPropertyCommon(DbusMemberCommon):
     def __init__(self,
@@ -282,11 +287,11 @@ class DbusSignalCommon(DbusMemberCommon):
 
 
 class DbusBoundAsync:
-    ...
+    __slots__ = ()
 
 
 class DbusBoundSync:
-    ...
+    __slots__ = ()
 
 
 class DbusMethodOverride(Generic[T]):
@@ -311,7 +316,124 @@ class DbusPropertyOverride(Generic[T]):
         self.is_setter_public = False
 
 
+class DbusPropertyCache:
+    """Client side cache of remote properties values.
+
+    Properties with the const flag are cached forever. If the cache
+    is kept updated by PropertiesChanged signal (``is_updated_by_signals``)
+    the properties that emit change or invalidation are cached until
+    the signal updates or invalidates them. Every other property is
+    only cached if ``time_to_live`` is set.
+    """
+
+    def __init__(
+        self,
+        properties_flags: dict[tuple[str, str], int],
+        time_to_live: Optional[float],
+        is_updated_by_signals: bool,
+    ) -> None:
+        self.properties_flags = properties_flags
+        self.time_to_live = time_to_live
+        self.is_updated_by_signals = is_updated_by_signals
+        self.values: dict[tuple[str, str], tuple[Any, float]] = {}
+        self.match_slots: list[SdBusSlot] = []
+
+    def _expires_at(self, flags: int) -> Optional[float]:
+        if flags & DbusPropertyConstFlag:
+            return inf
+
+        if self.is_updated_by_signals and flags & (
+            DbusPropertyEmitsChangeFlag | DbusPropertyEmitsInvalidationFlag
+        ):
+            return inf
+
+        if self.time_to_live is None:
+            return None
+
+        return monotonic() + self.time_to_live
+
+    def lookup(self, interface_name: str, property_name: str) -> Any:
+        """Return cached value or raise KeyError if missing or expired."""
+        key = (interface_name, property_name)
+        value, expires_at = self.values[key]
+        if expires_at != inf and expires_at < monotonic():
+            del self.values[key]
+            raise KeyError(key)
+
+        return value
+
+    def store(
+        self,
+        interface_name: str,
+        property_name: str,
+        value: Any,
+    ) -> None:
+        key = (interface_name, property_name)
+        flags = self.properties_flags.get(key)
+        if flags is None:
+            return
+
+        expires_at = self._expires_at(flags)
+        if expires_at is None:
+            return
+
+        self.values[key] = (value, expires_at)
+
+    def invalidate(self, interface_name: str, property_name: str) -> None:
+        self.values.pop((interface_name, property_name), None)
+
+    def update_from_properties_changed(
+        self,
+        properties_changed_data: DBUS_PROPERTIES_CHANGED_TYPING,
+    ) -> None:
+        interface_name, changed_properties, invalidated_properties = (
+            properties_changed_data
+        )
+
+        for property_name, (_, value) in changed_properties.items():
+            self.store(interface_name, property_name, value)
+
+        for property_name in invalidated_properties:
+            self.invalidate(interface_name, property_name)
+
+    def clear(self) -> None:
+        self.values.clear()
+
+    def close(self) -> None:
+        self.values.clear()
+        for match_slot in self.match_slots:
+            match_slot.close()
+
+        self.match_slots.clear()
+
+
+def _collect_properties_flags(
+    dbus_class: type,
+    interfaces_meta: Iterable[tuple[str, DbusClassMeta]],
+) -> dict[tuple[str, str], int]:
+    properties_flags: dict[tuple[str, str], int] = {}
+
+    for interface_name, meta in interfaces_meta:
+        for python_attr, dbus_member in (
+            meta.python_attr_to_dbus_member.items()
+        ):
+            dbus_element = getattr_static(dbus_class, python_attr)
+            if isinstance(dbus_element, DbusPropertyCommon):
+                properties_flags[(interface_name, dbus_member)] = (
+                    dbus_element.flags
+                )
+
+    return properties_flags
+
+
 class DbusRemoteObjectMeta:
+    __slots__ = (
+        'service_name',
+        'object_path',
+        'attached_bus',
+        'property_cache',
+    )
+
     def __init__(
         self,
         service_name: str,
@@ -324,14 +446,25 @@ class DbusRemoteObjectMeta:
             bus if bus is not None
             else get_default_bus()
         )
+        self.property_cache: Optional[DbusPropertyCache] = None
 
 
 class DbusLocalObjectMeta:
     def __init__(self) -> None:
-        self.activated_interfaces: list[SdBusInterface] = []
+        # Slots of the exported interfaces. Closing them stops the export.
+        self.export_slots: list[SdBusSlot] = []
         self.serving_object_path: Optional[str] = None
         self.attached_bus: Optional[SdBus] = None
         self._tasks: Optional[set[Task[None]]] = None
+        self._signals_throttles: Optional[
+            dict[DbusSignalAsync[Any], DbusSignalThrottle[Any]]] = None
+        self._signals_callbacks: Optional[
+            dict[DbusSignalAsync[Any], WeakSet[Callable[[Any], Any]]]] = None
+        # Called with the data of every emitted PropertiesChanged
+        self.properties_changed_observers: list[
+            Callable[[DBUS_PROPERTIES_CHANGED_TYPING], None]] = []
+        self.properties_batch: Optional[DbusPropertiesChangedBatch] = None
+        self.call_admission: Optional[DbusCallAdmission] = None
 
     @property
     def tasks(self) -> set[Task[None]]:
@@ -342,6 +475,498 @@ class DbusLocalObjectMeta:
 
         return tasks_set
 
+    @property
+    def signals_throttles(
+        self,
+    ) -> dict[DbusSignalAsync[Any], DbusSignalThrottle[Any]]:
+        signals_throttles = self._signals_throttles
+        if signals_throttles is None:
+            signals_throttles = {}
+            self._signals_throttles = signals_throttles
+
+        return signals_throttles
+
+    @property
+    def signals_callbacks(
+        self,
+    ) -> dict[DbusSignalAsync[Any], WeakSet[Callable[[Any], Any]]]:
+        signals_callbacks = self._signals_callbacks
+        if signals_callbacks is None:
+            signals_callbacks = {}
+            self._signals_callbacks = signals_callbacks
+
+        return signals_callbacks
+
+
+def _parent_object_path(object_path: str) -> str:
+    return object_path.rsplit('/', 1)[0] or '/'
+
+
+class DbusExportedObjectsRegistry:
+    """Local objects exported to a bus indexed by their paths."""
+
+    def __init__(self, bus: SdBus) -> None:
+        self.bus = bus
+        self.path_to_objects: dict[
+            str, list[weak_ref[DbusInterfaceBaseAsync]]] = {}
+        # Paths that have exported objects under them
+        # mapped to the direct children leading to those objects
+        self.path_to_children: dict[str, set[str]] = {}
+
+    def add(
+        self,
+        object_path: str,
+        exported_object: DbusInterfaceBaseAsync,
+    ) -> None:
+        def on_object_collected(
+                object_ref: weak_ref[DbusInterfaceBaseAsync]) -> None:
+            self._remove_ref(object_path, object_ref)
+
+        object_ref = weak_ref(exported_object, on_object_collected)
+
+        objects_at_path = self.path_to_objects.get(object_path)
+        if objects_at_path is not None:
+            objects_at_path.append(object_ref)
+            return
+
+        self.path_to_objects[object_path] = [object_ref]
+
+        path = object_path
+        while path != '/':
+            parent_path = _parent_object_path(path)
+            children = self.path_to_children.get(parent_path)
+            if children is not None:
+                # Parent already linked to the root
+                children.add(path)
+                return
+
+            self.path_to_children[parent_path] = {path}
+            path = parent_path
+
+    def remove(
+        self,
+        object_path: str,
+        local_meta: DbusLocalObjectMeta,
+    ) -> None:
+        for object_ref in self.path_to_objects.get(object_path, ()):
+            exported_object = object_ref()
+            if exported_object is not None and (
+                exported_object._dbus is local_meta
+            ):
+                self._remove_ref(object_path, object_ref)
+                return
+
+    def _remove_ref(
+        self,
+        object_path: str,
+        object_ref: weak_ref[DbusInterfaceBaseAsync],
+    ) -> None:
+        objects_at_path = self.path_to_objects.get(object_path)
+        if objects_at_path is None or object_ref not in objects_at_path:
+            return
+
+        objects_at_path.remove(object_ref)
+        if objects_at_path:
+            return
+
+        del self.path_to_objects[object_path]
+
+        if not self.path_to_objects:
+            # Do not keep the bus alive once nothing is exported
+            if BUS_TO_EXPORTED_OBJECTS.get(self.bus) is self:
+                del BUS_TO_EXPORTED_OBJECTS[self.bus]
+
+            self.path_to_children.clear()
+            return
+
+        path = object_path
+        while (
+            path != '/'
+            and path not in self.path_to_objects
+            and path not in self.path_to_children
+        ):
+            parent_path = _parent_object_path(path)
+            children = self.path_to_children[parent_path]
+            children.discard(path)
+            if children:
+                return
+
+            del self.path_to_children[parent_path]
+            path = parent_path
+
+    def get(self, object_path: str) -> Optional[DbusInterfaceBaseAsync]:
+        for object_ref in reversed(self.path_to_objects.get(object_path, ())):
+            exported_object = object_ref()
+            if exported_object is not None:
+                return exported_object
+
+        return None
+
+    def iter_subtree(
+        self,
+        path_prefix: str,
+    ) -> Iterator[tuple[str, DbusInterfaceBaseAsync]]:
+        paths_to_visit = [path_prefix]
+        while paths_to_visit:
+            path = paths_to_visit.pop()
+
+            for object_ref in self.path_to_objects.get(path, ()):
+                exported_object = object_ref()
+                if exported_object is not None:
+                    yield path, exported_object
+
+            paths_to_visit.extend(self.path_to_children.get(path, ()))
+
+
+BUS_TO_EXPORTED_OBJECTS: dict[SdBus, DbusExportedObjectsRegistry] = {}
+
+
+def _register_exported_object(
+    bus: SdBus,
+    object_path: str,
+    exported_object: DbusInterfaceBaseAsync,
+) -> None:
+    registry = BUS_TO_EXPORTED_OBJECTS.get(bus)
+    if registry is None:
+        registry = DbusExportedObjectsRegistry(bus)
+        BUS_TO_EXPORTED_OBJECTS[bus] = registry
+
+    registry.add(object_path, exported_object)
+
+
+def _unregister_exported_object(local_meta: DbusLocalObjectMeta) -> None:
+    bus = local_meta.attached_bus
+    object_path = local_meta.serving_object_path
+    if bus is None or object_path is None:
+        return
+
+    registry = BUS_TO_EXPORTED_OBJECTS.get(bus)
+    if registry is not None:
+        registry.remove(object_path, local_meta)
+
+
+class DbusCallLimiter:
+    """Limits the number of async method calls waiting for reply on a bus.
+
+    Calls that would exceed ``max_in_flight`` for the whole bus or
+    ``max_in_flight_per_destination`` for a single service wait in
+    a FIFO queue and are sent once the earlier calls get their reply.
+
+    The limiter only applies to the calls once :py:meth:`install` is called.
+    Calls made directly with :py:meth:`SdBus.call_async` are not limited.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_in_flight_per_destination: Optional[int] = None,
+        bus: Optional[SdBus] = None,
+    ) -> None:
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1')
+
+        if (
+            max_in_flight_per_destination is not None
+            and max_in_flight_per_destination < 1
+        ):
+            raise ValueError(
+                'max_in_flight_per_destination must be at least 1'
+            )
+
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_destination = max_in_flight_per_destination
+        self.bus = bus if bus is not None else get_default_bus()
+
+        self.in_flight = 0
+        self.destination_in_flight: dict[str, int] = {}
+        self.waiters: deque[tuple[str, Future[None]]] = deque()
+
+        # Metrics
+        self.calls_waited = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self.waiters)
+
+    def _can_send(self, destination: str) -> bool:
+        max_in_flight = self.max_in_flight
+        if max_in_flight is not None and self.in_flight >= max_in_flight:
+            return False
+
+        max_per_destination = self.max_in_flight_per_destination
+        if max_per_destination is not None and (
+            self.destination_in_flight.get(destination, 0)
+            >= max_per_destination
+        ):
+            return False
+
+        return True
+
+    def _take(self, destination: str) -> None:
+        self.in_flight += 1
+        destination_in_flight = self.destination_in_flight
+        destination_in_flight[destination] = (
+            destination_in_flight.get(destination, 0) + 1
+        )
+
+    def _release(self, destination: str) -> None:
+        self.in_flight -= 1
+        destination_in_flight = self.destination_in_flight
+        remaining = destination_in_flight[destination] - 1
+        if remaining:
+            destination_in_flight[destination] = remaining
+        else:
+            del destination_in_flight[destination]
+
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        # Waiters are woken in the order they arrived. A waiter for
+        # a saturated destination does not hold back the other ones.
+        for waiter in tuple(self.waiters):
+            destination, future = waiter
+            if future.done():
+                continue
+
+            if not self._can_send(destination):
+                if (
+                    self.max_in_flight is not None
+                    and self.in_flight >= self.max_in_flight
+                ):
+                    return
+
+                continue
+
+            self.waiters.remove(waiter)
+            self._take(destination)
+            future.set_result(None)
+
+    async def _acquire(self, destination: str) -> None:
+        if self._can_send(destination):
+            self._take(destination)
+            return
+
+        waiter: tuple[str, Future[None]] = (
+            destination, get_running_loop().create_future())
+        self.waiters.append(waiter)
+        wait_start = monotonic()
+        try:
+            await waiter[1]
+        except BaseException:
+            if waiter[1].done() and not waiter[1].cancelled():
+                # Slot was given right before the cancellation
+                self._release(destination)
+            else:
+                try:
+                    self.waiters.remove(waiter)
+                except ValueError:
+                    ...
+            raise
+        finally:
+            wait_time = monotonic() - wait_start
+            self.calls_waited += 1
+            self.total_wait_time += wait_time
+            if wait_time > self.max_wait_time:
+                self.max_wait_time = wait_time
+
+    async def call(
+        self,
+        destination: str,
+        call_function: Callable[..., Awaitable[T]],
+        *args: Any,
+    ) -> T:
+        """Await ``call_function(*args)`` once the limits allow it."""
+        await self._acquire(destination)
+        try:
+            return await call_function(*args)
+        finally:
+            self._release(destination)
+
+    def install(self) -> None:
+        """Apply the limits to the async calls on the bus.
+
+        :raises RuntimeError: Other limiter is already installed on the bus.
+        """
+        installed_limiter = BUS_TO_CALL_LIMITER.get(self.bus)
+        if installed_limiter is self:
+            return
+
+        if installed_limiter is not None:
+            raise RuntimeError('Call limiter already installed on the bus')
+
+        BUS_TO_CALL_LIMITER[self.bus] = self
+
+    def close(self) -> None:
+        """Detach from the bus. Queued calls are sent right away."""
+        if BUS_TO_CALL_LIMITER.get(self.bus) is self:
+            del BUS_TO_CALL_LIMITER[self.bus]
+
+        self.max_in_flight = None
+        self.max_in_flight_per_destination = None
+        self._wake_waiters()
+
+
+BUS_TO_CALL_LIMITER: dict[SdBus, DbusCallLimiter] = {}
+
+
+class DbusCallAdmission:
+    """Limits concurrent calls of exported async methods of an object.
+
+    Calls over the limits are queued up to ``max_queued`` and
+    started in order once running calls finish. The rest are rejected.
+    """
+
+    def __init__(self) -> None:
+        self.max_concurrent: Optional[int] = None
+        self.max_concurrent_per_method: Optional[int] = None
+        self.max_concurrent_per_sender: Optional[int] = None
+        self.max_queued = 0
+
+        self.running = 0
+        self.method_running: dict[DbusMethodCommon, int] = {}
+        self.sender_running: dict[str, int] = {}
+        self.queued: deque[
+            tuple[
+                DbusMethodCommon, str,
+                Callable[[], None], Callable[[], None],
+            ]
+        ] = deque()
+        self.is_waking_queued = False
+
+        # Metrics
+        self.calls_queued = 0
+        self.calls_rejected = 0
+
+    def _can_start(self, dbus_method: DbusMethodCommon, sender: str) -> bool:
+        max_concurrent = self.max_concurrent
+        if max_concurrent is not None and self.running >= max_concurrent:
+            return False
+
+        max_per_method = self.max_concurrent_per_method
+        if max_per_method is not None and (
+            self.method_running.get(dbus_method, 0) >= max_per_method
+        ):
+            return False
+
+        max_per_sender = self.max_concurrent_per_sender
+        if max_per_sender is not None and (
+            self.sender_running.get(sender, 0) >= max_per_sender
+        ):
+            return False
+
+        return True
+
+    def _take(self, dbus_method: DbusMethodCommon, sender: str) -> None:
+        self.running += 1
+        method_running = self.method_running
+        method_running[dbus_method] = method_running.get(dbus_method, 0) + 1
+        sender_running = self.sender_running
+        sender_running[sender] = sender_running.get(sender, 0) + 1
+
+    def admit(
+        self,
+        dbus_method: DbusMethodCommon,
+        sender: str,
+        start_call: Callable[[], None],
+        reject_call: Callable[[], None],
+    ) -> bool:
+        """Start or queue the call. Returns False if it was rejected.
+
+        ``reject_call`` is called if the queued call is cleared
+        before it could start.
+        """
+        # Queued calls are woken as soon as their limits allow so
+        # a call that can start now does not overtake any of them
+        # that could start as well.
+        if self._can_start(dbus_method, sender):
+            self._take(dbus_method, sender)
+            start_call()
+            return True
+
+        if len(self.queued) >= self.max_queued:
+            self.calls_rejected += 1
+            return False
+
+        self.calls_queued += 1
+        self.queued.append((dbus_method, sender, start_call, reject_call))
+        return True
+
+    def set_limits(
+        self,
+        max_concurrent: Optional[int],
+        max_concurrent_per_method: Optional[int],
+        max_concurrent_per_sender: Optional[int],
+        max_queued: int,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_concurrent_per_method = max_concurrent_per_method
+        self.max_concurrent_per_sender = max_concurrent_per_sender
+        self.max_queued = max_queued
+        # Raised limits might let the queued calls start
+        self._wake_queued_once()
+
+    def release(self, dbus_method: DbusMethodCommon, sender: str) -> None:
+        self.running -= 1
+
+        method_running = self.method_running
+        remaining = method_running[dbus_method] - 1
+        if remaining:
+            method_running[dbus_method] = remaining
+        else:
+            del method_running[dbus_method]
+
+        sender_running = self.sender_running
+        remaining = sender_running[sender] - 1
+        if remaining:
+            sender_running[sender] = remaining
+        else:
+            del sender_running[sender]
+
+        self._wake_queued_once()
+
+    def _wake_queued_once(self) -> None:
+        if self.is_waking_queued:
+            # Call started by _wake_queued finished right away
+            return
+
+        self.is_waking_queued = True
+        try:
+            self._wake_queued()
+        finally:
+            self.is_waking_queued = False
+
+    def _wake_queued(self) -> None:
+        # Calls that can not start yet do not hold back
+        # the calls queued after them.
+        queued = self.queued
+        index = 0
+        while index < len(queued):
+            dbus_method, sender, start_call, _ = queued[index]
+            if not self._can_start(dbus_method, sender):
+                if (
+                    self.max_concurrent is not None
+                    and self.running >= self.max_concurrent
+                ):
+                    return
+
+                index += 1
+                continue
+
+            del queued[index]
+            self._take(dbus_method, sender)
+            start_call()
+            # Started call might have already finished
+            index = 0
+
+    def clear(self) -> None:
+        """Reject all queued calls."""
+        queued = self.queued
+        while queued:
+            _, _, _, reject_call = queued.popleft()
+            reject_call()
+
 
 class DbusClassMeta:
     def __init__(
@@ -49,6 +49,25 @@ def _is_property_flags_correct(flags: int) -> bool:
     return (0 <= num_of_flag_bits <= 1)
 
 
+def _count_complete_types(signature: str) -> int:
+    """Count number of complete types in the D-Bus signature."""
+    num_of_complete_types = 0
+    depth = 0
+    for signature_char in signature:
+        if signature_char in '({':
+            depth += 1
+        elif signature_char in ')}':
+            depth -= 1
+        elif signature_char == 'a':
+            # Array element type is part of the same complete type
+            continue
+
+        if depth == 0:
+            num_of_complete_types += 1
+
+    return num_of_complete_types
+
+
 def _snake_case_to_camel_case_gen(snake: str) -> Iterator[str]:
     char_iter = iter(snake)
     # Name starting with upper case letter
@@ -21,12 +21,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from copy import copy
+from inspect import iscoroutinefunction
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 from warnings import warn
 from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from .dbus_common_elements import (
+    DbusCallAdmission,
     DbusClassMeta,
     DbusInterfaceMetaCommon,
     DbusLocalObjectMeta,
@@ -36,13 +38,12 @@ from .dbus_common_elements import (
     DbusMethodOverride,
     DbusPropertyOverride,
     DbusRemoteObjectMeta,
+    _register_exported_object,
+    _unregister_exported_object,
 )
-from .dbus_proxy_async_method import DbusLocalMethodAsync, DbusMethodAsync
-from .dbus_proxy_async_property import (
-    DbusLocalPropertyAsync,
-    DbusPropertyAsync,
-)
-from .dbus_proxy_async_signal import DbusLocalSignalAsync, DbusSignalAsync
+from .dbus_proxy_async_method import DbusMethodAsync
+from .dbus_proxy_async_property import DbusPropertyAsync
+from .dbus_proxy_async_signal import DbusSignalAsync
 from .default_bus import get_default_bus
 from .sd_bus_internals import SdBusInterface
 
@@ -50,6 +51,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
     from typing import Optional, TypeVar, Union
 
+    from .dbus_common_elements import DbusBoundAsync
     from .sd_bus_internals import SdBus, SdBusSlot
 
     T = TypeVar('T')
@@ -61,6 +63,8 @@ DBUS_CLASS_TO_META: WeakKeyDictionary[
     type, DbusClassMeta] = WeakKeyDictionary()
 DBUS_INTERFACE_NAME_TO_CLASS: WeakValueDictionary[
     str, DbusInterfaceMetaAsync] = WeakValueDictionary()
+DBUS_CLASS_TO_SHARED_INTERFACES: WeakKeyDictionary[
+    type, list[tuple[str, SdBusInterface]]] = WeakKeyDictionary()
 
 
 class DbusInterfaceMetaAsync(DbusInterfaceMetaCommon):
@@ -89,6 +93,8 @@ class DbusInterfaceMetaAsync(DbusInterfaceMetaCommon):
         new_method.original_method = (
             override.override_method  # type: ignore[assignment]
         )
+        new_method.is_handler_coroutine = iscoroutinefunction(
+            new_method.original_method)
         return new_method
 
     @staticmethod
@@ -336,7 +342,30 @@ class DbusInterfaceBaseAsync(metaclass=DbusInterfaceMetaAsync):
         local_object_meta.attached_bus = bus
         local_object_meta.serving_object_path = object_path
 
-        for interface_name, meta in self._dbus_iter_interfaces_meta():
+        for interface_name, new_interface in self._dbus_shared_interfaces():
+            local_object_meta.export_slots.append(
+                bus.add_shared_interface(
+                    new_interface, object_path, interface_name, self,
+                )
+            )
+
+        if not local_object_meta.export_slots:
+            self._dbus_on_no_members_exported()
+
+        _register_exported_object(bus, object_path, self)
+
+        return DbusExportHandle(local_object_meta)
+
+    @classmethod
+    def _dbus_shared_interfaces(cls) -> list[tuple[str, SdBusInterface]]:
+        # Vtables are built once per class and shared by every
+        # exported object. Members receive the served object.
+        shared_interfaces = DBUS_CLASS_TO_SHARED_INTERFACES.get(cls)
+        if shared_interfaces is not None:
+            return shared_interfaces
+
+        shared_interfaces = []
+        for interface_name, meta in cls._dbus_iter_interfaces_meta():
             if not meta.serving_enabled:
                 continue
 
@@ -345,56 +374,151 @@ class DbusInterfaceBaseAsync(metaclass=DbusInterfaceMetaAsync):
             for python_attr, dbus_member in (
                 meta.python_attr_to_dbus_member.items()
             ):
-                dbus_something = getattr(self, python_attr)
-                if isinstance(dbus_something, DbusLocalMethodAsync):
+                dbus_something = getattr(cls, python_attr)
+                if isinstance(dbus_something, DbusMethodAsync):
                     new_interface.add_method(
-                        dbus_something.dbus_method.method_name,
-                        dbus_something.dbus_method.input_signature,
-                        dbus_something.dbus_method.input_args_names,
-                        dbus_something.dbus_method.result_signature,
-                        dbus_something.dbus_method.result_args_names,
-                        dbus_something.dbus_method.flags,
-                        dbus_something._dbus_reply_call,
+                        dbus_something.method_name,
+                        dbus_something.input_signature,
+                        dbus_something.input_args_names,
+                        dbus_something.result_signature,
+                        dbus_something.result_args_names,
+                        dbus_something.flags,
+                        dbus_something._dbus_reply_call_shared,
                     )
-                elif isinstance(dbus_something, DbusLocalPropertyAsync):
-                    getter = dbus_something._dbus_reply_get
-                    dbus_property = dbus_something.dbus_property
-
+                elif isinstance(dbus_something, DbusPropertyAsync):
                     if (
-                        dbus_property.property_setter is not None
+                        dbus_something.property_setter is not None
                         and
-                        dbus_property.property_setter_is_public
+                        dbus_something.property_setter_is_public
                     ):
-                        setter = dbus_something._dbus_reply_set
+                        setter = dbus_something._dbus_reply_set_shared
                     else:
                         setter = None
 
                     new_interface.add_property(
-                        dbus_property.property_name,
-                        dbus_property.property_signature,
-                        getter,
+                        dbus_something.property_name,
+                        dbus_something.property_signature,
+                        dbus_something._dbus_reply_get_shared,
                         setter,
-                        dbus_property.flags,
+                        dbus_something.flags,
                     )
-                elif isinstance(dbus_something, DbusLocalSignalAsync):
+                elif isinstance(dbus_something, DbusSignalAsync):
                     new_interface.add_signal(
-                        dbus_something.dbus_signal.signal_name,
-                        dbus_something.dbus_signal.signal_signature,
-                        dbus_something.dbus_signal.args_names,
-                        dbus_something.dbus_signal.flags,
+                        dbus_something.signal_name,
+                        dbus_something.signal_signature,
+                        dbus_something.args_names,
+                        dbus_something.flags,
                     )
                 else:
                     raise TypeError(
                         f"Expected D-Bus element, got: {dbus_something!r}"
                     )
 
-            bus.add_interface(new_interface, object_path, interface_name)
-            local_object_meta.activated_interfaces.append(new_interface)
+            shared_interfaces.append((interface_name, new_interface))
 
-        if not local_object_meta.activated_interfaces:
-            self._dbus_on_no_members_exported()
+        DBUS_CLASS_TO_SHARED_INTERFACES[cls] = shared_interfaces
+        return shared_interfaces
 
-        return DbusExportHandle(local_object_meta)
+    @classmethod
+    def export_subtree_to_dbus(
+        cls,
+        path_prefix: str,
+        object_lookup: Callable[[str], Optional[DbusInterfaceBaseAsync]],
+        bus: Optional[SdBus] = None,
+        node_enumerator: Optional[Callable[[str], Iterable[str]]] = None,
+    ) -> DbusExportHandle:
+        if bus is None:
+            bus = get_default_bus()
+
+        attached_bus = bus
+
+        def bind_object_lookup(
+            object_path: str,
+        ) -> Optional[DbusInterfaceBaseAsync]:
+            # Attach found objects to the bus so that they can
+            # emit signals and properties changes.
+            found_object = object_lookup(object_path)
+            if found_object is None:
+                return None
+
+            found_meta = found_object._dbus
+            if (
+                isinstance(found_meta, DbusLocalObjectMeta)
+                and found_meta.attached_bus is None
+            ):
+                found_meta.attached_bus = attached_bus
+                found_meta.serving_object_path = object_path
+
+            return found_object
+
+        # Objects under the prefix share the class vtables and
+        # the lookup function is called to find the served object.
+        subtree_meta = DbusLocalObjectMeta()
+        subtree_meta.attached_bus = bus
+        subtree_meta.serving_object_path = path_prefix
+
+        for interface_name, new_interface in cls._dbus_shared_interfaces():
+            subtree_meta.export_slots.append(
+                bus.add_fallback_interface(
+                    new_interface, path_prefix, interface_name,
+                    bind_object_lookup,
+                )
+            )
+
+        if not subtree_meta.export_slots:
+            raise ValueError("No D-Bus interfaces were exported")
+
+        export_handle = DbusExportHandle(subtree_meta)
+
+        if node_enumerator is not None:
+            export_handle._dbus_slots.append(
+                bus.add_node_enumerator(path_prefix, node_enumerator)
+            )
+
+        return export_handle
+
+    def set_call_limits(
+        self,
+        *,
+        max_concurrent: Optional[int] = None,
+        max_concurrent_per_method: Optional[int] = None,
+        max_concurrent_per_sender: Optional[int] = None,
+        max_queued: int = 0,
+    ) -> None:
+        local_object_meta = self._dbus
+        if isinstance(local_object_meta, DbusRemoteObjectMeta):
+            raise RuntimeError("Cannot limit calls of D-Bus proxies.")
+
+        for limit in (
+            max_concurrent,
+            max_concurrent_per_method,
+            max_concurrent_per_sender,
+        ):
+            if limit is not None and limit < 1:
+                raise ValueError("Concurrent calls limit must be at least 1")
+
+        if max_queued < 0:
+            raise ValueError("Queued calls limit can not be negative")
+
+        call_admission = local_object_meta.call_admission
+        if call_admission is None:
+            call_admission = DbusCallAdmission()
+
+        if (
+            max_concurrent is None
+            and max_concurrent_per_method is None
+            and max_concurrent_per_sender is None
+        ):
+            local_object_meta.call_admission = None
+        else:
+            local_object_meta.call_admission = call_admission
+
+        call_admission.set_limits(
+            max_concurrent,
+            max_concurrent_per_method,
+            max_concurrent_per_sender,
+            max_queued,
+        )
 
     def _connect(
         self,
@@ -420,6 +544,10 @@ class DbusInterfaceBaseAsync(metaclass=DbusInterfaceMetaAsync):
             object_path,
             bus,
         )
+        # Bound proxy members are created on first access and reused.
+        # Kept on the proxy so that they do not reference back
+        # the object holding them.
+        self._dbus_bound_members: dict[DbusMemberCommon, DbusBoundAsync] = {}
 
     @classmethod
     def new_connect(
@@ -452,9 +580,9 @@ class DbusInterfaceBaseAsync(metaclass=DbusInterfaceMetaAsync):
 
 class DbusExportHandle:
     def __init__(self, local_meta: DbusLocalObjectMeta):
+        self._local_meta = local_meta
         self._tasks = local_meta.tasks
-        self._dbus_slots: list[SdBusSlot] = []
-        self._dbus_interfaces = local_meta.activated_interfaces
+        self._dbus_slots: list[SdBusSlot] = local_meta.export_slots
 
     async def __aenter__(self) -> DbusExportHandle:
         return self
@@ -482,8 +610,14 @@ class DbusExportHandle:
         for task in self._tasks:
             task.cancel("D-Bus export stopped")
 
-        for interface in self._dbus_interfaces:
-            interface._stop_export()
+        for throttle in self._local_meta.signals_throttles.values():
+            throttle.cancel()
+
+        call_admission = self._local_meta.call_admission
+        if call_admission is not None:
+            call_admission.clear()
 
         for slot in self._dbus_slots:
             slot.close()
+
+        _unregister_exported_object(self._local_meta)
@@ -19,15 +19,33 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from asyncio import Queue, ensure_future, gather, get_running_loop
+from contextlib import closing
+from typing import TYPE_CHECKING, cast
+from weakref import ref as weak_ref
 
+from .dbus_common_elements import (
+    DbusLocalObjectMeta,
+    DbusPropertyCache,
+    DbusRemoteObjectMeta,
+    _collect_properties_flags,
+)
 from .dbus_common_funcs import _parse_properties_vardict
 from .dbus_proxy_async_interface_base import DbusInterfaceBaseAsync
 from .dbus_proxy_async_method import dbus_method_async
-from .dbus_proxy_async_signal import dbus_signal_async
+from .dbus_proxy_async_signal import (
+    DbusLocalSignalAsync,
+    DbusProxySignalAsync,
+    dbus_signal_async,
+)
+from .utils.parse import parse_properties_changed
 
 if TYPE_CHECKING:
-    from typing import Any, Literal
+    from collections.abc import AsyncIterator, Iterable
+    from types import TracebackType
+    from typing import Any, Literal, Optional
+
+    from .sd_bus_internals import SdBusMessage
 
     DBUS_PROPERTIES_CHANGED_TYPING = (
         tuple[
@@ -38,6 +56,125 @@ if TYPE_CHECKING:
     )
 
 
+class _PropertiesChangedAccumulator:
+    def __init__(self, interface_names: Iterable[str]) -> None:
+        self.interface_names = frozenset(interface_names)
+        self.changed: dict[str, dict[str, tuple[str, Any]]] = {}
+        self.invalidated: dict[str, set[str]] = {}
+
+    def merge(self, properties_changed_data: DBUS_PROPERTIES_CHANGED_TYPING,
+              ) -> None:
+        interface_name, changed_properties, invalidated_properties = (
+            properties_changed_data
+        )
+        if interface_name not in self.interface_names:
+            return
+
+        pending_changed = self.changed.setdefault(interface_name, {})
+        pending_invalidated = self.invalidated.setdefault(
+            interface_name, set())
+
+        for member_name, variant in changed_properties.items():
+            pending_changed[member_name] = variant
+            pending_invalidated.discard(member_name)
+
+        for member_name in invalidated_properties:
+            pending_changed.pop(member_name, None)
+            pending_invalidated.add(member_name)
+
+    def merge_message(self, message: SdBusMessage) -> None:
+        self.merge(
+            cast('DBUS_PROPERTIES_CHANGED_TYPING', message.get_contents())
+        )
+
+    def pop_delta(
+        self,
+        interface: DbusInterfaceBaseAsync,
+        on_unknown_member: Literal['error', 'ignore', 'reuse'],
+    ) -> dict[str, Any]:
+        delta: dict[str, Any] = {}
+
+        for interface_name, changed_properties in self.changed.items():
+            delta.update(
+                parse_properties_changed(
+                    interface,
+                    (
+                        interface_name,
+                        changed_properties,
+                        list(self.invalidated[interface_name]),
+                    ),
+                    on_unknown_member,
+                )
+            )
+
+        self.changed = {}
+        self.invalidated = {}
+        return delta
+
+
+class DbusPropertiesChangedBatch:
+    def __init__(
+        self,
+        local_object: DbusPropertiesInterfaceAsync,
+        local_meta: DbusLocalObjectMeta,
+    ) -> None:
+        self.local_object_ref = weak_ref(local_object)
+        self.local_meta = local_meta
+        self.changed: dict[str, dict[str, tuple[str, Any]]] = {}
+        self.nesting_level = 0
+        self.flush_scheduled = False
+
+    def add(
+        self,
+        interface_name: str,
+        property_name: str,
+        property_signature: str,
+        new_value: Any,
+    ) -> None:
+        self.changed.setdefault(interface_name, {})[property_name] = (
+            property_signature, new_value,
+        )
+
+    def flush(self) -> None:
+        if self.local_meta.properties_batch is self:
+            self.local_meta.properties_batch = None
+
+        self.flush_scheduled = False
+        changed = self.changed
+        self.changed = {}
+
+        local_object = self.local_object_ref()
+        if local_object is None:
+            return
+
+        for interface_name, changed_properties in changed.items():
+            local_object.properties_changed.emit(
+                (interface_name, changed_properties, [])
+            )
+
+    def schedule_flush(self) -> None:
+        if self.flush_scheduled:
+            return
+
+        get_running_loop().call_soon(self.flush)
+        self.flush_scheduled = True
+
+    def __enter__(self) -> DbusPropertiesChangedBatch:
+        self.nesting_level += 1
+        self.local_meta.properties_batch = self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.nesting_level -= 1
+        if self.nesting_level == 0 and not self.flush_scheduled:
+            self.flush()
+
+
 class DbusPeerInterfaceAsync(
     DbusInterfaceBaseAsync,
     interface_name='org.freedesktop.DBus.Peer',
@@ -86,13 +223,29 @@ class DbusPropertiesInterfaceAsync(
 
         properties: dict[str, Any] = {}
 
-        for interface_name, meta in self._dbus_iter_interfaces_meta():
-            if not meta.serving_enabled:
-                continue
-
-            dbus_properties_data = await self._properties_get_all(
-                interface_name)
+        interfaces_meta = [
+            (interface_name, meta)
+            for interface_name, meta in self._dbus_iter_interfaces_meta()
+            if meta.serving_enabled
+        ]
+        # Send all GetAll calls at once instead of waiting
+        # for each reply before calling the next interface.
+        get_all_tasks = [
+            ensure_future(self._properties_get_all(interface_name))
+            for interface_name, _ in interfaces_meta
+        ]
+        try:
+            interfaces_properties_data = await gather(*get_all_tasks)
+        except BaseException:
+            # Do not leave the other calls running if one failed
+            for get_all_task in get_all_tasks:
+                get_all_task.cancel()
+            raise
 
+        for (_, meta), dbus_properties_data in zip(
+            interfaces_meta,
+            interfaces_properties_data,
+        ):
             properties.update(
                 _parse_properties_vardict(
                     meta.dbus_member_to_python_attr,
@@ -103,6 +256,158 @@ class DbusPropertiesInterfaceAsync(
 
         return properties
 
+    async def properties_changed_coalesced(
+            self,
+            on_unknown_member: Literal['error', 'ignore', 'reuse'] = 'error',
+    ) -> AsyncIterator[dict[str, Any]]:
+        accumulator = _PropertiesChangedAccumulator(
+            interface_name
+            for interface_name, meta in self._dbus_iter_interfaces_meta()
+            if meta.serving_enabled
+        )
+        properties_changed_signal = self.properties_changed
+
+        if isinstance(properties_changed_signal, DbusProxySignalAsync):
+            message_queue: Queue[SdBusMessage] = Queue()
+
+            match_slot = await properties_changed_signal._register_match_slot(
+                properties_changed_signal.proxy_meta.attached_bus,
+                message_queue.put_nowait,
+            )
+
+            with closing(match_slot):
+                while True:
+                    accumulator.merge_message(await message_queue.get())
+                    while not message_queue.empty():
+                        accumulator.merge_message(message_queue.get_nowait())
+
+                    delta = accumulator.pop_delta(self, on_unknown_member)
+                    if delta:
+                        yield delta
+        else:
+            data_queue: Queue[DBUS_PROPERTIES_CHANGED_TYPING] = Queue()
+
+            signal_callbacks = cast(
+                'DbusLocalSignalAsync[DBUS_PROPERTIES_CHANGED_TYPING]',
+                properties_changed_signal,
+            ).local_callbacks
+            try:
+                put_method = data_queue.put_nowait
+                signal_callbacks.add(put_method)
+                while True:
+                    accumulator.merge(await data_queue.get())
+                    while not data_queue.empty():
+                        accumulator.merge(data_queue.get_nowait())
+
+                    delta = accumulator.pop_delta(self, on_unknown_member)
+                    if delta:
+                        yield delta
+            finally:
+                signal_callbacks.remove(put_method)
+
+    def properties_batch(
+            self,
+            auto_flush: bool = False,
+    ) -> DbusPropertiesChangedBatch:
+        dbus_meta = self._dbus
+        if not isinstance(dbus_meta, DbusLocalObjectMeta):
+            raise RuntimeError(
+                "Cannot batch properties changes of D-Bus proxies.")
+
+        properties_batch = dbus_meta.properties_batch
+        if properties_batch is None:
+            properties_batch = DbusPropertiesChangedBatch(self, dbus_meta)
+
+        if auto_flush:
+            dbus_meta.properties_batch = properties_batch
+            properties_batch.schedule_flush()
+
+        return properties_batch
+
+    async def properties_cache_enable(
+            self,
+            time_to_live: Optional[float] = None,
+    ) -> None:
+        dbus_meta = self._dbus
+        if not isinstance(dbus_meta, DbusRemoteObjectMeta):
+            raise RuntimeError("Cannot cache properties of local objects.")
+
+        if dbus_meta.property_cache is not None:
+            dbus_meta.property_cache.close()
+            dbus_meta.property_cache = None
+
+        interfaces_meta = [
+            (interface_name, meta)
+            for interface_name, meta in self._dbus_iter_interfaces_meta()
+            if meta.serving_enabled
+        ]
+        property_cache = DbusPropertyCache(
+            _collect_properties_flags(type(self), interfaces_meta),
+            time_to_live,
+            is_updated_by_signals=True,
+        )
+
+        def update_cache(message: SdBusMessage) -> None:
+            property_cache.update_from_properties_changed(
+                cast('DBUS_PROPERTIES_CHANGED_TYPING', message.get_contents())
+            )
+
+        def clear_cache(message: SdBusMessage) -> None:
+            property_cache.clear()
+
+        properties_changed_signal = cast(
+            'DbusProxySignalAsync[Any]', self.properties_changed)
+        try:
+            # Subscribe before seeding so that no change can be missed
+            # between GetAll reply and the match being installed.
+            property_cache.match_slots.append(
+                await properties_changed_signal._register_match_slot(
+                    dbus_meta.attached_bus,
+                    update_cache,
+                )
+            )
+            # Restarted service might have different values
+            # even for the const properties.
+            property_cache.match_slots.append(
+                await dbus_meta.attached_bus.add_match_async(
+                    "type='signal',"
+                    "sender='org.freedesktop.DBus',"
+                    "path='/org/freedesktop/DBus',"
+                    "interface='org.freedesktop.DBus',"
+                    "member='NameOwnerChanged',"
+                    f"arg0='{dbus_meta.service_name}'",
+                    clear_cache,
+                )
+            )
+
+            interfaces_properties_data = await gather(
+                *(
+                    self._properties_get_all(interface_name)
+                    for interface_name, _ in interfaces_meta
+                )
+            )
+            for (interface_name, _), dbus_properties_data in zip(
+                interfaces_meta,
+                interfaces_properties_data,
+            ):
+                for member_name, variant in dbus_properties_data.items():
+                    property_cache.store(
+                        interface_name, member_name, variant[1])
+        except BaseException:
+            property_cache.close()
+            raise
+
+        dbus_meta.property_cache = property_cache
+
+    def properties_cache_disable(self) -> None:
+        dbus_meta = self._dbus
+        if not isinstance(dbus_meta, DbusRemoteObjectMeta):
+            return
+
+        if dbus_meta.property_cache is not None:
+            dbus_meta.property_cache.close()
+            dbus_meta.property_cache = None
+
 
 class DbusInterfaceCommonAsync(
         DbusPropertiesInterfaceAsync,
@@ -19,14 +19,17 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
-from asyncio import get_running_loop
+import sys
+from asyncio import Task, get_running_loop
 from contextvars import ContextVar, copy_context
 from inspect import iscoroutinefunction
+from time import monotonic
 from types import FunctionType
 from typing import TYPE_CHECKING, cast, overload
 from weakref import ref as weak_ref
 
 from .dbus_common_elements import (
+    BUS_TO_CALL_LIMITER,
     DbusBoundAsync,
     DbusLocalObjectMeta,
     DbusMemberAsync,
@@ -34,17 +37,51 @@ from .dbus_common_elements import (
     DbusMethodOverride,
     DbusRemoteObjectMeta,
 )
-from .dbus_exceptions import DbusFailedError
+from .dbus_exceptions import (
+    DbusFailedError,
+    DbusLimitsExceededError,
+    DbusTimeoutError,
+    DbusUnknownObjectError,
+)
 from .sd_bus_internals import EXCEPTION_TO_DBUS_ERROR, DbusNoReplyFlag
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Coroutine, Generator, Sequence
+    from contextvars import Context
     from typing import Any, Optional, TypeVar, Union
 
+    from .dbus_common_elements import DbusCallAdmission
     from .dbus_proxy_async_interface_base import DbusInterfaceBaseAsync
     from .sd_bus_internals import SdBusMessage
 
+    if sys.version_info >= (3, 10):
+        from typing import ParamSpec, Protocol
+    else:
+        from typing_extensions import ParamSpec, Protocol
+
     T = TypeVar('T')
+    P = ParamSpec('P')
+    R = TypeVar('R')
+    CoroutineFunctionT = TypeVar(
+        'CoroutineFunctionT',
+        bound='Callable[..., Coroutine[Any, Any, Any]]',
+    )
+
+    class DbusMethodAsyncDecorator(Protocol):
+        # Regular function handlers are awaitable when called on proxy
+        @overload
+        def __call__(
+            self,
+            original_method: CoroutineFunctionT,
+        ) -> CoroutineFunctionT:
+            ...
+
+        @overload
+        def __call__(
+            self,
+            original_method: Callable[P, R],
+        ) -> Callable[P, Coroutine[Any, Any, R]]:
+            ...
 else:
     T = None
 
@@ -55,8 +92,113 @@ def get_current_message() -> SdBusMessage:
     return CURRENT_MESSAGE.get()
 
 
+def _message_received_at(message: SdBusMessage) -> float:
+    # Receive timestamp is only present if the timestamps were
+    # enabled on the bus. Otherwise the time the message was
+    # dispatched to the object is used.
+    monotonic_usec = message.monotonic_usec
+    if monotonic_usec is None:
+        return monotonic()
+
+    return monotonic_usec / 1_000_000
+
+
+class _EagerContinuation:
+    # Resumes a coroutine that was already stepped outside of a task.
+    __slots__ = ('coroutine', 'yielded', 'context')
+
+    def __init__(
+        self,
+        coroutine: Coroutine[Any, Any, None],
+        yielded: Any,
+        context: Context,
+    ):
+        self.coroutine = coroutine
+        self.yielded = yielded
+        self.context = context
+
+    def __await__(self) -> Generator[Any, Any, None]:
+        coroutine = self.coroutine
+        yielded = self.yielded
+        while True:
+            try:
+                sent_value = yield yielded
+            except GeneratorExit:
+                coroutine.close()
+                raise
+            except BaseException as exc:
+                try:
+                    yielded = self.context.run(coroutine.throw, exc)
+                except StopIteration:
+                    return
+            else:
+                try:
+                    yielded = self.context.run(coroutine.send, sent_value)
+                except StopIteration:
+                    return
+
+
+async def _await_eager_continuation(continuation: _EagerContinuation) -> None:
+    await continuation
+
+
+if sys.version_info >= (3, 12):
+    def _start_eager(
+        coroutine: Coroutine[Any, Any, None],
+    ) -> Optional[Task[None]]:
+        eager_task = Task(coroutine, loop=get_running_loop(), eager_start=True)
+        if eager_task.done():
+            return None
+
+        return eager_task
+else:
+    def _start_eager(
+        coroutine: Coroutine[Any, Any, None],
+    ) -> Optional[Task[None]]:
+        # Backport of eager task start: run the coroutine until
+        # the first suspension and only then create a task.
+        call_context = copy_context()
+        try:
+            yielded = call_context.run(coroutine.send, None)
+        except StopIteration:
+            return None
+
+        return get_running_loop().create_task(
+            _await_eager_continuation(
+                _EagerContinuation(coroutine, yielded, call_context)
+            )
+        )
+
+
 class DbusMethodAsync(DbusMethodCommon, DbusMemberAsync):
 
+    def __init__(
+            self,
+            original_method: FunctionType,
+            method_name: Optional[str],
+            input_signature: str,
+            input_args_names: Optional[Sequence[str]],
+            result_signature: str,
+            result_args_names: Optional[Sequence[str]],
+            flags: int,
+            run_in_executor: bool = False,
+            max_queue_time: Optional[float] = None,
+            drop_on_queue_timeout: bool = False,
+    ):
+        super().__init__(
+            original_method=original_method,
+            method_name=method_name,
+            input_signature=input_signature,
+            input_args_names=input_args_names,
+            result_signature=result_signature,
+            result_args_names=result_args_names,
+            flags=flags,
+        )
+        self.run_in_executor = run_in_executor
+        self.is_handler_coroutine = iscoroutinefunction(original_method)
+        self.max_queue_time = max_queue_time
+        self.drop_on_queue_timeout = drop_on_queue_timeout
+
     @overload
     def __get__(
         self,
@@ -81,20 +223,40 @@ class DbusMethodAsync(DbusMethodCommon, DbusMemberAsync):
         if obj is not None:
             dbus_meta = obj._dbus
             if isinstance(dbus_meta, DbusRemoteObjectMeta):
-                return DbusProxyMethodAsync(self, dbus_meta)
+                bound_members = obj._dbus_bound_members
+                proxy_method = bound_members.get(self)
+                if proxy_method is None:
+                    proxy_method = DbusProxyMethodAsync(self, dbus_meta)
+                    bound_members[self] = proxy_method
+
+                return cast(DbusProxyMethodAsync, proxy_method)
             else:
                 return DbusLocalMethodAsync(self, obj)
         else:
             return self
 
+    def _dbus_reply_call_shared(
+        self,
+        local_object: DbusInterfaceBaseAsync,
+        request_message: SdBusMessage,
+    ) -> None:
+        DbusLocalMethodAsync(self, local_object)._dbus_reply_call(
+            request_message)
+
 
 class DbusBoundMethodAsyncBase(DbusBoundAsync):
+    __slots__ = ()
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         raise NotImplementedError
 
+    def no_reply(self, *args: Any, **kwargs: Any) -> None:
+        raise NotImplementedError
+
 
 class DbusProxyMethodAsync(DbusBoundMethodAsyncBase):
+    __slots__ = ('dbus_method', 'proxy_meta')
+
     def __init__(
         self,
         dbus_method: DbusMethodAsync,
@@ -103,21 +265,60 @@ class DbusProxyMethodAsync(DbusBoundMethodAsyncBase):
         self.dbus_method = dbus_method
         self.proxy_meta = proxy_meta
 
-        self.__doc__ = dbus_method.__doc__
+    @property
+    def __doc__(self) -> Optional[str]:  # type: ignore[override]
+        return self.dbus_method.__doc__
 
-    async def _dbus_async_call(self, call_message: SdBusMessage) -> Any:
+    async def _dbus_async_call(self, rebuilt_args: tuple[Any, ...]) -> Any:
         bus = self.proxy_meta.attached_bus
-        reply_message = await bus.call_async(call_message)
-        return reply_message.get_contents()
+        dbus_method = self.dbus_method
+        # Message is built, sent and reply decoded by the bus.
+        call_limiter = BUS_TO_CALL_LIMITER.get(bus)
+        if call_limiter is None:
+            return await bus.call_method_async(
+                self.proxy_meta.service_name,
+                self.proxy_meta.object_path,
+                dbus_method.interface_name,
+                dbus_method.method_name,
+                dbus_method.input_signature,
+                rebuilt_args,
+            )
+
+        return await call_limiter.call(
+            self.proxy_meta.service_name,
+            bus.call_method_async,
+            self.proxy_meta.service_name,
+            self.proxy_meta.object_path,
+            dbus_method.interface_name,
+            dbus_method.method_name,
+            dbus_method.input_signature,
+            rebuilt_args,
+        )
 
     @staticmethod
     async def _no_reply() -> None:
         return None
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        bus = self.proxy_meta.attached_bus
         dbus_method = self.dbus_method
 
+        if len(args) == dbus_method.num_of_args:
+            assert not kwargs, (
+                "Passed more arguments than method supports"
+                f"Extra args: {kwargs}")
+            rebuilt_args: tuple[Any, ...] = args
+        else:
+            rebuilt_args = dbus_method._bind_args(*args, **kwargs)
+
+        if not dbus_method.flags & DbusNoReplyFlag:
+            return self._dbus_async_call(rebuilt_args)
+
+        self._send_no_reply(rebuilt_args)
+        return self._no_reply()
+
+    def _send_no_reply(self, rebuilt_args: tuple[Any, ...]) -> None:
+        dbus_method = self.dbus_method
+        bus = self.proxy_meta.attached_bus
         new_call_message = bus.new_method_call_message(
             self.proxy_meta.service_name,
             self.proxy_meta.object_path,
@@ -125,27 +326,16 @@ class DbusProxyMethodAsync(DbusBoundMethodAsyncBase):
             dbus_method.method_name,
         )
 
-        if len(args) == dbus_method.num_of_args:
-            assert not kwargs, (
-                "Passed more arguments than method supports"
-                f"Extra args: {kwargs}")
-            rebuilt_args: Sequence[Any] = args
-        else:
-            rebuilt_args = dbus_method._rebuild_args(
-                dbus_method.original_method,
-                *args,
-                **kwargs)
-
         if rebuilt_args:
             new_call_message.append_data(
                 dbus_method.input_signature, *rebuilt_args)
 
-        if dbus_method.flags & DbusNoReplyFlag:
-            new_call_message.expect_reply = False
-            new_call_message.send()
-            return self._no_reply()
+        new_call_message.expect_reply = False
+        new_call_message.send()
 
-        return self._dbus_async_call(new_call_message)
+    def no_reply(self, *args: Any, **kwargs: Any) -> None:
+        """Send the method call without waiting for reply."""
+        self._send_no_reply(self.dbus_method._bind_args(*args, **kwargs))
 
 
 class DbusLocalMethodAsync(DbusBoundMethodAsyncBase):
@@ -177,8 +367,35 @@ class DbusLocalMethodAsync(DbusBoundMethodAsyncBase):
 
         CURRENT_MESSAGE.set(request_message)
 
+        if self.dbus_method.run_in_executor:
+            return await get_running_loop().run_in_executor(
+                None,
+                copy_context().run,
+                local_method,
+                *request_message.parse_to_tuple(),
+            )
+
         return await local_method(*request_message.parse_to_tuple())
 
+    def _dbus_reply_call_sync(
+        self,
+        local_object: DbusInterfaceBaseAsync,
+        request_message: SdBusMessage
+    ) -> None:
+        message_token = CURRENT_MESSAGE.set(request_message)
+        try:
+            reply_data = self.dbus_method.original_method(
+                local_object,
+                *request_message.parse_to_tuple(),
+            )
+        except Exception as e:
+            self._dbus_reply_send_error(request_message, e)
+            return
+        finally:
+            CURRENT_MESSAGE.reset(message_token)
+
+        self._dbus_reply_send(request_message, reply_data)
+
     def _dbus_reply_call(
         self,
         request_message: SdBusMessage
@@ -190,59 +407,161 @@ class DbusLocalMethodAsync(DbusBoundMethodAsyncBase):
         if not isinstance(local_meta, DbusLocalObjectMeta):
             raise RuntimeError("D-Bus object is a remote proxy!")
 
-        loop = get_running_loop()
-        reply_task = loop.create_task(
+        dbus_method = self.dbus_method
+        received_at: Optional[float] = None
+        if dbus_method.max_queue_time is not None:
+            received_at = _message_received_at(request_message)
+            if self._dbus_reply_is_too_late(request_message, received_at):
+                return
+
+        if not (dbus_method.is_handler_coroutine
+                or dbus_method.run_in_executor):
+            self._dbus_reply_call_sync(local_object, request_message)
+            return
+
+        call_admission = local_meta.call_admission
+        if call_admission is None:
+            self._dbus_reply_start_task(
+                local_meta, local_object, request_message)
+            return
+
+        sender = request_message.sender or ''
+
+        def start_admitted_call() -> None:
+            if received_at is not None and self._dbus_reply_is_too_late(
+                request_message, received_at,
+            ):
+                call_admission.release(dbus_method, sender)
+                return
+
+            self._dbus_reply_start_task(
+                local_meta, local_object, request_message,
+                call_admission, sender,
+            )
+
+        def reject_queued_call() -> None:
+            self._dbus_reply_send_error(
+                request_message,
+                DbusUnknownObjectError("Object is no longer exported"),
+            )
+
+        if not call_admission.admit(
+            dbus_method, sender, start_admitted_call, reject_queued_call,
+        ):
+            self._dbus_reply_send_error(
+                request_message,
+                DbusLimitsExceededError(
+                    f"Too many calls of {dbus_method.method_name}"),
+            )
+
+    def _dbus_reply_is_too_late(
+        self,
+        request_message: SdBusMessage,
+        received_at: float,
+    ) -> bool:
+        dbus_method = self.dbus_method
+        max_queue_time = dbus_method.max_queue_time
+        assert max_queue_time is not None
+        queue_time = monotonic() - received_at
+        if queue_time <= max_queue_time:
+            return False
+
+        if not dbus_method.drop_on_queue_timeout:
+            self._dbus_reply_send_error(
+                request_message,
+                DbusTimeoutError(
+                    f"Call waited {queue_time:.3f} seconds to be processed"),
+            )
+
+        return True
+
+    def _dbus_reply_start_task(
+        self,
+        local_meta: DbusLocalObjectMeta,
+        local_object: DbusInterfaceBaseAsync,
+        request_message: SdBusMessage,
+        call_admission: Optional[DbusCallAdmission] = None,
+        sender: str = '',
+    ) -> None:
+        # Handler runs until the first suspension right away,
+        # handlers that never suspend reply without creating a task.
+        reply_task = _start_eager(
             self._dbus_reply_call_async(local_object, request_message)
         )
+        if reply_task is None:
+            if call_admission is not None:
+                call_admission.release(self.dbus_method, sender)
+            return
+
         tasks_set = local_meta.tasks
         tasks_set.add(reply_task)
         reply_task.add_done_callback(tasks_set.discard)
+        if call_admission is not None:
+            reply_task.add_done_callback(
+                lambda _: call_admission.release(self.dbus_method, sender)
+            )
 
     async def _dbus_reply_call_async(
         self,
         local_object: DbusInterfaceBaseAsync,
         request_message: SdBusMessage
     ) -> None:
-        call_context = copy_context()
         try:
-            reply_data = await call_context.run(
-                self._dbus_reply_call_method,
+            reply_data = await self._dbus_reply_call_method(
                 request_message,
                 local_object,
             )
         except Exception as e:
-            if not request_message.expect_reply:
-                return
+            self._dbus_reply_send_error(request_message, e)
+            return
 
-            dbus_error = EXCEPTION_TO_DBUS_ERROR.get(type(e))
-            if dbus_error is None:
-                dbus_error = DbusFailedError.dbus_error_name
+        self._dbus_reply_send(request_message, reply_data)
 
-            error_message = request_message.create_error_reply(
-                dbus_error,
-                str(e.args[0]) if e.args else "",
-            )
-            error_message.send()
+    @staticmethod
+    def _dbus_reply_send_error(
+        request_message: SdBusMessage,
+        exc: Exception,
+    ) -> None:
+        if not request_message.expect_reply:
             return
 
+        dbus_error = EXCEPTION_TO_DBUS_ERROR.get(type(exc))
+        if dbus_error is None:
+            dbus_error = DbusFailedError.dbus_error_name
+
+        error_message = request_message.create_error_reply(
+            dbus_error,
+            str(exc.args[0]) if exc.args else "",
+        )
+        error_message.send()
+
+    def _dbus_reply_send(
+        self,
+        request_message: SdBusMessage,
+        reply_data: Any,
+    ) -> None:
         if not request_message.expect_reply:
             return
 
         reply_message = request_message.create_reply()
 
-        if isinstance(reply_data, tuple):
+        result_signature = self.dbus_method.result_signature
+        if self.dbus_method.result_is_multiple_values:
+            reply_message.append_data(result_signature, *reply_data)
+        elif (
+            result_signature.startswith('(')
+            and isinstance(reply_data, tuple)
+            and len(reply_data) == 1
+        ):
+            # Single struct result can also be returned
+            # wrapped in a tuple.
             try:
-                reply_message.append_data(
-                    self.dbus_method.result_signature, *reply_data)
+                reply_message.append_data(result_signature, *reply_data)
             except TypeError:
-                # In case of single struct result type
-                # We can't figure out if return is multiple values
-                # or a tuple
-                reply_message.append_data(
-                    self.dbus_method.result_signature, reply_data)
+                reply_message = request_message.create_reply()
+                reply_message.append_data(result_signature, reply_data)
         elif reply_data is not None:
-            reply_message.append_data(
-                self.dbus_method.result_signature, reply_data)
+            reply_message.append_data(result_signature, reply_data)
 
         reply_message.send()
 
@@ -254,7 +573,10 @@ def dbus_method_async(
     result_args_names: Optional[Sequence[str]] = None,
     input_args_names: Optional[Sequence[str]] = None,
     method_name: Optional[str] = None,
-) -> Callable[[T], T]:
+    run_in_executor: bool = False,
+    max_queue_time: Optional[float] = None,
+    drop_on_queue_timeout: bool = False,
+) -> DbusMethodAsyncDecorator:
 
     assert not isinstance(input_signature, FunctionType), (
         "Passed function to decorator directly. "
@@ -263,9 +585,11 @@ def dbus_method_async(
 
     def dbus_method_decorator(original_method: T) -> T:
         assert isinstance(original_method, FunctionType)
-        assert iscoroutinefunction(original_method), (
-            "Expected coroutine function. ",
-            "Maybe you forgot 'async' keyword?",
+        assert not (
+            run_in_executor and iscoroutinefunction(original_method)
+        ), (
+            "Only regular functions can be run in executor. ",
+            "Maybe you wanted to remove 'async' keyword?",
         )
         new_wrapper = DbusMethodAsync(
             original_method=original_method,
@@ -275,11 +599,14 @@ def dbus_method_async(
             result_args_names=result_args_names,
             input_args_names=input_args_names,
             flags=flags,
+            run_in_executor=run_in_executor,
+            max_queue_time=max_queue_time,
+            drop_on_queue_timeout=drop_on_queue_timeout,
         )
 
         return cast(T, new_wrapper)
 
-    return dbus_method_decorator
+    return cast('DbusMethodAsyncDecorator', dbus_method_decorator)
 
 
 def dbus_method_async_override() -> Callable[[T], T]:
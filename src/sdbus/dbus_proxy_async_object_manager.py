@@ -19,6 +19,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
+from asyncio import get_running_loop, sleep
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -29,14 +30,28 @@ from .dbus_proxy_async_interface_base import (
 )
 from .dbus_proxy_async_interfaces import DbusInterfaceCommonAsync
 from .dbus_proxy_async_method import dbus_method_async
+from .dbus_proxy_async_property import DbusPropertyAsync
 from .dbus_proxy_async_signal import dbus_signal_async
 from .default_bus import get_default_bus
+from .sd_bus_internals import DbusHiddenFlag, DbusPropertyExplicitFlag
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Any, Optional
 
-    from .sd_bus_internals import SdBus, SdBusSlot
+    from .dbus_proxy_async_interfaces import DBUS_PROPERTIES_CHANGED_TYPING
+    from .sd_bus_internals import SdBus, SdBusMessage, SdBusSlot
+
+    DBUS_MANAGED_OBJECT_INTERFACES = dict[str, dict[str, tuple[str, Any]]]
+
+
+OBJECT_MANAGER_INTERFACE_NAME = 'org.freedesktop.DBus.ObjectManager'
+# Interfaces sd-bus reports for every managed object
+STANDARD_INTERFACES_NAMES = (
+    'org.freedesktop.DBus.Peer',
+    'org.freedesktop.DBus.Introspectable',
+    'org.freedesktop.DBus.Properties',
+)
 
 
 class DbusObjectManagerExportHandle(DbusExportHandle):
@@ -53,6 +68,131 @@ class DbusObjectManagerExportHandle(DbusExportHandle):
         super().stop()
 
 
+def _collect_managed_object_interfaces(
+    managed_object: DbusInterfaceBaseAsync,
+) -> DBUS_MANAGED_OBJECT_INTERFACES:
+    interfaces: DBUS_MANAGED_OBJECT_INTERFACES = {
+        interface_name: {} for interface_name in STANDARD_INTERFACES_NAMES
+    }
+    object_class = type(managed_object)
+
+    for interface_name, meta in managed_object._dbus_iter_interfaces_meta():
+        if not meta.serving_enabled:
+            continue
+
+        properties: dict[str, tuple[str, Any]] = {}
+        for python_attr, dbus_member in (
+            meta.python_attr_to_dbus_member.items()
+        ):
+            dbus_property = getattr(object_class, python_attr)
+            if not isinstance(dbus_property, DbusPropertyAsync):
+                continue
+
+            if dbus_property.flags & (
+                DbusPropertyExplicitFlag | DbusHiddenFlag
+            ):
+                continue
+
+            properties[dbus_member] = (
+                dbus_property.property_signature,
+                dbus_property.property_getter(managed_object),
+            )
+
+        interfaces[interface_name] = properties
+
+    return interfaces
+
+
+class DbusManagedObjectsSnapshot:
+    def __init__(self, bus: SdBus, object_manager_path: str) -> None:
+        self.bus = bus
+        self.object_manager_path = object_manager_path
+        self.path_to_interfaces: dict[
+            str, DBUS_MANAGED_OBJECT_INTERFACES] = {}
+        self._path_to_observer: dict[
+            str, Callable[[DBUS_PROPERTIES_CHANGED_TYPING], None]] = {}
+        self._serialized: Optional[SdBusMessage] = None
+
+    def add_object(
+        self,
+        object_path: str,
+        managed_object: DbusInterfaceBaseAsync,
+    ) -> None:
+        self.path_to_interfaces[object_path] = (
+            _collect_managed_object_interfaces(managed_object)
+        )
+        self._serialized = None
+
+        local_meta = managed_object._dbus
+        if isinstance(local_meta, DbusLocalObjectMeta):
+            # Object can be managed by several object managers
+            observer = partial(
+                self._update_properties, object_path, managed_object,
+            )
+            local_meta.properties_changed_observers.append(observer)
+            self._path_to_observer[object_path] = observer
+
+    def remove_object(
+        self,
+        object_path: str,
+        managed_object: DbusInterfaceBaseAsync,
+    ) -> None:
+        self.path_to_interfaces.pop(object_path, None)
+        self._serialized = None
+
+        observer = self._path_to_observer.pop(object_path, None)
+        local_meta = managed_object._dbus
+        if observer is not None and isinstance(
+            local_meta, DbusLocalObjectMeta
+        ):
+            local_meta.properties_changed_observers.remove(observer)
+
+    def _update_properties(
+        self,
+        object_path: str,
+        managed_object: DbusInterfaceBaseAsync,
+        properties_changed_data: DBUS_PROPERTIES_CHANGED_TYPING,
+    ) -> None:
+        interface_name, changed_properties, invalidated_properties = (
+            properties_changed_data
+        )
+        interfaces = self.path_to_interfaces.get(object_path)
+        if interfaces is None:
+            return
+
+        properties = interfaces.get(interface_name)
+        if properties is None:
+            return
+
+        if invalidated_properties:
+            # Invalidated values are not part of the signal
+            self.path_to_interfaces[object_path] = (
+                _collect_managed_object_interfaces(managed_object)
+            )
+        else:
+            properties.update(changed_properties)
+
+        self._serialized = None
+
+    def reply_get_managed_objects(self, message: SdBusMessage) -> None:
+        if not message.expect_reply:
+            return
+
+        serialized = self._serialized
+        if serialized is None:
+            # Reply is never sent and only holds the body
+            # that is copied to the replies of the next calls.
+            serialized = message.create_reply()
+            serialized.append_data(
+                'a{oa{sa{sv}}}', self.path_to_interfaces)
+            serialized.seal()
+            self._serialized = serialized
+
+        reply_message = message.create_reply()
+        reply_message.append_contents_from(serialized)
+        reply_message.send()
+
+
 class DbusObjectManagerInterfaceAsync(
     DbusInterfaceCommonAsync,
     interface_name='org.freedesktop.DBus.ObjectManager',
@@ -62,6 +202,8 @@ class DbusObjectManagerInterfaceAsync(
         super().__init__()
         self._object_manager_slot: Optional[SdBusSlot] = None
         self._managed_object_to_path: dict[DbusInterfaceBaseAsync, str] = {}
+        self._managed_objects_snapshot: Optional[
+            DbusManagedObjectsSnapshot] = None
 
     @dbus_method_async(result_signature='a{oa{sa{sv}}}')
     async def get_managed_objects(
@@ -83,6 +225,7 @@ class DbusObjectManagerInterfaceAsync(
         self,
         object_path: str,
         bus: Optional[SdBus] = None,
+        managed_objects_snapshot: bool = False,
     ) -> DbusExportHandle:
         if bus is None:
             bus = get_default_bus()
@@ -94,6 +237,27 @@ class DbusObjectManagerInterfaceAsync(
         slot = bus.add_object_manager(object_path)
         self._object_manager_slot = slot
         export_handle._dbus_slots.append(slot)
+
+        if managed_objects_snapshot:
+            snapshot = DbusManagedObjectsSnapshot(bus, object_path)
+            for managed_object, managed_path in (
+                self._managed_object_to_path.items()
+            ):
+                snapshot.add_object(managed_path, managed_object)
+
+            # GetManagedObjects is answered before sd-bus walks
+            # the objects and calls every property getter.
+            # Calls without the interface field are matched too.
+            export_handle._dbus_slots.append(
+                bus.add_method_call_filter(
+                    object_path,
+                    OBJECT_MANAGER_INTERFACE_NAME,
+                    'GetManagedObjects',
+                    snapshot.reply_get_managed_objects,
+                )
+            )
+            self._managed_objects_snapshot = snapshot
+
         return export_handle
 
     def export_with_manager(
@@ -120,10 +284,112 @@ class DbusObjectManagerInterfaceAsync(
             partial(self.remove_managed_object, object_to_export),
         )
         bus.emit_object_added(object_path)
-        self._managed_object_to_path[object_to_export] = object_path
+        self._add_managed_object(object_path, object_to_export)
+
+        return handle
+
+    def export_many_with_manager(
+        self,
+        objects_to_export: Iterable[tuple[str, DbusInterfaceBaseAsync]],
+        bus: Optional[SdBus] = None,
+        batch_size: int = 100,
+        batch_interval: float = 0.0,
+    ) -> DbusObjectManagerExportHandle:
+        if self._object_manager_slot is None:
+            raise RuntimeError('ObjectManager not intitialized')
+
+        if bus is None:
+            bus = get_default_bus()
+
+        if batch_size < 1:
+            raise ValueError('Batch size should be positive')
+
+        # Register every vtable first so that the objects
+        # are already callable once clients see them being added.
+        exported_objects: list[tuple[str, DbusInterfaceBaseAsync]] = []
+        export_handles: list[DbusExportHandle] = []
+        try:
+            for object_path, object_to_export in objects_to_export:
+                export_handles.append(
+                    object_to_export.export_to_dbus(object_path, bus)
+                )
+                exported_objects.append((object_path, object_to_export))
+        except Exception:
+            for export_handle in export_handles:
+                export_handle.stop()
+            raise
+
+        bulk_meta = DbusLocalObjectMeta()
+        handle = DbusObjectManagerExportHandle(
+            bulk_meta,
+            partial(
+                self._stop_many_managed_objects,
+                exported_objects,
+                export_handles,
+            ),
+        )
+
+        self._emit_objects_added(bus, exported_objects[:batch_size])
+        if len(exported_objects) > batch_size:
+            emit_task = get_running_loop().create_task(
+                self._emit_objects_added_batched(
+                    bus, exported_objects, batch_size, batch_interval,
+                )
+            )
+            bulk_meta.tasks.add(emit_task)
+            emit_task.add_done_callback(bulk_meta.tasks.discard)
 
         return handle
 
+    def _emit_objects_added(
+        self,
+        bus: SdBus,
+        objects_to_add: Sequence[tuple[str, DbusInterfaceBaseAsync]],
+    ) -> None:
+        for object_path, added_object in objects_to_add:
+            bus.emit_object_added(object_path)
+            self._add_managed_object(object_path, added_object)
+
+    def _add_managed_object(
+        self,
+        object_path: str,
+        managed_object: DbusInterfaceBaseAsync,
+    ) -> None:
+        self._managed_object_to_path[managed_object] = object_path
+
+        snapshot = self._managed_objects_snapshot
+        if snapshot is not None:
+            snapshot.add_object(object_path, managed_object)
+
+    async def _emit_objects_added_batched(
+        self,
+        bus: SdBus,
+        objects_to_add: Sequence[tuple[str, DbusInterfaceBaseAsync]],
+        batch_size: int,
+        batch_interval: float,
+    ) -> None:
+        # First batch is emitted right away by the caller
+        for batch_start in range(
+            batch_size, len(objects_to_add), batch_size
+        ):
+            # Let the loop process other events between batches
+            await sleep(batch_interval)
+            self._emit_objects_added(
+                bus,
+                objects_to_add[batch_start:batch_start + batch_size],
+            )
+
+    def _stop_many_managed_objects(
+        self,
+        exported_objects: Sequence[tuple[str, DbusInterfaceBaseAsync]],
+        export_handles: Sequence[DbusExportHandle],
+    ) -> None:
+        self.remove_managed_objects(
+            managed_object for _, managed_object in exported_objects
+        )
+        for export_handle in export_handles:
+            export_handle.stop()
+
     def remove_managed_object(
             self,
             managed_object: DbusInterfaceBaseAsync) -> None:
@@ -132,3 +398,26 @@ class DbusObjectManagerInterfaceAsync(
 
         removed_path = self._managed_object_to_path.pop(managed_object)
         self._dbus.attached_bus.emit_object_removed(removed_path)
+
+        snapshot = self._managed_objects_snapshot
+        if snapshot is not None:
+            snapshot.remove_object(removed_path, managed_object)
+
+    def remove_managed_objects(
+            self,
+            managed_objects: Iterable[DbusInterfaceBaseAsync]) -> None:
+        attached_bus = self._dbus.attached_bus
+        if attached_bus is None:
+            raise RuntimeError('Object manager not exported')
+
+        managed_object_to_path = self._managed_object_to_path
+        snapshot = self._managed_objects_snapshot
+        for managed_object in managed_objects:
+            # Objects which addition was not emitted yet are skipped
+            removed_path = managed_object_to_path.pop(managed_object, None)
+            if removed_path is None:
+                continue
+
+            attached_bus.emit_object_removed(removed_path)
+            if snapshot is not None:
+                snapshot.remove_object(removed_path, managed_object)
@@ -26,7 +26,9 @@ from typing import TYPE_CHECKING, Generic, TypeVar, cast, overload
 from weakref import ref as weak_ref
 
 from .dbus_common_elements import (
+    BUS_TO_CALL_LIMITER,
     DbusBoundAsync,
+    DbusLocalObjectMeta,
     DbusMemberAsync,
     DbusPropertyCommon,
     DbusPropertyOverride,
@@ -97,12 +99,32 @@ class DbusPropertyAsync(DbusMemberAsync, DbusPropertyCommon, Generic[T]):
         if obj is not None:
             dbus_meta = obj._dbus
             if isinstance(dbus_meta, DbusRemoteObjectMeta):
-                return DbusProxyPropertyAsync(self, dbus_meta)
+                bound_members = obj._dbus_bound_members
+                proxy_property = bound_members.get(self)
+                if proxy_property is None:
+                    proxy_property = DbusProxyPropertyAsync(self, dbus_meta)
+                    bound_members[self] = proxy_property
+
+                return cast(DbusProxyPropertyAsync[T], proxy_property)
             else:
                 return DbusLocalPropertyAsync(self, obj)
         else:
             return self
 
+    def _dbus_reply_get_shared(
+        self,
+        local_object: DbusInterfaceBaseAsync,
+        message: SdBusMessage,
+    ) -> None:
+        DbusLocalPropertyAsync(self, local_object)._dbus_reply_get(message)
+
+    def _dbus_reply_set_shared(
+        self,
+        local_object: DbusInterfaceBaseAsync,
+        message: SdBusMessage,
+    ) -> None:
+        DbusLocalPropertyAsync(self, local_object)._dbus_reply_set(message)
+
     def setter(self,
                new_set_function: Callable[
                    [Any, T],
@@ -129,6 +151,8 @@ class DbusPropertyAsync(DbusMemberAsync, DbusPropertyCommon, Generic[T]):
 
 
 class DbusBoundPropertyAsyncBase(DbusBoundAsync, Awaitable[T]):
+    __slots__ = ()
+
     def __await__(self) -> Generator[Any, None, T]:
         return self.get_async().__await__()
 
@@ -138,8 +162,13 @@ class DbusBoundPropertyAsyncBase(DbusBoundAsync, Awaitable[T]):
     async def set_async(self, complete_object: T) -> None:
         raise NotImplementedError
 
+    def set_no_reply(self, complete_object: T) -> None:
+        raise NotImplementedError
+
 
 class DbusProxyPropertyAsync(DbusBoundPropertyAsyncBase[T]):
+    __slots__ = ('dbus_property', 'proxy_meta')
+
     def __init__(
         self,
         dbus_property: DbusPropertyAsync[T],
@@ -148,9 +177,21 @@ class DbusProxyPropertyAsync(DbusBoundPropertyAsyncBase[T]):
         self.dbus_property = dbus_property
         self.proxy_meta = proxy_meta
 
-        self.__doc__ = dbus_property.__doc__
+    @property
+    def __doc__(self) -> Optional[str]:  # type: ignore[override]
+        return self.dbus_property.__doc__
 
     async def get_async(self) -> T:
+        property_cache = self.proxy_meta.property_cache
+        if property_cache is not None:
+            try:
+                return cast(T, property_cache.lookup(
+                    self.dbus_property.interface_name,
+                    self.dbus_property.property_name,
+                ))
+            except KeyError:
+                ...
+
         bus = self.proxy_meta.attached_bus
         new_get_message = (
             bus.new_property_get_message(
@@ -160,14 +201,30 @@ class DbusProxyPropertyAsync(DbusBoundPropertyAsyncBase[T]):
                 self.dbus_property.property_name,
             )
         )
-        reply_message = await bus.call_async(new_get_message)
+        call_limiter = BUS_TO_CALL_LIMITER.get(bus)
+        if call_limiter is None:
+            reply_message = await bus.call_async(new_get_message)
+        else:
+            reply_message = await call_limiter.call(
+                self.proxy_meta.service_name,
+                bus.call_async,
+                new_get_message,
+            )
         # Get method returns variant but we only need contents of variant
-        return cast(T, reply_message.get_contents()[1])
+        property_value = reply_message.get_contents()[1]
 
-    async def set_async(self, complete_object: T) -> None:
-        bus = self.proxy_meta.attached_bus
+        if property_cache is not None:
+            property_cache.store(
+                self.dbus_property.interface_name,
+                self.dbus_property.property_name,
+                property_value,
+            )
+
+        return cast(T, property_value)
+
+    def _new_set_message(self, complete_object: T) -> SdBusMessage:
         new_set_message = (
-            bus.new_property_set_message(
+            self.proxy_meta.attached_bus.new_property_set_message(
                 self.proxy_meta.service_name,
                 self.proxy_meta.object_path,
                 self.dbus_property.interface_name,
@@ -178,7 +235,37 @@ class DbusProxyPropertyAsync(DbusBoundPropertyAsyncBase[T]):
             'v',
             (self.dbus_property.property_signature, complete_object),
         )
-        await bus.call_async(new_set_message)
+        return new_set_message
+
+    def _invalidate_cached(self) -> None:
+        property_cache = self.proxy_meta.property_cache
+        if property_cache is not None:
+            property_cache.invalidate(
+                self.dbus_property.interface_name,
+                self.dbus_property.property_name,
+            )
+
+    async def set_async(self, complete_object: T) -> None:
+        bus = self.proxy_meta.attached_bus
+        new_set_message = self._new_set_message(complete_object)
+        call_limiter = BUS_TO_CALL_LIMITER.get(bus)
+        if call_limiter is None:
+            await bus.call_async(new_set_message)
+        else:
+            await call_limiter.call(
+                self.proxy_meta.service_name,
+                bus.call_async,
+                new_set_message,
+            )
+
+        self._invalidate_cached()
+
+    def set_no_reply(self, complete_object: T) -> None:
+        """Set the property without waiting for reply."""
+        new_set_message = self._new_set_message(complete_object)
+        new_set_message.expect_reply = False
+        new_set_message.send()
+        self._invalidate_cached()
 
 
 class DbusLocalPropertyAsync(DbusBoundPropertyAsyncBase[T]):
@@ -212,6 +299,29 @@ class DbusLocalPropertyAsync(DbusBoundPropertyAsyncBase[T]):
             complete_object,
         )
 
+        self._emit_changed(local_object, complete_object)
+
+    def _emit_changed(
+        self,
+        local_object: DbusInterfaceBaseAsync,
+        new_value: Any,
+    ) -> None:
+        dbus_property = self.dbus_property
+        local_meta = local_object._dbus
+        properties_batch = (
+            local_meta.properties_batch
+            if isinstance(local_meta, DbusLocalObjectMeta)
+            else None
+        )
+        if properties_batch is not None:
+            properties_batch.add(
+                dbus_property.interface_name,
+                dbus_property.property_name,
+                dbus_property.property_signature,
+                new_value,
+            )
+            return
+
         try:
             properties_changed = getattr(
                 local_object,
@@ -222,11 +332,11 @@ class DbusLocalPropertyAsync(DbusBoundPropertyAsyncBase[T]):
         else:
             properties_changed.emit(
                 (
-                    self.dbus_property.interface_name,
+                    dbus_property.interface_name,
                     {
-                        self.dbus_property.property_name: (
-                            self.dbus_property.property_signature,
-                            complete_object,
+                        dbus_property.property_name: (
+                            dbus_property.property_signature,
+                            new_value,
                         ),
                     },
                     []
@@ -251,26 +361,7 @@ class DbusLocalPropertyAsync(DbusBoundPropertyAsyncBase[T]):
 
         self.dbus_property.property_setter(local_object, data_to_set_to)
 
-        try:
-            properties_changed = getattr(
-                local_object,
-                "properties_changed",
-            )
-        except AttributeError:
-            ...
-        else:
-            properties_changed.emit(
-                (
-                    self.dbus_property.interface_name,
-                    {
-                        self.dbus_property.property_name: (
-                            self.dbus_property.property_signature,
-                            data_to_set_to,
-                        ),
-                    },
-                    []
-                )
-            )
+        self._emit_changed(local_object, data_to_set_to)
 
 
 def dbus_property_async(
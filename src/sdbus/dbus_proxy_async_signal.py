@@ -19,9 +19,11 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
-from asyncio import Queue
+from asyncio import Queue, get_running_loop
 from collections.abc import AsyncIterable, AsyncIterator
 from contextlib import closing
+from functools import partial
+from math import inf
 from types import FunctionType
 from typing import TYPE_CHECKING, Generic, TypeVar, cast, overload
 from weakref import WeakSet
@@ -36,10 +38,12 @@ from .dbus_common_elements import (
 from .default_bus import get_default_bus
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from asyncio import TimerHandle
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Any, Optional, Union
 
     from .dbus_proxy_async_interface_base import DbusInterfaceBaseAsync
+    from .dbus_proxy_async_interfaces import DBUS_PROPERTIES_CHANGED_TYPING
     from .sd_bus_internals import SdBus, SdBusMessage, SdBusSlot
 
 
@@ -54,7 +58,8 @@ class DbusSignalAsync(DbusMemberAsync, DbusSignalCommon, Generic[T]):
         signal_signature: str,
         args_names: Sequence[str],
         flags: int,
-        original_method: FunctionType
+        original_method: FunctionType,
+        max_emit_rate: Optional[float] = None,
     ):
         super().__init__(
             signal_name,
@@ -64,7 +69,16 @@ class DbusSignalAsync(DbusMemberAsync, DbusSignalCommon, Generic[T]):
             original_method,
         )
 
-        self.local_callbacks: WeakSet[Callable[[T], Any]] = WeakSet()
+        if max_emit_rate is not None and max_emit_rate <= 0:
+            raise ValueError("Signal max emit rate must be positive")
+
+        self.min_emit_interval: Optional[float] = (
+            1 / max_emit_rate if max_emit_rate is not None else None
+        )
+        # Throttles of the broadcasts are per connection
+        self._broadcast_throttles: dict[
+            SdBus, DbusSignalThrottle[dict[str, T]]] = {}
+        self._is_args_unpacked = not signal_signature.startswith('(')
 
     @overload
     def __get__(
@@ -90,12 +104,100 @@ class DbusSignalAsync(DbusMemberAsync, DbusSignalCommon, Generic[T]):
         if obj is not None:
             dbus_meta = obj._dbus
             if isinstance(dbus_meta, DbusRemoteObjectMeta):
-                return DbusProxySignalAsync(self, dbus_meta)
+                bound_members = obj._dbus_bound_members
+                proxy_signal = bound_members.get(self)
+                if proxy_signal is None:
+                    proxy_signal = DbusProxySignalAsync(self, dbus_meta)
+                    bound_members[self] = proxy_signal
+
+                return cast(DbusProxySignalAsync[T], proxy_signal)
             else:
                 return DbusLocalSignalAsync(self, dbus_meta)
         else:
             return self
 
+    def _append_signal_data(
+        self,
+        signal_message: SdBusMessage,
+        args: T,
+    ) -> None:
+        if self._is_args_unpacked and isinstance(args, tuple):
+            signal_message.append_data(self.signal_signature, *args)
+        elif self.signal_signature == '' and args is None:
+            ...
+        else:
+            signal_message.append_data(self.signal_signature, args)
+
+    def broadcast(
+        self,
+        paths_and_args: Iterable[tuple[str, T]],
+        bus: Optional[SdBus] = None,
+    ) -> None:
+        if bus is None:
+            bus = get_default_bus()
+
+        min_emit_interval = self.min_emit_interval
+        if min_emit_interval is None or not _is_loop_running():
+            self._send_broadcast(bus, paths_and_args)
+            return
+
+        throttle = self._broadcast_throttles.get(bus)
+        if throttle is None:
+            throttle = DbusSignalThrottle(
+                partial(self._emit_throttled_broadcast, bus),
+                min_emit_interval,
+                _merge_paths_to_args,
+            )
+            self._broadcast_throttles[bus] = throttle
+
+        paths_to_args = dict(paths_and_args)
+        if throttle.defer(paths_to_args):
+            return
+
+        self._emit_throttled_broadcast(bus, paths_to_args)
+
+    def _emit_throttled_broadcast(
+        self,
+        bus: SdBus,
+        paths_to_args: dict[str, T],
+    ) -> None:
+        self._send_broadcast(bus, paths_to_args.items())
+
+        throttle = self._broadcast_throttles[bus]
+        # Throttle is only kept until the next emit is allowed
+        get_running_loop().call_at(
+            throttle.last_emit_time + throttle.min_emit_interval,
+            self._drop_idle_broadcast_throttle,
+            bus,
+        )
+
+    def _drop_idle_broadcast_throttle(self, bus: SdBus) -> None:
+        throttle = self._broadcast_throttles.get(bus)
+        if throttle is not None and throttle.pending_handle is None:
+            del self._broadcast_throttles[bus]
+
+    def _send_broadcast(
+        self,
+        bus: SdBus,
+        paths_and_args: Iterable[tuple[str, T]],
+    ) -> None:
+        new_signal_message = bus.new_signal_message
+        interface_name = self.interface_name
+        signal_name = self.signal_name
+        append_signal_data = self._append_signal_data
+
+        signal_messages: list[SdBusMessage] = []
+        for object_path, args in paths_and_args:
+            signal_message = new_signal_message(
+                object_path,
+                interface_name,
+                signal_name,
+            )
+            append_signal_data(signal_message, args)
+            signal_messages.append(signal_message)
+
+        bus.send_messages(signal_messages)
+
     async def catch_anywhere(
         self,
         service_name: str,
@@ -126,6 +228,8 @@ class DbusSignalAsync(DbusMemberAsync, DbusSignalCommon, Generic[T]):
 
 
 class DbusBoundSignalAsyncBase(DbusBoundAsync, AsyncIterable[T], Generic[T]):
+    __slots__ = ()
+
     async def catch(self) -> AsyncIterator[T]:
         raise NotImplementedError
         yield cast(T, None)
@@ -145,6 +249,8 @@ class DbusBoundSignalAsyncBase(DbusBoundAsync, AsyncIterable[T], Generic[T]):
 
 
 class DbusProxySignalAsync(DbusBoundSignalAsyncBase[T]):
+    __slots__ = ('dbus_signal', 'proxy_meta')
+
     def __init__(
         self,
         dbus_signal: DbusSignalAsync[T],
@@ -153,7 +259,9 @@ class DbusProxySignalAsync(DbusBoundSignalAsyncBase[T]):
         self.dbus_signal = dbus_signal
         self.proxy_meta = proxy_meta
 
-        self.__doc__ = dbus_signal.__doc__
+    @property
+    def __doc__(self) -> Optional[str]:  # type: ignore[override]
+        return self.dbus_signal.__doc__
 
     async def _register_match_slot(
         self,
@@ -218,6 +326,77 @@ class DbusProxySignalAsync(DbusBoundSignalAsyncBase[T]):
         raise RuntimeError("Cannot emit signal from D-Bus proxy.")
 
 
+def _is_loop_running() -> bool:
+    try:
+        get_running_loop()
+    except RuntimeError:
+        return False
+
+    return True
+
+
+def _merge_paths_to_args(
+    pending_paths_to_args: dict[str, T],
+    paths_to_args: dict[str, T],
+) -> dict[str, T]:
+    pending_paths_to_args.update(paths_to_args)
+    return pending_paths_to_args
+
+
+class DbusSignalThrottle(Generic[T]):
+    def __init__(
+        self,
+        emit_callback: Callable[[T], None],
+        min_emit_interval: float,
+        merge_args: Optional[Callable[[T, T], T]] = None,
+    ):
+        self.emit_callback = emit_callback
+        self.min_emit_interval = min_emit_interval
+        self.merge_args = merge_args
+        self.last_emit_time = -inf
+        self.pending_handle: Optional[TimerHandle] = None
+        self.pending_args: Optional[T] = None
+
+    def defer(self, args: T) -> bool:
+        if self.pending_handle is not None:
+            if self.merge_args is not None:
+                args = self.merge_args(cast(T, self.pending_args), args)
+            # Only the latest value is emitted
+            self.pending_args = args
+            return True
+
+        try:
+            loop = get_running_loop()
+        except RuntimeError:
+            # Emit can only be delayed by the running event loop
+            return False
+
+        current_time = loop.time()
+        next_emit_time = self.last_emit_time + self.min_emit_interval
+        if current_time >= next_emit_time:
+            self.last_emit_time = current_time
+            return False
+
+        self.pending_args = args
+        self.pending_handle = loop.call_at(
+            next_emit_time, self._emit_pending)
+        return True
+
+    def _emit_pending(self) -> None:
+        self.pending_handle = None
+        self.last_emit_time = get_running_loop().time()
+
+        args = cast(T, self.pending_args)
+        self.pending_args = None
+        self.emit_callback(args)
+
+    def cancel(self) -> None:
+        if self.pending_handle is not None:
+            self.pending_handle.cancel()
+            self.pending_handle = None
+            self.pending_args = None
+
+
 class DbusLocalSignalAsync(DbusBoundSignalAsyncBase[T]):
     def __init__(
         self,
@@ -229,10 +408,20 @@ class DbusLocalSignalAsync(DbusBoundSignalAsyncBase[T]):
 
         self.__doc__ = dbus_signal.__doc__
 
+    @property
+    def local_callbacks(self) -> WeakSet[Callable[[T], Any]]:
+        signals_callbacks = self.local_meta.signals_callbacks
+        signal_callbacks = signals_callbacks.get(self.dbus_signal)
+        if signal_callbacks is None:
+            signal_callbacks = WeakSet()
+            signals_callbacks[self.dbus_signal] = signal_callbacks
+
+        return signal_callbacks
+
     async def catch(self) -> AsyncIterator[T]:
         new_queue: Queue[T] = Queue()
 
-        signal_callbacks = self.dbus_signal.local_callbacks
+        signal_callbacks = self.local_callbacks
         try:
             put_method = new_queue.put_nowait
             signal_callbacks.add(put_method)
@@ -267,23 +456,45 @@ class DbusLocalSignalAsync(DbusBoundSignalAsyncBase[T]):
             self.dbus_signal.signal_name,
         )
 
-        if ((not self.dbus_signal.signal_signature.startswith('('))
-            and
-                isinstance(args, tuple)):
-            signal_message.append_data(
-                self.dbus_signal.signal_signature, *args)
-        elif self.dbus_signal.signal_signature == '' and args is None:
-            ...
-        else:
-            signal_message.append_data(
-                self.dbus_signal.signal_signature, args)
-
+        self.dbus_signal._append_signal_data(signal_message, args)
         signal_message.send()
 
     def emit(self, args: T) -> None:
+        min_emit_interval = self.dbus_signal.min_emit_interval
+        if min_emit_interval is not None:
+            signals_throttles = self.local_meta.signals_throttles
+            throttle = signals_throttles.get(self.dbus_signal)
+            if throttle is None:
+                throttle = DbusSignalThrottle(
+                    self._emit_now, min_emit_interval)
+                signals_throttles[self.dbus_signal] = throttle
+
+            if throttle.defer(args):
+                return
+
+        self._emit_now(args)
+
+    def _emit_now(self, args: T) -> None:
         self._emit_dbus_signal(args)
 
-        for callback in self.dbus_signal.local_callbacks:
+        properties_changed_observers = (
+            self.local_meta.properties_changed_observers
+        )
+        if properties_changed_observers and (
+            self.dbus_signal.interface_name
+            == 'org.freedesktop.DBus.Properties'
+        ):
+            for properties_changed_observer in properties_changed_observers:
+                properties_changed_observer(
+                    cast('DBUS_PROPERTIES_CHANGED_TYPING', args)
+                )
+
+        signal_callbacks = self.local_meta.signals_callbacks.get(
+            self.dbus_signal)
+        if signal_callbacks is None:
+            return
+
+        for callback in signal_callbacks:
             callback(args)
 
 
@@ -292,6 +503,7 @@ def dbus_signal_async(
         signal_args_names: Sequence[str] = (),
         flags: int = 0,
         signal_name: Optional[str] = None,
+        max_emit_rate: Optional[float] = None,
 ) -> Callable[
     [Callable[[Any], T]],
     DbusSignalAsync[T]
@@ -311,6 +523,7 @@ def dbus_signal_async(
             signal_args_names,
             flags,
             pseudo_function,
+            max_emit_rate,
         )
 
     return signal_decorator
@@ -37,6 +37,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
     from typing import Any, Optional
 
+    from .dbus_common_elements import DbusBoundSync
     from .sd_bus_internals import SdBus
 
 
@@ -165,6 +166,10 @@ class DbusInterfaceBase(metaclass=DbusInterfaceMetaSync):
         bus: Optional[SdBus] = None,
     ):
         self._dbus = DbusRemoteObjectMeta(service_name, object_path, bus)
+        # Bound proxy members are created on first access and reused.
+        # Kept on the proxy so that they do not reference back
+        # the object holding them.
+        self._dbus_bound_members: dict[DbusMemberCommon, DbusBoundSync] = {}
 
     @classmethod
     def _dbus_iter_interfaces_meta(
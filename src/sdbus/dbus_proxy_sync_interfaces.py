@@ -21,11 +21,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .dbus_common_elements import DbusPropertyCache, _collect_properties_flags
 from .dbus_proxy_sync_interface_base import DbusInterfaceBase
 from .dbus_proxy_sync_method import dbus_method
 
 if TYPE_CHECKING:
-    from typing import Any, Literal
+    from typing import Any, Literal, Optional
 
 
 class DbusPeerInterface(
@@ -92,6 +93,34 @@ class DbusPropertiesInterface(
 
         return properties
 
+    def properties_cache_enable(
+            self,
+            time_to_live: Optional[float] = None,
+    ) -> None:
+        interfaces_meta = [
+            (interface_name, meta)
+            for interface_name, meta in self._dbus_iter_interfaces_meta()
+            if meta.serving_enabled
+        ]
+        # Blocking API does not process signals so only constant
+        # properties and properties with time to live can be cached.
+        property_cache = DbusPropertyCache(
+            _collect_properties_flags(type(self), interfaces_meta),
+            time_to_live,
+            is_updated_by_signals=False,
+        )
+
+        for interface_name, _ in interfaces_meta:
+            dbus_properties_data = self._properties_get_all(interface_name)
+
+            for member_name, variant in dbus_properties_data.items():
+                property_cache.store(interface_name, member_name, variant[1])
+
+        self._dbus.property_cache = property_cache
+
+    def properties_cache_disable(self) -> None:
+        self._dbus.property_cache = None
+
 
 class DbusInterfaceCommon(
         DbusPropertiesInterface,
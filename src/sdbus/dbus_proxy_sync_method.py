@@ -21,7 +21,8 @@ from __future__ import annotations
 
 from inspect import iscoroutinefunction
 from types import FunctionType
-from typing import TYPE_CHECKING, TypeVar, cast
+from typing import TYPE_CHECKING, TypeVar, cast, overload
+from weakref import proxy as weak_proxy
 
 from .dbus_common_elements import (
     DbusBoundSync,
@@ -31,7 +32,7 @@ from .dbus_common_elements import (
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
-    from typing import Any, Optional
+    from typing import Any, Optional, Union
 
     from .dbus_proxy_sync_interface_base import DbusInterfaceBase
 
@@ -39,27 +40,57 @@ T = TypeVar('T')
 
 
 class DbusMethodSync(DbusMethodCommon, DbusMemberSync):
+    @overload
+    def __get__(self,
+                obj: None,
+                obj_class: type[DbusInterfaceBase],
+                ) -> DbusMethodSync:
+        ...
+
+    @overload
     def __get__(self,
                 obj: DbusInterfaceBase,
                 obj_class: Optional[type[DbusInterfaceBase]] = None,
                 ) -> Callable[..., Any]:
-        return DbusLocalMethodSync(self, obj)
+        ...
+
+    def __get__(self,
+                obj: Optional[DbusInterfaceBase],
+                obj_class: Optional[type[DbusInterfaceBase]] = None,
+                ) -> Union[Callable[..., Any], DbusMethodSync]:
+        if obj is None:
+            return self
+
+        bound_members = obj._dbus_bound_members
+        local_method = bound_members.get(self)
+        if local_method is None:
+            local_method = DbusLocalMethodSync(self, obj)
+            bound_members[self] = local_method
+
+        return cast(DbusLocalMethodSync, local_method)
 
 
 class DbusLocalMethodSync(DbusBoundSync):
+    __slots__ = ('dbus_method', 'interface', 'proxy_meta')
+
     def __init__(self,
                  dbus_method: DbusMethodSync,
                  interface: DbusInterfaceBase):
         self.dbus_method = dbus_method
-        self.interface = interface
+        # Bound method is cached on the interface object,
+        # a strong reference would create a cycle.
+        self.interface = cast('DbusInterfaceBase', weak_proxy(interface))
+        self.proxy_meta = interface._dbus
 
-        self.__doc__ = dbus_method.__doc__
+    @property
+    def __doc__(self) -> Optional[str]:  # type: ignore[override]
+        return self.dbus_method.__doc__
 
     def _call_dbus_sync(self, *args: Any) -> Any:
         new_call_message = (
-            self.interface._dbus.attached_bus.new_method_call_message(
-                self.interface._dbus.service_name,
-                self.interface._dbus.object_path,
+            self.proxy_meta.attached_bus.new_method_call_message(
+                self.proxy_meta.service_name,
+                self.proxy_meta.object_path,
                 self.dbus_method.interface_name,
                 self.dbus_method.method_name,
             )
@@ -68,7 +99,7 @@ class DbusLocalMethodSync(DbusBoundSync):
             new_call_message.append_data(
                 self.dbus_method.input_signature, *args)
 
-        reply_message = self.interface._dbus.attached_bus.call(
+        reply_message = self.proxy_meta.attached_bus.call(
             new_call_message)
         return reply_message.get_contents()
 
@@ -79,13 +110,31 @@ class DbusLocalMethodSync(DbusBoundSync):
                 f"Extra args: {kwargs}")
             rebuilt_args: Sequence[Any] = args
         else:
-            rebuilt_args = self.dbus_method._rebuild_args(
-                self.dbus_method.original_method,
-                *args,
-                **kwargs)
+            rebuilt_args = self.dbus_method._bind_args(*args, **kwargs)
 
         return self._call_dbus_sync(*rebuilt_args)
 
+    def no_reply(self, *args: Any, **kwargs: Any) -> None:
+        """Send the method call without waiting for reply."""
+        rebuilt_args = self.dbus_method._bind_args(*args, **kwargs)
+        new_call_message = (
+            self.proxy_meta.attached_bus.new_method_call_message(
+                self.proxy_meta.service_name,
+                self.proxy_meta.object_path,
+                self.dbus_method.interface_name,
+                self.dbus_method.method_name,
+            )
+        )
+        if rebuilt_args:
+            new_call_message.append_data(
+                self.dbus_method.input_signature, *rebuilt_args)
+
+        new_call_message.expect_reply = False
+        new_call_message.send()
+        # Blocking connection is not processed by event loop
+        # so the message has to be written right away.
+        self.proxy_meta.attached_bus.flush()
+
 
 def dbus_method(
     input_signature: str = "",
@@ -21,16 +21,18 @@ from __future__ import annotations
 
 from inspect import iscoroutinefunction
 from types import FunctionType
-from typing import TYPE_CHECKING, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Generic, TypeVar, cast, overload
 
 from .dbus_common_elements import DbusMemberSync, DbusPropertyCommon
 from .dbus_common_funcs import _check_sync_in_async_env
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from typing import Any, Optional
+    from typing import Any, Optional, Union
 
+    from .dbus_common_elements import DbusRemoteObjectMeta
     from .dbus_proxy_sync_interface_base import DbusInterfaceBase
+    from .sd_bus_internals import SdBusMessage
 
 
 T = TypeVar('T')
@@ -61,27 +63,37 @@ class DbusPropertySync(DbusPropertyCommon, DbusMemberSync, Generic[T]):
 
         self.__doc__ = property_getter.__doc__
 
-    def __get__(self,
-                obj: DbusInterfaceBase,
-                obj_class: Optional[type[DbusInterfaceBase]] = None,
-                ) -> T:
+    @overload
+    def __get__(
+        self,
+        obj: None,
+        obj_class: type[DbusInterfaceBase],
+    ) -> DbusPropertySync[T]:
+        ...
+
+    @overload
+    def __get__(
+        self,
+        obj: DbusInterfaceBase,
+        obj_class: Optional[type[DbusInterfaceBase]] = None,
+    ) -> T:
+        ...
+
+    def __get__(
+        self,
+        obj: Optional[DbusInterfaceBase],
+        obj_class: Optional[type[DbusInterfaceBase]] = None,
+    ) -> Union[T, DbusPropertySync[T]]:
+        if obj is None:
+            return self
+
         assert _check_sync_in_async_env(), (
             "Used sync __get__ method in async environment. "
             "This is probably an error as it will block "
             "other asyncio methods for considerable time."
         )
 
-        new_call_message = (
-            obj._dbus.attached_bus.new_property_get_message(
-                obj._dbus.service_name,
-                obj._dbus.object_path,
-                self.interface_name,
-                self.property_name,
-            )
-        )
-
-        reply_message = obj._dbus.attached_bus.call(new_call_message)
-        return cast(T, reply_message.get_contents()[1])
+        return self._get_value(obj._dbus)
 
     def __set__(self, obj: DbusInterfaceBase, value: T) -> None:
         assert _check_sync_in_async_env(), (
@@ -90,13 +102,56 @@ class DbusPropertySync(DbusPropertyCommon, DbusMemberSync, Generic[T]):
             "other asyncio methods for considerable time."
         )
 
+        self._set_value(obj._dbus, value)
+
+    def set_no_reply(self, obj: DbusInterfaceBase, value: T) -> None:
+        """Set the property value of the proxy without waiting for reply."""
+        self._set_value(obj._dbus, value, no_reply=True)
+
+    def _get_value(self, proxy_meta: DbusRemoteObjectMeta) -> T:
+        property_cache = proxy_meta.property_cache
+        if property_cache is not None:
+            try:
+                return cast(T, property_cache.lookup(
+                    self.interface_name,
+                    self.property_name,
+                ))
+            except KeyError:
+                ...
+
+        new_call_message = (
+            proxy_meta.attached_bus.new_property_get_message(
+                proxy_meta.service_name,
+                proxy_meta.object_path,
+                self.interface_name,
+                self.property_name,
+            )
+        )
+
+        reply_message = proxy_meta.attached_bus.call(new_call_message)
+        property_value = reply_message.get_contents()[1]
+
+        if property_cache is not None:
+            property_cache.store(
+                self.interface_name,
+                self.property_name,
+                property_value,
+            )
+
+        return cast(T, property_value)
+
+    def _new_set_message(
+        self,
+        proxy_meta: DbusRemoteObjectMeta,
+        value: T,
+    ) -> SdBusMessage:
         if not self.property_signature:
             raise AttributeError('D-Bus property is read only')
 
         new_call_message = (
-            obj._dbus.attached_bus.new_property_set_message(
-                obj._dbus.service_name,
-                obj._dbus.object_path,
+            proxy_meta.attached_bus.new_property_set_message(
+                proxy_meta.service_name,
+                proxy_meta.object_path,
                 self.interface_name,
                 self.property_name,
             )
@@ -105,7 +160,27 @@ class DbusPropertySync(DbusPropertyCommon, DbusMemberSync, Generic[T]):
         new_call_message.append_data(
             'v', (self.property_signature, value))
 
-        obj._dbus.attached_bus.call(new_call_message)
+        return new_call_message
+
+    def _set_value(
+        self,
+        proxy_meta: DbusRemoteObjectMeta,
+        value: T,
+        no_reply: bool = False,
+    ) -> None:
+        new_call_message = self._new_set_message(proxy_meta, value)
+        if no_reply:
+            new_call_message.expect_reply = False
+            new_call_message.send()
+            # Blocking connection is not processed by event loop
+            # so the message has to be written right away.
+            proxy_meta.attached_bus.flush()
+        else:
+            proxy_meta.attached_bus.call(new_call_message)
+
+        property_cache = proxy_meta.property_cache
+        if property_cache is not None:
+            property_cache.invalidate(self.interface_name, self.property_name)
 
 
 def dbus_property(
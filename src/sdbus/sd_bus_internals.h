@@ -296,7 +296,26 @@ extern PyType_Spec SdBusSlotType;
 extern PyObject* SdBusSlot_class;
 
 // SdBusInterface
+
+// Prepared per member callback data.
+typedef struct {
+        PyObject* callback;  // Method callback or property getter
+        PyObject* setter;    // Property setter or NULL
+        int is_coroutine;
+} SdBusInterfaceMemberRecord;
+
+struct SdBusInterfaceExport;
+
+// Every export allocates an array of entries, one per member record.
+// Array is passed to sd-bus as the vtable userdata and sd-bus adds
+// the member offset to it before calling the member callback which
+// makes the callback receive its entry directly.
 typedef struct {
+        SdBusInterfaceMemberRecord* record;
+        struct SdBusInterfaceExport* export;
+} SdBusInterfaceExportEntry;
+
+typedef struct SdBusInterfaceObject {
         PyObject_HEAD;
         SdBusSlotObject* interface_slot;
         PyObject* method_list;
@@ -306,15 +325,37 @@ typedef struct {
         PyObject* property_set_dict;
         PyObject* signal_list;
         sd_bus_vtable* vtable;
+        SdBusInterfaceMemberRecord* member_records;
+        Py_ssize_t num_of_member_records;
 } SdBusInterfaceObject;
 
+typedef struct SdBusInterfaceExport {
+        SdBusInterfaceObject* interface;
+        // Interface that owns the export slot is not referenced
+        int owns_interface;
+        // Bus that dispatches the callbacks. Not referenced as
+        // callbacks can only be called while the bus is processing.
+        PyObject* bus;
+        // Weak reference to the object served by the shared interface
+        PyObject* object_ref;
+        // Fallback exports find the served object by its path
+        PyObject* object_lookup;
+        SdBusInterfaceExportEntry entries[];
+} SdBusInterfaceExport;
+
 extern PyType_Spec SdBusInterfaceType;
 extern PyObject* SdBusInterface_class;
+extern int _SdBusInterface_fallback_find(sd_bus* bus, const char* path, const char* interface, void* userdata, void** ret_found, sd_bus_error* ret_error);
+extern SdBusInterfaceExport* _SdBusInterface_new_export(SdBusInterfaceObject* self, PyObject* bus, int owns_interface);
+extern void _SdBusInterface_export_destroy(void* entries);
 
 // SdBusMessage
 typedef struct {
         PyObject_HEAD;
         sd_bus_message* message_ref;
+        // Time the bus started dispatching the message or zero
+        uint64_t dispatch_monotonic_usec;
+        uint64_t dispatch_realtime_usec;
 } SdBusMessageObject;
 
 __attribute__((used)) static inline void cleanup_SdBusMessage(SdBusMessageObject** object) {
@@ -322,6 +363,9 @@ __attribute__((used)) static inline void cleanup_SdBusMessage(SdBusMessageObject
 }
 
 extern void _SdBusMessage_set_messsage(SdBusMessageObject* self, sd_bus_message* new_message);
+extern void _SdBusMessage_set_dispatch_time(uint64_t monotonic_usec, uint64_t realtime_usec);
+extern PyObject* _SdBusMessage_get_contents(sd_bus_message* message);
+extern int _SdBusMessage_append_data_tuple(sd_bus_message* message, const char* signature_char_ptr, PyObject* args_tuple);
 
 #define CLEANUP_SD_BUS_MESSAGE __attribute__((cleanup(cleanup_SdBusMessage)))
 
@@ -337,10 +381,21 @@ typedef struct {
         PyObject* timer_fd;
         int asyncio_watchers_last_state;
         int timer_fd_int;
+        // Stamp dispatched messages with the time processing started
+        int attach_timestamp;
+        // List of (future, max_queued) tuples waiting for the write queue
+        PyObject* drain_waiters;
+        // Object found by the fallback export lookup for the message
+        // being processed. Member callbacks dispatched right after
+        // reuse it instead of calling the lookup again.
+        SdBusInterfaceExport* found_export;
+        PyObject* found_path_bytes;
+        PyObject* found_object;
 } SdBusObject;
 
 extern PyType_Spec SdBusType;
 extern PyObject* SdBus_class;
+extern PyObject* _SdBus_get_or_bind_loop(SdBusObject* self);
 
 // Module level functions
 extern PyMethodDef SdBusPyInternal_methods[];
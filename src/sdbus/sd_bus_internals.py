@@ -23,7 +23,7 @@ from asyncio import Future
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Any, Optional, Union
 
     DbusBasicTypes = Union[str, int, bytes, float, Any]
@@ -62,7 +62,7 @@ class SdBusInterface:
         signature: str, input_args_names: Sequence[str],
         result_signature: str, result_args_names: Sequence[str],
         flags: int,
-        callback: Callable[[SdBusMessage], None], /
+        callback: Callable[..., None], /
     ) -> None:
         raise NotImplementedError(__STUB_ERROR)
 
@@ -70,8 +70,8 @@ class SdBusInterface:
         self,
         property_name: str,
         property_signature: str,
-        get_function: Callable[[SdBusMessage], Any],
-        set_function: Optional[Callable[[SdBusMessage], None]],
+        get_function: Callable[..., Any],
+        set_function: Optional[Callable[..., None]],
         flags: int, /
     ) -> None:
         raise NotImplementedError(__STUB_ERROR)
@@ -129,6 +129,9 @@ class SdBusMessage:
     def send(self) -> None:
         raise NotImplementedError(__STUB_ERROR)
 
+    def append_contents_from(self, source_message: SdBusMessage, /) -> None:
+        raise NotImplementedError(__STUB_ERROR)
+
     def parse_to_tuple(self) -> tuple[Any, ...]:
         raise NotImplementedError(__STUB_ERROR)
 
@@ -138,6 +141,9 @@ class SdBusMessage:
     interface: Optional[str] = None
     member: Optional[str] = None
     sender: Optional[str] = None
+    monotonic_usec: Optional[int] = None
+    realtime_usec: Optional[int] = None
+    cookie: Optional[int] = None
 
 
 class SdBus:
@@ -149,6 +155,29 @@ class SdBus:
             /) -> Future[SdBusMessage]:
         raise NotImplementedError(__STUB_ERROR)
 
+    def send_messages(self, messages: Iterable[SdBusMessage], /) -> None:
+        raise NotImplementedError(__STUB_ERROR)
+
+    def negotiate_timestamp(self, enable: bool, /) -> None:
+        raise NotImplementedError(__STUB_ERROR)
+
+    def flush(self) -> None:
+        raise NotImplementedError(__STUB_ERROR)
+
+    def drain(self, max_queued: int = 0, /) -> Future[None]:
+        raise NotImplementedError(__STUB_ERROR)
+
+    def call_method_async(
+            self,
+            destination_name: str,
+            object_path: str,
+            interface_name: str,
+            member_name: str,
+            signature: str,
+            args: tuple[Any, ...],
+            /) -> Future[Any]:
+        raise NotImplementedError(__STUB_ERROR)
+
     def process(self) -> None:
         raise NotImplementedError(__STUB_ERROR)
 
@@ -188,6 +217,24 @@ class SdBus:
                       object_path: str, interface_name: str, /) -> None:
         raise NotImplementedError(__STUB_ERROR)
 
+    def add_shared_interface(
+        self,
+        new_interface: SdBusInterface,
+        object_path: str,
+        interface_name: str,
+        served_object: Any, /
+    ) -> SdBusSlot:
+        raise NotImplementedError(__STUB_ERROR)
+
+    def add_fallback_interface(
+        self,
+        new_interface: SdBusInterface,
+        path_prefix: str,
+        interface_name: str,
+        object_lookup: Callable[[str], Any], /
+    ) -> SdBusSlot:
+        raise NotImplementedError(__STUB_ERROR)
+
     def match_signal_async(
         self,
         senders_name: Optional[str], object_path: Optional[str],
@@ -196,6 +243,13 @@ class SdBus:
     ) -> Future[SdBusSlot]:
         raise NotImplementedError(__STUB_ERROR)
 
+    def add_match_async(
+        self,
+        match_rule: str,
+        callback: Callable[[SdBusMessage], None], /
+    ) -> Future[SdBusSlot]:
+        raise NotImplementedError(__STUB_ERROR)
+
     def request_name_async(self, name: str, flags: int, /) -> Future[None]:
         raise NotImplementedError(__STUB_ERROR)
 
@@ -205,6 +259,22 @@ class SdBus:
     def add_object_manager(self, path: str, /) -> SdBusSlot:
         raise NotImplementedError(__STUB_ERROR)
 
+    def add_method_call_filter(
+        self,
+        object_path: str,
+        interface_name: str,
+        member_name: str,
+        callback: Callable[[SdBusMessage], None], /
+    ) -> SdBusSlot:
+        raise NotImplementedError(__STUB_ERROR)
+
+    def add_node_enumerator(
+        self,
+        path: str,
+        enumerator: Callable[[str], Iterable[str]], /
+    ) -> SdBusSlot:
+        raise NotImplementedError(__STUB_ERROR)
+
     def emit_object_added(self, path: str, /) -> None:
         raise NotImplementedError(__STUB_ERROR)
 
@@ -219,6 +289,8 @@ class SdBus:
 
     address: Optional[str] = None
     method_call_timeout_usec: int = 0
+    n_queued_write: int = 0
+    n_queued_read: int = 0
 
 
 def sd_bus_open() -> SdBus:
@@ -24,7 +24,17 @@
 #include <time.h>
 #include "sd_bus_internals.h"
 
+static int _SdBus_wake_drain_waiters(SdBusObject* self, PyObject* exception);
+
+static void _SdBus_clear_found_object(SdBusObject* self) {
+        self->found_export = NULL;
+        Py_CLEAR(self->found_path_bytes);
+        Py_CLEAR(self->found_object);
+}
+
 static void SdBus_dealloc(SdBusObject* self) {
+        Py_XDECREF(self->drain_waiters);
+        _SdBus_clear_found_object(self);
         if (NULL != self->loop && NULL != self->bus_fd) {
                 Py_XDECREF(PyObject_CallMethodObjArgs(self->loop, remove_reader_str, self->bus_fd, NULL));
                 Py_XDECREF(PyObject_CallMethodObjArgs(self->loop, remove_writer_str, self->bus_fd, NULL));
@@ -240,17 +250,136 @@ static PyObject* SdBus_asyncio_update_fd_watchers(SdBusObject* self);
 
 #define CHECK_ASYNCIO_WATCHERS ({ CALL_PYTHON_EXPECT_NONE(SdBus_asyncio_update_fd_watchers(self)); })
 
-static PyObject* _get_or_bind_loop(SdBusObject* self) {
+static int _SdBus_get_n_queued_write(SdBusObject* self, uint64_t* n_queued) {
+        uint64_t sd_bus_queued = 0;
+        CALL_SD_BUS_CHECK_RETURN_NEG1(sd_bus_get_n_queued_write(self->sd_bus_ref, &sd_bus_queued));
+
+        *n_queued = sd_bus_queued;
+        return 0;
+}
+
+// Resolves drain futures whose limit is satisfied or
+// fails all of them with the passed exception.
+static int _SdBus_wake_drain_waiters(SdBusObject* self, PyObject* exception) {
+        uint64_t n_queued = 0;
+        if (NULL == exception && _SdBus_get_n_queued_write(self, &n_queued) < 0) {
+                return -1;
+        }
+
+        PyObject* old_waiters CLEANUP_PY_OBJECT = self->drain_waiters;
+        self->drain_waiters = NULL;
+
+        Py_ssize_t num_of_waiters = PyList_Size(old_waiters);
+        for (Py_ssize_t i = 0; i < num_of_waiters; ++i) {
+                PyObject* waiter_tuple = PyList_GetItem(old_waiters, i);
+                PyObject* drain_future = PyTuple_GetItem(waiter_tuple, 0);
+                unsigned long long max_queued = PyLong_AsUnsignedLongLong(PyTuple_GetItem(waiter_tuple, 1));
+
+                PyObject* is_done CLEANUP_PY_OBJECT = CALL_PYTHON_CHECK_RETURN_NEG1(PyObject_CallMethod(drain_future, "done", ""));
+                if (Py_True == is_done) {
+                        continue;
+                }
+
+                if (NULL != exception) {
+                        Py_XDECREF(CALL_PYTHON_CHECK_RETURN_NEG1(PyObject_CallMethodObjArgs(drain_future, set_exception_str, exception, NULL)));
+                } else if (n_queued <= (uint64_t)max_queued) {
+                        Py_XDECREF(CALL_PYTHON_CHECK_RETURN_NEG1(PyObject_CallMethodObjArgs(drain_future, set_result_str, Py_None, NULL)));
+                } else {
+                        if (NULL == self->drain_waiters) {
+                                self->drain_waiters = CALL_PYTHON_CHECK_RETURN_NEG1(PyList_New(0));
+                        }
+                        if (PyList_Append(self->drain_waiters, waiter_tuple) < 0) {
+                                return -1;
+                        }
+                }
+        }
+
+        return 0;
+}
+
+#ifndef Py_LIMITED_API
+static PyObject* SdBus_drain(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
+        if (nargs > 1) {
+                PyErr_Format(PyExc_TypeError, "Expected at most 1 argument, got %zi", nargs);
+                return NULL;
+        }
+
+        unsigned long long max_queued = 0;
+        if (1 == nargs) {
+                SD_BUS_PY_CHECK_ARG_CHECK_FUNC(0, PyLong_Check);
+                max_queued = PyLong_AsUnsignedLongLong(args[0]);
+                if (PyErr_Occurred()) {
+                        return NULL;
+                }
+        }
+#else
+static PyObject* SdBus_drain(SdBusObject* self, PyObject* args) {
+        unsigned long long max_queued = 0;
+        CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "|K", &max_queued, NULL));
+#endif
+        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_SdBus_get_or_bind_loop(self));
+        PyObject* drain_future CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyObject_CallMethod(running_loop, "create_future", ""));
+
+        uint64_t n_queued = 0;
+        if (_SdBus_get_n_queued_write(self, &n_queued) < 0) {
+                return NULL;
+        }
+
+        if (n_queued <= (uint64_t)max_queued) {
+                Py_XDECREF(CALL_PYTHON_AND_CHECK(PyObject_CallMethodObjArgs(drain_future, set_result_str, Py_None, NULL)));
+        } else {
+                if (NULL == self->drain_waiters) {
+                        self->drain_waiters = CALL_PYTHON_AND_CHECK(PyList_New(0));
+                }
+                PyObject* waiter_tuple CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(Py_BuildValue("(OK)", drain_future, max_queued));
+                CALL_PYTHON_INT_CHECK(PyList_Append(self->drain_waiters, waiter_tuple));
+                CHECK_ASYNCIO_WATCHERS;
+        }
+
+        Py_INCREF(drain_future);
+        return drain_future;
+}
+
+static PyObject* SdBus_flush(SdBusObject* self, PyObject* Py_UNUSED(args)) {
+        if (NULL == self->loop) {
+                // Blocking connection writes everything right away
+                CALL_SD_BUS_AND_CHECK(sd_bus_flush(self->sd_bus_ref));
+                Py_RETURN_NONE;
+        }
+
+        return SdBus_asyncio_update_fd_watchers(self);
+}
+
+PyObject* _SdBus_get_or_bind_loop(SdBusObject* self) {
         if (NULL == self->loop) {
                 self->loop = CALL_PYTHON_AND_CHECK(PyObject_CallFunctionObjArgs(asyncio_get_running_loop, NULL));
         }
         return self->loop;
 }
 
+static uint64_t _clock_usec(clockid_t clock_id) {
+        struct timespec now = {0};
+        clock_gettime(clock_id, &now);
+        return (uint64_t)now.tv_sec * 1000000 + (uint64_t)now.tv_nsec / 1000;
+}
+
+static void _SdBus_clear_dispatch_time(int* Py_UNUSED(attach_timestamp)) {
+        _SdBusMessage_set_dispatch_time(0, 0);
+}
+
 static PyObject* SdBus_process(SdBusObject* self, PyObject* Py_UNUSED(args)) {
+        int attach_timestamp __attribute__((cleanup(_SdBus_clear_dispatch_time))) = self->attach_timestamp;
+        if (attach_timestamp) {
+                // sd-bus does not read kernel timestamps of socket transports.
+                // Messages are stamped with the time processing started instead.
+                _SdBusMessage_set_dispatch_time(_clock_usec(CLOCK_MONOTONIC), _clock_usec(CLOCK_REALTIME));
+        }
+
         int return_value = 1;
         while (return_value > 0) {
                 return_value = sd_bus_process(self->sd_bus_ref, NULL);
+                // Found objects only live for the duration of one message dispatch
+                _SdBus_clear_found_object(self);
                 if (return_value < 0) {
                         if (-ECONNRESET == return_value) {
                                 // Connection gracefully terminated
@@ -266,6 +395,9 @@ static PyObject* SdBus_process(SdBusObject* self, PyObject* Py_UNUSED(args)) {
                         return NULL;
                 }
         }
+        if (NULL != self->drain_waiters && _SdBus_wake_drain_waiters(self, NULL) < 0) {
+                return NULL;
+        }
         CHECK_ASYNCIO_WATCHERS;
 
         Py_RETURN_NONE;
@@ -308,7 +440,7 @@ static PyObject* SdBus_call_async(SdBusObject* self, PyObject* arg) {
         SdBusMessageObject* call_message = NULL;
         CALL_PYTHON_BOOL_CHECK(PyArg_Parse(arg, "O!", SdBusMessage_class, &call_message, NULL));
 
-        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_get_or_bind_loop(self));
+        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_SdBus_get_or_bind_loop(self));
 
         PyObject* new_future = CALL_PYTHON_AND_CHECK(PyObject_CallMethod(running_loop, "create_future", ""));
 
@@ -324,6 +456,142 @@ static PyObject* SdBus_call_async(SdBusObject* self, PyObject* arg) {
         return new_future;
 }
 
+static PyObject* SdBus_negotiate_timestamp(SdBusObject* self, PyObject* enable_bool) {
+        if (!PyBool_Check(enable_bool)) {
+                PyErr_Format(PyExc_TypeError, "Expected bool, got %R", enable_bool);
+                return NULL;
+        }
+
+        // Transports that support timestamps only attach them if
+        // negotiated before the connection is started.
+        CALL_SD_BUS_AND_CHECK(sd_bus_negotiate_timestamp(self->sd_bus_ref, Py_True == enable_bool));
+        self->attach_timestamp = Py_True == enable_bool;
+        Py_RETURN_NONE;
+}
+
+static PyObject* SdBus_send_messages(SdBusObject* self, PyObject* messages_iterable) {
+        PyObject* messages_iter CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyObject_GetIter(messages_iterable));
+
+        while (1) {
+                PyObject* next_message CLEANUP_PY_OBJECT = PyIter_Next(messages_iter);
+                if (NULL == next_message) {
+                        if (PyErr_Occurred()) {
+                                return NULL;
+                        }
+                        break;
+                }
+
+                if (!PyObject_TypeCheck(next_message, (PyTypeObject*)SdBusMessage_class)) {
+                        PyErr_SetString(PyExc_TypeError, "Expected SdBusMessage");
+                        return NULL;
+                }
+
+                CALL_SD_BUS_AND_CHECK(sd_bus_send(self->sd_bus_ref, ((SdBusMessageObject*)next_message)->message_ref, NULL));
+        }
+
+        // Messages that could not be written right away are
+        // left in the write queue and wait for the writer watcher.
+        if (NULL != self->loop) {
+                CHECK_ASYNCIO_WATCHERS;
+        }
+
+        Py_RETURN_NONE;
+}
+
+static int SdBus_async_contents_callback(sd_bus_message* m,
+                                         void* userdata,  // Should be the asyncio.Future
+                                         sd_bus_error* Py_UNUSED(ret_error)) {
+        PyObject* py_future = userdata;
+        PyObject* is_cancelled CLEANUP_PY_OBJECT = PyObject_CallMethod(py_future, "cancelled", "");
+        if (Py_True == is_cancelled) {
+                return 0;
+        }
+
+        if (sd_bus_message_is_method_error(m, NULL)) {
+                if (future_set_exception_from_message(py_future, m) < 0) {
+                        return -1;
+                }
+                return 0;
+        }
+
+        PyObject* reply_contents CLEANUP_PY_OBJECT = _SdBusMessage_get_contents(m);
+        if (reply_contents == NULL) {
+                // Failed to decode reply. Pass the exception to the awaiter.
+                PyObject* exception_type = NULL;
+                PyObject* exception_value = NULL;
+                PyObject* exception_traceback = NULL;
+                PyErr_Fetch(&exception_type, &exception_value, &exception_traceback);
+                PyErr_NormalizeException(&exception_type, &exception_value, &exception_traceback);
+                PyObject* return_object CLEANUP_PY_OBJECT = PyObject_CallMethodObjArgs(py_future, set_exception_str, exception_value, NULL);
+                Py_XDECREF(exception_type);
+                Py_XDECREF(exception_value);
+                Py_XDECREF(exception_traceback);
+                if (return_object == NULL) {
+                        return -1;
+                }
+                return 0;
+        }
+
+        PyObject* return_object CLEANUP_PY_OBJECT = PyObject_CallMethodObjArgs(py_future, set_result_str, reply_contents, NULL);
+        if (return_object == NULL) {
+                return -1;
+        }
+
+        return 0;
+}
+
+#ifndef Py_LIMITED_API
+static PyObject* SdBus_call_method_async(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
+        SD_BUS_PY_CHECK_ARGS_NUMBER(6);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(0, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(1, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(2, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(3, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(4, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(5, PyTuple_Check);
+
+        const char* destination_bus_name = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[0]);
+        const char* object_path = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[1]);
+        const char* interface_name = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[2]);
+        const char* member_name = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[3]);
+        const char* signature_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[4]);
+        PyObject* call_args = args[5];
+#else
+static PyObject* SdBus_call_method_async(SdBusObject* self, PyObject* args) {
+        const char* destination_bus_name = NULL;
+        const char* object_path = NULL;
+        const char* interface_name = NULL;
+        const char* member_name = NULL;
+        const char* signature_char_ptr = NULL;
+        PyObject* call_args = NULL;
+        CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "sssssO!", &destination_bus_name, &object_path, &interface_name, &member_name,
+                                                &signature_char_ptr, &PyTuple_Type, &call_args, NULL));
+#endif
+        sd_bus_message* call_message __attribute__((cleanup(sd_bus_message_unrefp))) = NULL;
+        CALL_SD_BUS_AND_CHECK(
+            sd_bus_message_new_method_call(self->sd_bus_ref, &call_message, destination_bus_name, object_path, interface_name, member_name));
+
+        if (_SdBusMessage_append_data_tuple(call_message, signature_char_ptr, call_args) < 0) {
+                return NULL;
+        }
+
+        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_SdBus_get_or_bind_loop(self));
+
+        PyObject* new_future CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyObject_CallMethod(running_loop, "create_future", ""));
+
+        SdBusSlotObject* new_slot_object CLEANUP_SD_BUS_SLOT = (SdBusSlotObject*)CALL_PYTHON_AND_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusSlot_class));
+
+        CALL_SD_BUS_AND_CHECK(
+            sd_bus_call_async(self->sd_bus_ref, &new_slot_object->slot_ref, call_message, SdBus_async_contents_callback, new_future, (uint64_t)0));
+
+        if (PyObject_SetAttrString(new_future, "_sd_bus_py_slot", (PyObject*)new_slot_object) < 0) {
+                return NULL;
+        }
+        CHECK_ASYNCIO_WATCHERS;
+        Py_INCREF(new_future);
+        return new_future;
+}
+
 #ifndef Py_LIMITED_API
 static int _check_is_sdbus_interface(PyObject* type_to_check) {
         return PyType_IsSubtype(Py_TYPE(type_to_check), (PyTypeObject*)SdBusInterface_class);
@@ -345,16 +613,122 @@ static PyObject* SdBus_add_interface(SdBusObject* self, PyObject* args) {
         const char* interface_name_char_ptr = NULL;
         CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "Oss", &interface_object, &path_char_ptr, &interface_name_char_ptr, NULL));
 #endif
+        // Interface owns a single export slot
+        if (NULL == interface_object->interface_slot || NULL != interface_object->interface_slot->slot_ref) {
+                PyErr_SetString(PyExc_RuntimeError, "Interface was already exported");
+                return NULL;
+        }
+
         PyObject* create_vtable_name CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyUnicode_FromString("_create_vtable"));
 
         Py_XDECREF(CALL_PYTHON_AND_CHECK(PyObject_CallMethodObjArgs((PyObject*)interface_object, create_vtable_name, NULL)));
 
-        CALL_SD_BUS_AND_CHECK(sd_bus_add_object_vtable(self->sd_bus_ref, &interface_object->interface_slot->slot_ref, path_char_ptr, interface_name_char_ptr,
-                                                       interface_object->vtable, interface_object));
+        SdBusInterfaceExport* new_export = _SdBusInterface_new_export(interface_object, (PyObject*)self, 0);
+        if (NULL == new_export) {
+                return NULL;
+        }
+
+        int return_value = sd_bus_add_object_vtable(self->sd_bus_ref, &interface_object->interface_slot->slot_ref, path_char_ptr, interface_name_char_ptr,
+                                                    interface_object->vtable, new_export->entries);
+        if (return_value < 0) {
+                _SdBusInterface_export_destroy(new_export->entries);
+                CALL_SD_BUS_AND_CHECK(return_value);
+        }
+        // Slot owns the export data
+        sd_bus_slot_set_destroy_callback(interface_object->interface_slot->slot_ref, _SdBusInterface_export_destroy);
 
         Py_RETURN_NONE;
 }
 
+static SdBusSlotObject* _SdBus_add_export_slot(SdBusObject* self,
+                                               SdBusInterfaceObject* interface_object,
+                                               const char* path_char_ptr,
+                                               const char* interface_name_char_ptr,
+                                               PyObject* object_ref,
+                                               PyObject* object_lookup) {
+        PyObject* create_vtable_name CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyUnicode_FromString("_create_vtable"));
+
+        Py_XDECREF(CALL_PYTHON_AND_CHECK(PyObject_CallMethodObjArgs((PyObject*)interface_object, create_vtable_name, NULL)));
+
+        SdBusSlotObject* new_slot_object CLEANUP_SD_BUS_SLOT = (SdBusSlotObject*)CALL_PYTHON_AND_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusSlot_class));
+
+        // Registration keeps the interface alive until the slot is closed
+        SdBusInterfaceExport* new_export = _SdBusInterface_new_export(interface_object, (PyObject*)self, 1);
+        if (NULL == new_export) {
+                return NULL;
+        }
+        Py_XINCREF(object_ref);
+        new_export->object_ref = object_ref;
+        Py_XINCREF(object_lookup);
+        new_export->object_lookup = object_lookup;
+
+        int return_value = 0;
+        if (NULL == object_lookup) {
+                return_value = sd_bus_add_object_vtable(self->sd_bus_ref, &new_slot_object->slot_ref, path_char_ptr, interface_name_char_ptr,
+                                                        interface_object->vtable, new_export->entries);
+        } else {
+                return_value = sd_bus_add_fallback_vtable(self->sd_bus_ref, &new_slot_object->slot_ref, path_char_ptr, interface_name_char_ptr,
+                                                          interface_object->vtable, _SdBusInterface_fallback_find, new_export->entries);
+        }
+        if (return_value < 0) {
+                _SdBusInterface_export_destroy(new_export->entries);
+                CALL_SD_BUS_AND_CHECK(return_value);
+        }
+        // Slot owns the export data
+        sd_bus_slot_set_destroy_callback(new_slot_object->slot_ref, _SdBusInterface_export_destroy);
+
+        Py_INCREF(new_slot_object);
+        return new_slot_object;
+}
+
+#ifndef Py_LIMITED_API
+static SdBusSlotObject* SdBus_add_shared_interface(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
+        SD_BUS_PY_CHECK_ARGS_NUMBER(4);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(0, _check_is_sdbus_interface);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(1, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(2, PyUnicode_Check);
+
+        SdBusInterfaceObject* interface_object = (SdBusInterfaceObject*)args[0];
+        const char* path_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[1]);
+        const char* interface_name_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[2]);
+        PyObject* served_object = args[3];
+#else
+static SdBusSlotObject* SdBus_add_shared_interface(SdBusObject* self, PyObject* args) {
+        SdBusInterfaceObject* interface_object = NULL;
+        const char* path_char_ptr = NULL;
+        const char* interface_name_char_ptr = NULL;
+        PyObject* served_object = NULL;
+        CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "OssO", &interface_object, &path_char_ptr, &interface_name_char_ptr, &served_object, NULL));
+#endif
+        // Export does not keep the served object alive
+        PyObject* object_ref CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyWeakref_NewRef(served_object, NULL));
+
+        return _SdBus_add_export_slot(self, interface_object, path_char_ptr, interface_name_char_ptr, object_ref, NULL);
+}
+
+#ifndef Py_LIMITED_API
+static SdBusSlotObject* SdBus_add_fallback_interface(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
+        SD_BUS_PY_CHECK_ARGS_NUMBER(4);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(0, _check_is_sdbus_interface);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(1, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(2, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(3, PyCallable_Check);
+
+        SdBusInterfaceObject* interface_object = (SdBusInterfaceObject*)args[0];
+        const char* prefix_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[1]);
+        const char* interface_name_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[2]);
+        PyObject* object_lookup = args[3];
+#else
+static SdBusSlotObject* SdBus_add_fallback_interface(SdBusObject* self, PyObject* args) {
+        SdBusInterfaceObject* interface_object = NULL;
+        const char* prefix_char_ptr = NULL;
+        const char* interface_name_char_ptr = NULL;
+        PyObject* object_lookup = NULL;
+        CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "OssO", &interface_object, &prefix_char_ptr, &interface_name_char_ptr, &object_lookup, NULL));
+#endif
+        return _SdBus_add_export_slot(self, interface_object, prefix_char_ptr, interface_name_char_ptr, NULL, object_lookup);
+}
+
 int _SdBus_signal_callback(sd_bus_message* m, void* userdata, sd_bus_error* Py_UNUSED(ret_error)) {
         PyObject* signal_callback = userdata;
 
@@ -421,7 +795,7 @@ static PyObject* SdBus_match_signal_async(SdBusObject* self, PyObject* args) {
         CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "zzzzO", &sender_service_char_ptr, &path_name_char_ptr, &interface_name_char_ptr, &member_name_char_ptr,
                                                 &signal_callback, NULL));
 #endif
-        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_get_or_bind_loop(self));
+        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_SdBus_get_or_bind_loop(self));
         PyObject* new_future CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyObject_CallMethod(running_loop, "create_future", ""));
 
         SdBusSlotObject* new_slot CLEANUP_SD_BUS_SLOT = (SdBusSlotObject*)CALL_PYTHON_AND_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusSlot_class));
@@ -439,6 +813,37 @@ static PyObject* SdBus_match_signal_async(SdBusObject* self, PyObject* args) {
         return new_future;
 }
 
+#ifndef Py_LIMITED_API
+static PyObject* SdBus_add_match_async(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
+        SD_BUS_PY_CHECK_ARGS_NUMBER(2);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(0, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(1, PyCallable_Check);
+
+        const char* match_rule_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[0]);
+        PyObject* signal_callback = args[1];
+#else
+static PyObject* SdBus_add_match_async(SdBusObject* self, PyObject* args) {
+        const char* match_rule_char_ptr = NULL;
+        PyObject* signal_callback = NULL;
+        CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "sO", &match_rule_char_ptr, &signal_callback, NULL));
+#endif
+        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_SdBus_get_or_bind_loop(self));
+        PyObject* new_future CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyObject_CallMethod(running_loop, "create_future", ""));
+
+        SdBusSlotObject* new_slot CLEANUP_SD_BUS_SLOT = (SdBusSlotObject*)CALL_PYTHON_AND_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusSlot_class));
+
+        // Bind lifetime of the slot to the Future
+        CALL_PYTHON_INT_CHECK(PyObject_SetAttrString(new_future, "_sd_bus_slot", (PyObject*)new_slot));
+        CALL_PYTHON_INT_CHECK(PyObject_SetAttrString(new_future, "_sd_bus_signal_callback", signal_callback));
+
+        CALL_SD_BUS_AND_CHECK(sd_bus_add_match_async(self->sd_bus_ref, &new_slot->slot_ref, match_rule_char_ptr, _SdBus_signal_callback,
+                                                     _SdBus_match_signal_instant_callback, new_future));
+
+        CHECK_ASYNCIO_WATCHERS;
+        Py_INCREF(new_future);
+        return new_future;
+}
+
 int SdBus_request_name_callback(sd_bus_message* m,
                                 void* userdata,  // Should be the asyncio.Future
                                 sd_bus_error* Py_UNUSED(ret_error)) {
@@ -503,7 +908,7 @@ static PyObject* SdBus_request_name_async(SdBusObject* self, PyObject* args) {
         CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "sK", &service_name_char_ptr, &flags_long_long, NULL));
         uint64_t flags = (uint64_t)flags_long_long;
 #endif
-        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_get_or_bind_loop(self));
+        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_SdBus_get_or_bind_loop(self));
         PyObject* new_future = CALL_PYTHON_AND_CHECK(PyObject_CallMethod(running_loop, "create_future", ""));
         SdBusSlotObject* new_slot_object CLEANUP_SD_BUS_SLOT = (SdBusSlotObject*)CALL_PYTHON_AND_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusSlot_class));
 
@@ -573,6 +978,145 @@ static SdBusSlotObject* SdBus_add_object_manager(SdBusObject* self, PyObject* ar
         return new_slot_object;
 }
 
+static int _SdBus_method_call_filter_callback(sd_bus_message* m, void* userdata, sd_bus_error* Py_UNUSED(ret_error)) {
+        // Filter data tuple: path bytes, interface bytes, member bytes, callback
+        PyObject* filter_tuple = userdata;
+
+        // Interface field is optional in method calls, match any
+        // interface first and then check it only if present.
+        if (!sd_bus_message_is_method_call(m, NULL, PyBytes_AsString(PyTuple_GetItem(filter_tuple, 2)))) {
+                return 0;
+        }
+
+        const char* interface_char_ptr = sd_bus_message_get_interface(m);
+        if (NULL != interface_char_ptr && 0 != strcmp(interface_char_ptr, PyBytes_AsString(PyTuple_GetItem(filter_tuple, 1)))) {
+                return 0;
+        }
+
+        const char* path_char_ptr = sd_bus_message_get_path(m);
+        if (NULL == path_char_ptr || 0 != strcmp(path_char_ptr, PyBytes_AsString(PyTuple_GetItem(filter_tuple, 0)))) {
+                return 0;
+        }
+
+        SdBusMessageObject* new_message_object CLEANUP_SD_BUS_MESSAGE =
+            (SdBusMessageObject*)CALL_PYTHON_CHECK_RETURN_NEG1(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusMessage_class));
+        _SdBusMessage_set_messsage(new_message_object, m);
+
+        Py_XDECREF(CALL_PYTHON_CHECK_RETURN_NEG1(PyObject_CallFunctionObjArgs(PyTuple_GetItem(filter_tuple, 3), new_message_object, NULL)));
+
+        // Message was handled and will not be dispatched to the objects
+        return 1;
+}
+
+#ifndef Py_LIMITED_API
+static SdBusSlotObject* SdBus_add_method_call_filter(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
+        SD_BUS_PY_CHECK_ARGS_NUMBER(4);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(0, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(1, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(2, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(3, PyCallable_Check);
+
+        PyObject* path_str = args[0];
+        PyObject* interface_name_str = args[1];
+        PyObject* member_name_str = args[2];
+        PyObject* filter_callback = args[3];
+#else
+static SdBusSlotObject* SdBus_add_method_call_filter(SdBusObject* self, PyObject* args) {
+        PyObject* path_str = NULL;
+        PyObject* interface_name_str = NULL;
+        PyObject* member_name_str = NULL;
+        PyObject* filter_callback = NULL;
+        CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "UUUO", &path_str, &interface_name_str, &member_name_str, &filter_callback, NULL));
+#endif
+        PyObject* path_bytes CLEANUP_PY_OBJECT = SD_BUS_PY_UNICODE_AS_BYTES(path_str);
+        PyObject* interface_name_bytes CLEANUP_PY_OBJECT = SD_BUS_PY_UNICODE_AS_BYTES(interface_name_str);
+        PyObject* member_name_bytes CLEANUP_PY_OBJECT = SD_BUS_PY_UNICODE_AS_BYTES(member_name_str);
+        PyObject* filter_tuple = CALL_PYTHON_AND_CHECK(PyTuple_Pack(4, path_bytes, interface_name_bytes, member_name_bytes, filter_callback));
+
+        SdBusSlotObject* new_slot_object CLEANUP_SD_BUS_SLOT = (SdBusSlotObject*)SD_BUS_PY_CLASS_DUNDER_NEW(SdBusSlot_class);
+        if (NULL == new_slot_object) {
+                Py_DECREF(filter_tuple);
+                return NULL;
+        }
+
+        int return_value = sd_bus_add_filter(self->sd_bus_ref, &new_slot_object->slot_ref, _SdBus_method_call_filter_callback, filter_tuple);
+        if (return_value < 0) {
+                Py_DECREF(filter_tuple);
+                CALL_SD_BUS_AND_CHECK(return_value);
+        }
+        // Slot owns the filter data
+        sd_bus_slot_set_destroy_callback(new_slot_object->slot_ref, (sd_bus_destroy_t)Py_DecRef);
+
+        Py_INCREF(new_slot_object);
+        return new_slot_object;
+}
+
+static int _SdBus_node_enumerator_callback(sd_bus* Py_UNUSED(bus), const char* prefix, void* userdata, char*** ret_nodes, sd_bus_error* Py_UNUSED(ret_error)) {
+        PyObject* enumerator_callback = userdata;
+
+        PyObject* prefix_str CLEANUP_PY_OBJECT = CALL_PYTHON_CHECK_RETURN_NEG1(PyUnicode_FromString(prefix));
+        PyObject* nodes_iterable CLEANUP_PY_OBJECT = CALL_PYTHON_CHECK_RETURN_NEG1(PyObject_CallFunctionObjArgs(enumerator_callback, prefix_str, NULL));
+        PyObject* nodes_list CLEANUP_PY_OBJECT = CALL_PYTHON_CHECK_RETURN_NEG1(PySequence_List(nodes_iterable));
+
+        Py_ssize_t num_of_nodes = PyList_Size(nodes_list);
+        // sd-bus frees the returned array with strv_free
+        char** nodes = calloc((size_t)num_of_nodes + 1, sizeof(char*));
+        if (NULL == nodes) {
+                PyErr_NoMemory();
+                return -1;
+        }
+
+        for (Py_ssize_t i = 0; i < num_of_nodes; ++i) {
+                PyObject* node_str = CALL_PYTHON_GOTO_FAIL(PyList_GetItem(nodes_list, i));
+#ifndef Py_LIMITED_API
+                const char* node_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR_GOTO_FAIL(node_str);
+#else
+                PyObject* node_bytes CLEANUP_PY_OBJECT = SD_BUS_PY_UNICODE_AS_BYTES_GOTO_FAIL(node_str);
+                const char* node_char_ptr = SD_BUS_PY_BYTES_AS_CHAR_PTR_GOTO_FAIL(node_bytes);
+#endif
+                nodes[i] = strdup(node_char_ptr);
+                if (NULL == nodes[i]) {
+                        PyErr_NoMemory();
+                        goto fail;
+                }
+        }
+
+        *ret_nodes = nodes;
+        return 1;
+fail:
+        for (Py_ssize_t i = 0; i < num_of_nodes; ++i) {
+                free(nodes[i]);
+        }
+        free(nodes);
+        return -1;
+}
+
+#ifndef Py_LIMITED_API
+static SdBusSlotObject* SdBus_add_node_enumerator(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
+        SD_BUS_PY_CHECK_ARGS_NUMBER(2);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(0, PyUnicode_Check);
+        SD_BUS_PY_CHECK_ARG_CHECK_FUNC(1, PyCallable_Check);
+
+        const char* path_char_ptr = SD_BUS_PY_UNICODE_AS_CHAR_PTR(args[0]);
+        PyObject* enumerator_callback = args[1];
+#else
+static SdBusSlotObject* SdBus_add_node_enumerator(SdBusObject* self, PyObject* args) {
+        const char* path_char_ptr = NULL;
+        PyObject* enumerator_callback = NULL;
+        CALL_PYTHON_BOOL_CHECK(PyArg_ParseTuple(args, "sO", &path_char_ptr, &enumerator_callback, NULL));
+#endif
+        SdBusSlotObject* new_slot_object CLEANUP_SD_BUS_SLOT = (SdBusSlotObject*)CALL_PYTHON_AND_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusSlot_class));
+
+        CALL_SD_BUS_AND_CHECK(
+            sd_bus_add_node_enumerator(self->sd_bus_ref, &new_slot_object->slot_ref, path_char_ptr, _SdBus_node_enumerator_callback, enumerator_callback));
+
+        Py_INCREF(enumerator_callback);
+        sd_bus_slot_set_destroy_callback(new_slot_object->slot_ref, (sd_bus_destroy_t)Py_DecRef);
+
+        Py_INCREF(new_slot_object);
+        return new_slot_object;
+}
+
 #ifndef Py_LIMITED_API
 static PyObject* SdBus_emit_object_added(SdBusObject* self, PyObject* const* args, Py_ssize_t nargs) {
         SD_BUS_PY_CHECK_ARGS_NUMBER(1);
@@ -607,6 +1151,13 @@ static PyObject* SdBus_emit_object_removed(SdBusObject* self, PyObject* args) {
 
 static PyObject* SdBus_close(SdBusObject* self, PyObject* Py_UNUSED(args)) {
         sd_bus_close(self->sd_bus_ref);
+        if (NULL != self->drain_waiters) {
+                PyObject* closed_exception CLEANUP_PY_OBJECT =
+                    CALL_PYTHON_AND_CHECK(PyObject_CallFunction(exception_lib, "s", "Connection closed before the write queue was drained"));
+                if (_SdBus_wake_drain_waiters(self, closed_exception) < 0) {
+                        return NULL;
+                }
+        }
         if (NULL != self->loop && NULL != self->bus_fd) {
                 Py_XDECREF(CALL_PYTHON_AND_CHECK(PyObject_CallMethodObjArgs(self->loop, remove_reader_str, self->bus_fd, NULL)));
                 Py_XDECREF(CALL_PYTHON_AND_CHECK(PyObject_CallMethodObjArgs(self->loop, remove_writer_str, self->bus_fd, NULL)));
@@ -641,7 +1192,7 @@ static inline int sd_bus_get_timeout_uint_max_on_closed(SdBusObject* self, uint6
 }
 
 static PyObject* SdBus_asyncio_update_fd_watchers(SdBusObject* self) {
-        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_get_or_bind_loop(self));
+        PyObject* running_loop = CALL_PYTHON_AND_CHECK(_SdBus_get_or_bind_loop(self));
         PyObject* drive_method CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyObject_GetAttrString((PyObject*)self, "process"));
 
         if (NULL == self->timer_fd) {
@@ -700,6 +1251,13 @@ static PyObject* SdBus_asyncio_update_fd_watchers(SdBusObject* self) {
 static PyMethodDef SdBus_methods[] = {
     {"call", (PyCFunction)SdBus_call, METH_O, PyDoc_STR("Send message and block until the reply.")},
     {"call_async", (PyCFunction)SdBus_call_async, METH_O, PyDoc_STR("Async send message, returns awaitable future.")},
+    {"send_messages", (PyCFunction)SdBus_send_messages, METH_O, PyDoc_STR("Send all messages from the iterable and update watchers once.")},
+    {"negotiate_timestamp", (PyCFunction)SdBus_negotiate_timestamp, METH_O, PyDoc_STR("Request receive timestamps to be attached to incoming messages.")},
+    {"flush", (PyCFunction)SdBus_flush, METH_NOARGS, PyDoc_STR("Send queued messages and update watchers.")},
+    {"drain", (SD_BUS_PY_FUNC_TYPE)SdBus_drain, SD_BUS_PY_METH,
+     PyDoc_STR("Returns a Future that completes once the write queue has at most the given number of messages.")},
+    {"call_method_async", (SD_BUS_PY_FUNC_TYPE)SdBus_call_method_async, SD_BUS_PY_METH,
+     PyDoc_STR("Build and send method call, returns awaitable future of decoded reply.")},
     {"process", (PyCFunction)SdBus_process, METH_NOARGS, PyDoc_STR("Process pending IO work.")},
     {"get_fd", (SD_BUS_PY_FUNC_TYPE)SdBus_get_fd, SD_BUS_PY_METH, PyDoc_STR("Get file descriptor to poll on.")},
     {"new_method_call_message", (SD_BUS_PY_FUNC_TYPE)SdBus_new_method_call_message, SD_BUS_PY_METH, PyDoc_STR("Create new empty method call message.")},
@@ -707,11 +1265,21 @@ static PyMethodDef SdBus_methods[] = {
     {"new_property_set_message", (SD_BUS_PY_FUNC_TYPE)SdBus_new_property_set_message, SD_BUS_PY_METH, PyDoc_STR("Create new empty property set message.")},
     {"new_signal_message", (SD_BUS_PY_FUNC_TYPE)SdBus_new_signal_message, SD_BUS_PY_METH, PyDoc_STR("Create new empty signal message.")},
     {"add_interface", (SD_BUS_PY_FUNC_TYPE)SdBus_add_interface, SD_BUS_PY_METH, PyDoc_STR("Add interface to the bus.")},
+    {"add_shared_interface", (SD_BUS_PY_FUNC_TYPE)SdBus_add_shared_interface, SD_BUS_PY_METH,
+     PyDoc_STR("Add interface shared by multiple objects serving the given object. Returns SdBusSlot.")},
+    {"add_fallback_interface", (SD_BUS_PY_FUNC_TYPE)SdBus_add_fallback_interface, SD_BUS_PY_METH,
+     PyDoc_STR("Add interface serving every object under the path prefix. Returns SdBusSlot.")},
     {"match_signal_async", (SD_BUS_PY_FUNC_TYPE)SdBus_match_signal_async, SD_BUS_PY_METH,
      PyDoc_STR("Register signal callback asynchronously. Returns a Future that returns a SdBusSlot.")},
+    {"add_match_async", (SD_BUS_PY_FUNC_TYPE)SdBus_add_match_async, SD_BUS_PY_METH,
+     PyDoc_STR("Register match rule callback asynchronously. Returns a Future that returns a SdBusSlot.")},
     {"request_name_async", (SD_BUS_PY_FUNC_TYPE)SdBus_request_name_async, SD_BUS_PY_METH, PyDoc_STR("Request D-Bus name async.")},
     {"request_name", (SD_BUS_PY_FUNC_TYPE)SdBus_request_name, SD_BUS_PY_METH, PyDoc_STR("Request D-Bus name blocking.")},
     {"add_object_manager", (SD_BUS_PY_FUNC_TYPE)SdBus_add_object_manager, SD_BUS_PY_METH, PyDoc_STR("Add object manager at the path.")},
+    {"add_node_enumerator", (SD_BUS_PY_FUNC_TYPE)SdBus_add_node_enumerator, SD_BUS_PY_METH,
+     PyDoc_STR("Add callback listing child objects of the path.")},
+    {"add_method_call_filter", (SD_BUS_PY_FUNC_TYPE)SdBus_add_method_call_filter, SD_BUS_PY_METH,
+     PyDoc_STR("Add callback handling method calls before they are dispatched to objects.")},
     {"emit_object_added", (SD_BUS_PY_FUNC_TYPE)SdBus_emit_object_added, SD_BUS_PY_METH, PyDoc_STR("Emit signal that object was added.")},
     {"emit_object_removed", (SD_BUS_PY_FUNC_TYPE)SdBus_emit_object_removed, SD_BUS_PY_METH, PyDoc_STR("Emit signal that object was removed.")},
     {"close", (PyCFunction)SdBus_close, METH_NOARGS, PyDoc_STR("Close connection.")},
@@ -752,10 +1320,28 @@ static int SdBus_method_call_timeout_usec_setter(SdBusObject* self, PyObject* ne
         return 0;
 }
 
+static PyObject* SdBus_n_queued_write_getter(SdBusObject* self, void* Py_UNUSED(closure)) {
+        uint64_t n_queued = 0;
+        if (_SdBus_get_n_queued_write(self, &n_queued) < 0) {
+                return NULL;
+        }
+
+        return PyLong_FromUnsignedLongLong((unsigned long long)n_queued);
+}
+
+static PyObject* SdBus_n_queued_read_getter(SdBusObject* self, void* Py_UNUSED(closure)) {
+        uint64_t n_queued = 0;
+        CALL_SD_BUS_AND_CHECK(sd_bus_get_n_queued_read(self->sd_bus_ref, &n_queued));
+
+        return PyLong_FromUnsignedLongLong((unsigned long long)n_queued);
+}
+
 static PyGetSetDef SdBus_properies[] = {
     {"address", (getter)SdBus_address_getter, NULL, PyDoc_STR("Bus address."), NULL},
     {"method_call_timeout_usec", (getter)SdBus_method_call_timeout_usec_getter, (setter)SdBus_method_call_timeout_usec_setter,
      PyDoc_STR("D-Bus call timeout in microseconds."), NULL},
+    {"n_queued_write", (getter)SdBus_n_queued_write_getter, NULL, PyDoc_STR("Number of messages waiting to be written."), NULL},
+    {"n_queued_read", (getter)SdBus_n_queued_read_getter, NULL, PyDoc_STR("Number of read messages waiting to be processed."), NULL},
     {0},
 };
 
@@ -31,6 +31,8 @@ static int SdBusInterface_init(SdBusInterfaceObject* self, PyObject* Py_UNUSED(a
         self->property_set_dict = CALL_PYTHON_CHECK_RETURN_NEG1(PyDict_New());
         self->signal_list = CALL_PYTHON_CHECK_RETURN_NEG1(PyList_New((Py_ssize_t)0));
         self->vtable = NULL;
+        self->member_records = NULL;
+        self->num_of_member_records = 0;
         return 0;
 }
 
@@ -45,6 +47,13 @@ static void SdBusInterface_dealloc(SdBusInterfaceObject* self) {
         if (self->vtable) {
                 free(self->vtable);
         }
+        if (self->member_records) {
+                for (Py_ssize_t i = 0; i < self->num_of_member_records; ++i) {
+                        Py_XDECREF(self->member_records[i].callback);
+                        Py_XDECREF(self->member_records[i].setter);
+                }
+                free(self->member_records);
+        }
 
         SD_BUS_DEALLOC_TAIL;
 }
@@ -206,6 +215,50 @@ static int _SdBusInterface_property_set_callback(sd_bus* bus,
                                                  void* userdata,
                                                  sd_bus_error* ret_error);
 
+static inline size_t _SdBusInterface_entry_offset(SdBusInterfaceObject* self, SdBusInterfaceMemberRecord* record) {
+        // Entries of the export array are in the same order as records
+        return (size_t)(record - self->member_records) * sizeof(SdBusInterfaceExportEntry);
+}
+
+static inline SdBusInterfaceExport* _SdBusInterface_export_from_entries(void* entries) {
+        return (SdBusInterfaceExport*)((char*)entries - offsetof(SdBusInterfaceExport, entries));
+}
+
+SdBusInterfaceExport* _SdBusInterface_new_export(SdBusInterfaceObject* self, PyObject* bus, int owns_interface) {
+        SdBusInterfaceExport* new_export =
+            malloc(sizeof(SdBusInterfaceExport) + (size_t)self->num_of_member_records * sizeof(SdBusInterfaceExportEntry));
+        if (NULL == new_export) {
+                PyErr_NoMemory();
+                return NULL;
+        }
+
+        if (owns_interface) {
+                Py_INCREF(self);
+        }
+        new_export->interface = self;
+        new_export->owns_interface = owns_interface;
+        new_export->bus = bus;
+        new_export->object_ref = NULL;
+        new_export->object_lookup = NULL;
+        for (Py_ssize_t i = 0; i < self->num_of_member_records; ++i) {
+                new_export->entries[i].record = &self->member_records[i];
+                new_export->entries[i].export = new_export;
+        }
+
+        return new_export;
+}
+
+void _SdBusInterface_export_destroy(void* entries) {
+        // Slot userdata is the entries array of the export
+        SdBusInterfaceExport* export = _SdBusInterface_export_from_entries(entries);
+        Py_XDECREF(export->object_ref);
+        Py_XDECREF(export->object_lookup);
+        if (export->owns_interface) {
+                Py_DECREF(export->interface);
+        }
+        free(export);
+}
+
 static PyObject* SdBusInterface_create_vtable(SdBusInterfaceObject* self, PyObject* const* Py_UNUSED(args)) {
         if (self->vtable) {
                 Py_RETURN_NONE;
@@ -220,6 +273,16 @@ static PyObject* SdBusInterface_create_vtable(SdBusInterfaceObject* self, PyObje
                 return PyErr_NoMemory();
         }
 
+        // Interface might have no methods or properties at all
+        self->member_records = calloc(num_of_properties + num_of_methods + 1, sizeof(SdBusInterfaceMemberRecord));
+        if (self->member_records == NULL) {
+                free(self->vtable);
+                self->vtable = NULL;
+                return PyErr_NoMemory();
+        }
+        self->num_of_member_records = num_of_properties + num_of_methods;
+        SdBusInterfaceMemberRecord* current_record = self->member_records;
+
         sd_bus_vtable start_vtable = SD_BUS_VTABLE_START(0);
         self->vtable[0] = start_vtable;
         Py_ssize_t current_index = 1;
@@ -247,9 +310,19 @@ static PyObject* SdBusInterface_create_vtable(SdBusInterfaceObject* self, PyObje
                         return NULL;
                 }
 
+                PyObject* callback_object = CALL_PYTHON_AND_CHECK(PyDict_GetItemWithError(self->method_dict, method_name_object));
+                PyObject* is_coroutine_test_object CLEANUP_PY_OBJECT =
+                    CALL_PYTHON_AND_CHECK(PyObject_CallFunctionObjArgs(is_coroutine_function, callback_object, NULL));
+
+                Py_INCREF(callback_object);
+                current_record->callback = callback_object;
+                current_record->is_coroutine = (Py_True == is_coroutine_test_object);
+
                 sd_bus_vtable temp_vtable = SD_BUS_METHOD_WITH_NAMES_OFFSET(method_name_char_ptr, input_signature_char_ptr, argument_names_char_ptr,
-                                                                            result_signature_char_ptr, , _SdBusInterface_callback, 0, flags_long);
+                                                                            result_signature_char_ptr, , _SdBusInterface_callback,
+                                                                            _SdBusInterface_entry_offset(self, current_record), flags_long);
                 self->vtable[current_index] = temp_vtable;
+                ++current_record;
         }
 
         for (Py_ssize_t i = 0; i < num_of_properties; (
@@ -272,24 +345,33 @@ static PyObject* SdBusInterface_create_vtable(SdBusInterfaceObject* self, PyObje
                         return NULL;
                 }
 
+                PyObject* getter_object = CALL_PYTHON_AND_CHECK(PyDict_GetItemWithError(self->property_get_dict, property_name_str));
+                Py_INCREF(getter_object);
+                current_record->callback = getter_object;
+                current_record->is_coroutine = 0;
+                size_t record_offset = _SdBusInterface_entry_offset(self, current_record);
+
                 if (setter_or_none == Py_None) {
                         sd_bus_vtable temp_vtable = SD_BUS_PROPERTY(property_name_char_ptr,                 // Name
                                                                     property_signature_const_char,          // Signature
                                                                     _SdBusInterface_property_get_callback,  // Get
-                                                                    0,                                      // Offset
+                                                                    record_offset,                          // Offset
                                                                     flags_long                              // Flags
                         );
                         self->vtable[current_index] = temp_vtable;
                 } else {
+                        Py_INCREF(setter_or_none);
+                        current_record->setter = setter_or_none;
                         sd_bus_vtable temp_vtable = SD_BUS_WRITABLE_PROPERTY(property_name_char_ptr,                 // Name
                                                                              property_signature_const_char,          // Signature
                                                                              _SdBusInterface_property_get_callback,  // Get
                                                                              _SdBusInterface_property_set_callback,  // Set
-                                                                             0,                                      // Offset
+                                                                             record_offset,                          // Offset
                                                                              flags_long                              // Flags
                         );
                         self->vtable[current_index] = temp_vtable;
                 }
+                ++current_record;
         }
 
         for (Py_ssize_t i = 0; i < num_of_signals; (
@@ -385,30 +467,90 @@ fail:
 
 #define METHOD_CALLBACK_ERROR_CHECK(py_function) CALL_PYTHON_FAIL_ACTION(py_function, return set_dbus_error_from_python_exception(ret_error))
 
-static int _SdBusInterface_callback(sd_bus_message* m, void* userdata, sd_bus_error* ret_error) {
-        // TODO: Better error handling
-        SdBusInterfaceObject* self = userdata;
-        // Get the member name from the message
-        const char* member_char_ptr = sd_bus_message_get_member(m);
-        PyObject* member_name_bytes CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(PyBytes_FromString(member_char_ptr));
-        PyObject* callback_object = METHOD_CALLBACK_ERROR_CHECK(PyDict_GetItem(self->method_dict, member_name_bytes));
+static PyObject* _SdBusInterface_lookup_object(SdBusInterfaceExport* export, const char* path) {
+        PyObject* path_str CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyUnicode_FromString(path));
+        return PyObject_CallFunctionObjArgs(export->object_lookup, path_str, NULL);
+}
+
+int _SdBusInterface_fallback_find(sd_bus* Py_UNUSED(bus),
+                                  const char* path,
+                                  const char* Py_UNUSED(interface),
+                                  void* userdata,
+                                  void** ret_found,
+                                  sd_bus_error* ret_error) {
+        SdBusInterfaceExport* export = _SdBusInterface_export_from_entries(userdata);
+        PyObject* found_object CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(_SdBusInterface_lookup_object(export, path));
+
+        if (Py_None == found_object) {
+                return 0;
+        }
 
-        PyObject* running_loop CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(PyObject_CallFunctionObjArgs(asyncio_get_running_loop, NULL));
+        // Remember the found object so that member callbacks
+        // dispatched right after do not call the lookup again.
+        // Lookup might be a factory creating objects on demand.
+        // Bus releases it once the message is processed.
+        SdBusObject* bus = (SdBusObject*)export->bus;
+        PyObject* found_path_bytes = METHOD_CALLBACK_ERROR_CHECK(PyBytes_FromString(path));
+        Py_XDECREF(bus->found_path_bytes);
+        bus->found_path_bytes = found_path_bytes;
+        Py_XDECREF(bus->found_object);
+        Py_INCREF(found_object);
+        bus->found_object = found_object;
+        bus->found_export = export;
+
+        *ret_found = export->entries;
+        return 1;
+}
+
+static PyObject* _SdBusInterface_call_member(SdBusInterfaceExportEntry* entry, PyObject* callback, const char* path, PyObject* message) {
+        SdBusInterfaceExport* export = entry->export;
+        if (NULL != export->object_ref) {
+                // Shared vtable: callbacks are unbound and receive the served object
+                PyObject* served_object CLEANUP_PY_OBJECT = CALL_PYTHON_AND_CHECK(PyObject_CallFunctionObjArgs(export->object_ref, NULL));
+                if (Py_None == served_object) {
+                        PyErr_SetString(PyExc_RuntimeError, "Local object no longer exists!");
+                        return NULL;
+                }
+                return PyObject_CallFunctionObjArgs(callback, served_object, message, NULL);
+        }
+        if (NULL == export->object_lookup) {
+                return PyObject_CallFunctionObjArgs(callback, message, NULL);
+        }
+        // Fallback vtable: served object is found by its path
+        SdBusObject* bus = (SdBusObject*)export->bus;
+        PyObject* found_object CLEANUP_PY_OBJECT = NULL;
+        if (export == bus->found_export && 0 == strcmp(SD_BUS_PY_BYTES_AS_CHAR_PTR(bus->found_path_bytes), path)) {
+                Py_INCREF(bus->found_object);
+                found_object = bus->found_object;
+        } else {
+                found_object = CALL_PYTHON_AND_CHECK(_SdBusInterface_lookup_object(export, path));
+        }
+        if (Py_None == found_object) {
+                PyErr_Format(PyExc_LookupError, "No object found at %s", path);
+                return NULL;
+        }
+        return PyObject_CallFunctionObjArgs(callback, found_object, message, NULL);
+}
+
+static int _SdBusInterface_callback(sd_bus_message* m, void* userdata, sd_bus_error* ret_error) {
+        SdBusInterfaceExportEntry* entry = userdata;
+        SdBusInterfaceMemberRecord* record = entry->record;
 
         PyObject* new_message CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusMessage_class));
 
         _SdBusMessage_set_messsage((SdBusMessageObject*)new_message, m);
 
-        PyObject* is_coroutine_test_object CLEANUP_PY_OBJECT =
-            METHOD_CALLBACK_ERROR_CHECK(PyObject_CallFunctionObjArgs(is_coroutine_function, callback_object, NULL));
+        const char* path_char_ptr = sd_bus_message_get_path(m);
 
-        if (Py_True == is_coroutine_test_object) {
+        if (record->is_coroutine) {
+                PyObject* running_loop = METHOD_CALLBACK_ERROR_CHECK(_SdBus_get_or_bind_loop((SdBusObject*)entry->export->bus));
                 // Create coroutine
-                PyObject* coroutine_activated CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(PyObject_CallFunctionObjArgs(callback_object, new_message, NULL));
+                PyObject* coroutine_activated CLEANUP_PY_OBJECT =
+                    METHOD_CALLBACK_ERROR_CHECK(_SdBusInterface_call_member(entry, record->callback, path_char_ptr, new_message));
 
                 Py_XDECREF(METHOD_CALLBACK_ERROR_CHECK(PyObject_CallMethodObjArgs(running_loop, create_task_str, coroutine_activated, NULL)));
         } else {
-                Py_XDECREF(METHOD_CALLBACK_ERROR_CHECK(PyObject_CallFunctionObjArgs(callback_object, new_message, NULL)));
+                Py_XDECREF(METHOD_CALLBACK_ERROR_CHECK(_SdBusInterface_call_member(entry, record->callback, path_char_ptr, new_message)));
         }
 
         sd_bus_error_set(ret_error, NULL, NULL);
@@ -417,42 +559,33 @@ static int _SdBusInterface_callback(sd_bus_message* m, void* userdata, sd_bus_er
 }
 
 static int _SdBusInterface_property_get_callback(sd_bus* Py_UNUSED(bus),
-                                                 const char* Py_UNUSED(path),
+                                                 const char* path,
                                                  const char* Py_UNUSED(interface),
-                                                 const char* property,
+                                                 const char* Py_UNUSED(property),
                                                  sd_bus_message* reply,
                                                  void* userdata,
                                                  sd_bus_error* ret_error) {
-        SdBusInterfaceObject* self = userdata;
-        PyObject* property_name_bytes CLEANUP_PY_OBJECT = NULL;
-        PyObject* get_call = NULL;
-        PyObject* new_message CLEANUP_PY_OBJECT = NULL;
+        SdBusInterfaceExportEntry* entry = userdata;
 
-        property_name_bytes = METHOD_CALLBACK_ERROR_CHECK(PyBytes_FromString(property));
-        get_call = METHOD_CALLBACK_ERROR_CHECK(PyDict_GetItem(self->property_get_dict, property_name_bytes));
-
-        new_message = METHOD_CALLBACK_ERROR_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusMessage_class));
+        PyObject* new_message CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusMessage_class));
         _SdBusMessage_set_messsage((SdBusMessageObject*)new_message, reply);
 
-        Py_XDECREF(METHOD_CALLBACK_ERROR_CHECK(PyObject_CallFunctionObjArgs(get_call, new_message, NULL)));
+        Py_XDECREF(METHOD_CALLBACK_ERROR_CHECK(_SdBusInterface_call_member(entry, entry->record->callback, path, new_message)));
         return 0;
 }
 
 static int _SdBusInterface_property_set_callback(sd_bus* Py_UNUSED(bus),
-                                                 const char* Py_UNUSED(path),
+                                                 const char* path,
                                                  const char* Py_UNUSED(interface),
-                                                 const char* property,
+                                                 const char* Py_UNUSED(property),
                                                  sd_bus_message* value,
                                                  void* userdata,
                                                  sd_bus_error* ret_error) {
-        SdBusInterfaceObject* self = userdata;
-        PyObject* property_name_bytes CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(PyBytes_FromString(property));
-
-        PyObject* set_call = METHOD_CALLBACK_ERROR_CHECK(PyDict_GetItem(self->property_set_dict, property_name_bytes));
+        SdBusInterfaceExportEntry* entry = userdata;
 
         PyObject* new_message CLEANUP_PY_OBJECT = METHOD_CALLBACK_ERROR_CHECK(SD_BUS_PY_CLASS_DUNDER_NEW(SdBusMessage_class));
         _SdBusMessage_set_messsage((SdBusMessageObject*)new_message, value);
 
-        Py_XDECREF(METHOD_CALLBACK_ERROR_CHECK(PyObject_CallFunctionObjArgs(set_call, new_message, NULL)));
+        Py_XDECREF(METHOD_CALLBACK_ERROR_CHECK(_SdBusInterface_call_member(entry, entry->record->setter, path, new_message)));
         return 0;
 }
@@ -18,11 +18,24 @@
     License along with this library; if not, write to the Free Software
     Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 */
+#include <errno.h>
 #include <fcntl.h>
 #include "sd_bus_internals.h"
 
+// Time SdBus.process started dispatching the messages on this thread.
+// Zero if the bus does not attach timestamps.
+static _Thread_local uint64_t dispatch_monotonic_usec = 0;
+static _Thread_local uint64_t dispatch_realtime_usec = 0;
+
+void _SdBusMessage_set_dispatch_time(uint64_t monotonic_usec, uint64_t realtime_usec) {
+        dispatch_monotonic_usec = monotonic_usec;
+        dispatch_realtime_usec = realtime_usec;
+}
+
 void _SdBusMessage_set_messsage(SdBusMessageObject* self, sd_bus_message* new_message) {
         self->message_ref = sd_bus_message_ref(new_message);
+        self->dispatch_monotonic_usec = dispatch_monotonic_usec;
+        self->dispatch_realtime_usec = dispatch_realtime_usec;
 }
 
 static void SdBusMessage_dealloc(SdBusMessageObject* self) {
@@ -601,6 +614,29 @@ static PyObject* _parse_complete(PyObject* complete_obj, _Parse_state* parser_st
         Py_RETURN_NONE;
 }
 
+int _SdBusMessage_append_data_tuple(sd_bus_message* message, const char* signature_char_ptr, PyObject* args_tuple) {
+        _Parse_state parser_state = {
+            .message = message,
+            .container_char_ptr = signature_char_ptr,
+            .index = 0,
+            .max_index = strlen(signature_char_ptr),
+        };
+
+        Py_ssize_t num_args = PyTuple_Size(args_tuple);
+        if (num_args < 0) {
+                return -1;
+        }
+
+        for (Py_ssize_t i = 0; i < num_args; ++i) {
+                PyObject* parse_result CLEANUP_PY_OBJECT = _parse_complete(PyTuple_GetItem(args_tuple, i), &parser_state);
+                if (parse_result == NULL) {
+                        return -1;
+                }
+        }
+
+        return 0;
+}
+
 #ifndef Py_LIMITED_API
 static PyObject* SdBusMessage_append_data(SdBusMessageObject* self, PyObject* const* args, Py_ssize_t nargs) {
         if (nargs < 2) {
@@ -706,6 +742,17 @@ static SdBusMessageObject* SdBusMessage_create_reply(SdBusMessageObject* self, P
         return new_reply_message;
 }
 
+static PyObject* SdBusMessage_append_contents_from(SdBusMessageObject* self, PyObject* arg) {
+        SdBusMessageObject* source_message = NULL;
+        CALL_PYTHON_BOOL_CHECK(PyArg_Parse(arg, "O!", SdBusMessage_class, &source_message, NULL));
+
+        // Source message must be sealed to be read
+        CALL_SD_BUS_AND_CHECK(sd_bus_message_rewind(source_message->message_ref, 1));
+        CALL_SD_BUS_AND_CHECK(sd_bus_message_copy(self->message_ref, source_message->message_ref, 1));
+
+        Py_RETURN_NONE;
+}
+
 static PyObject* SdBusMessage_send(SdBusMessageObject* self, PyObject* Py_UNUSED(args)) {
         CALL_SD_BUS_AND_CHECK(sd_bus_send(NULL, self->message_ref, NULL));
 
@@ -959,8 +1006,8 @@ static PyObject* iter_tuple_or_single(_Parse_state* parser) {
         }
 }
 
-static PyObject* SdBusMessage_get_contents2(SdBusMessageObject* self, PyObject* Py_UNUSED(args)) {
-        const char* message_signature = sd_bus_message_get_signature(self->message_ref, 0);
+PyObject* _SdBusMessage_get_contents(sd_bus_message* message) {
+        const char* message_signature = sd_bus_message_get_signature(message, 0);
 
         if (message_signature == NULL) {
                 PyErr_SetString(PyExc_TypeError, "Failed to get message signature.");
@@ -971,9 +1018,9 @@ static PyObject* SdBusMessage_get_contents2(SdBusMessageObject* self, PyObject*
                 Py_RETURN_NONE;
         }
 
-        CALL_SD_BUS_AND_CHECK(sd_bus_message_rewind(self->message_ref, 0));
+        CALL_SD_BUS_AND_CHECK(sd_bus_message_rewind(message, 0));
         _Parse_state read_parser = {
-            .message = self->message_ref,
+            .message = message,
             .container_char_ptr = message_signature,
             .index = 0,
             .max_index = strlen(message_signature),
@@ -985,6 +1032,10 @@ static PyObject* SdBusMessage_get_contents2(SdBusMessageObject* self, PyObject*
         return iter_tuple_or_single(&read_parser);
 }
 
+static PyObject* SdBusMessage_get_contents2(SdBusMessageObject* self, PyObject* Py_UNUSED(args)) {
+        return _SdBusMessage_get_contents(self->message_ref);
+}
+
 static PyObject* SdBusMessage_parse_to_tuple(SdBusMessageObject* self, PyObject* Py_UNUSED(args)) {
         const char* message_signature = sd_bus_message_get_signature(self->message_ref, 0);
 
@@ -1045,6 +1096,8 @@ static PyMethodDef SdBusMessage_methods[] = {
     {"create_error_reply", (SD_BUS_PY_FUNC_TYPE)SdBusMessage_create_error_reply, SD_BUS_PY_METH,
      PyDoc_STR("Create error reply with error name and error message.")},
     {"send", (PyCFunction)SdBusMessage_send, METH_NOARGS, PyDoc_STR("Queue message to be sent.")},
+    {"append_contents_from", (PyCFunction)SdBusMessage_append_contents_from, METH_O,
+     PyDoc_STR("Append all contents of another sealed message.")},
     {NULL, NULL, 0, NULL},
 };
 
@@ -1113,6 +1166,49 @@ static PyObject* SdBusMessage_sender_getter(SdBusMessageObject* self, void* Py_U
         }
 }
 
+static PyObject* SdBusMessage_monotonic_usec_getter(SdBusMessageObject* self, void* Py_UNUSED(closure)) {
+        uint64_t monotonic_usec = 0;
+        int return_value = sd_bus_message_get_monotonic_usec(self->message_ref, &monotonic_usec);
+        if (-ENODATA == return_value) {
+                // Transport did not attach the timestamp
+                if (0 == self->dispatch_monotonic_usec) {
+                        Py_RETURN_NONE;
+                }
+                monotonic_usec = self->dispatch_monotonic_usec;
+                return_value = 0;
+        }
+        CALL_SD_BUS_AND_CHECK(return_value);
+
+        return PyLong_FromUnsignedLongLong((unsigned long long)monotonic_usec);
+}
+
+static PyObject* SdBusMessage_realtime_usec_getter(SdBusMessageObject* self, void* Py_UNUSED(closure)) {
+        uint64_t realtime_usec = 0;
+        int return_value = sd_bus_message_get_realtime_usec(self->message_ref, &realtime_usec);
+        if (-ENODATA == return_value) {
+                if (0 == self->dispatch_realtime_usec) {
+                        Py_RETURN_NONE;
+                }
+                realtime_usec = self->dispatch_realtime_usec;
+                return_value = 0;
+        }
+        CALL_SD_BUS_AND_CHECK(return_value);
+
+        return PyLong_FromUnsignedLongLong((unsigned long long)realtime_usec);
+}
+
+static PyObject* SdBusMessage_cookie_getter(SdBusMessageObject* self, void* Py_UNUSED(closure)) {
+        uint64_t cookie = 0;
+        int return_value = sd_bus_message_get_cookie(self->message_ref, &cookie);
+        if (-ENODATA == return_value) {
+                // Message was not sealed yet
+                Py_RETURN_NONE;
+        }
+        CALL_SD_BUS_AND_CHECK(return_value);
+
+        return PyLong_FromUnsignedLongLong((unsigned long long)cookie);
+}
+
 static PyGetSetDef SdBusMessage_properies[] = {
     {"expect_reply", (getter)SdBusMessage_expect_reply_getter, (setter)SdBusMessage_expect_reply_setter, PyDoc_STR("Expect reply message?"), NULL},
     {"destination", (getter)SdBusMessage_destination_getter, NULL, PyDoc_STR("Message destination service name."), NULL},
@@ -1120,6 +1216,9 @@ static PyGetSetDef SdBusMessage_properies[] = {
     {"interface", (getter)SdBusMessage_interface_getter, NULL, PyDoc_STR("Message destination interface name."), NULL},
     {"member", (getter)SdBusMessage_member_getter, NULL, PyDoc_STR("Message destination member name."), NULL},
     {"sender", (getter)SdBusMessage_sender_getter, NULL, PyDoc_STR("Message sender name."), NULL},
+    {"monotonic_usec", (getter)SdBusMessage_monotonic_usec_getter, NULL, PyDoc_STR("Receive timestamp in CLOCK_MONOTONIC microseconds."), NULL},
+    {"realtime_usec", (getter)SdBusMessage_realtime_usec_getter, NULL, PyDoc_STR("Receive timestamp in CLOCK_REALTIME microseconds."), NULL},
+    {"cookie", (getter)SdBusMessage_cookie_getter, NULL, PyDoc_STR("Serial number the sender assigned to the message."), NULL},
     {0},
 };
 
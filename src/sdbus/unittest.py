@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     from contextlib import AbstractAsyncContextManager
     from typing import Any, Optional, TypeVar, Union
 
+    from .dbus_common_elements import DbusLocalObjectMeta
     from .dbus_proxy_async_signal import (
         DbusBoundSignalAsyncBase,
         DbusSignalAsync,
@@ -153,14 +154,20 @@ class DbusSignalRecorderLocal(DbusSignalRecorderBase):
         self._local_signal_ref: weak_ref[DbusSignalAsync[Any]] = (
             weak_ref(local_signal.dbus_signal)
         )
+        self._local_meta_ref: weak_ref[DbusLocalObjectMeta] = (
+            weak_ref(local_signal.local_meta)
+        )
 
     async def __aenter__(self) -> DbusSignalRecorderBase:
         local_signal = self._local_signal_ref()
+        local_meta = self._local_meta_ref()
 
-        if local_signal is None:
+        if local_signal is None or local_meta is None:
             raise RuntimeError
 
-        local_signal.local_callbacks.add(self._callback_method)
+        DbusLocalSignalAsync(local_signal, local_meta).local_callbacks.add(
+            self._callback_method
+        )
         return self
 
 
@@ -21,12 +21,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from ..dbus_common_elements import DbusLocalObjectMeta, DbusRemoteObjectMeta
+from ..dbus_common_elements import (
+    BUS_TO_EXPORTED_OBJECTS,
+    DbusLocalObjectMeta,
+    DbusRemoteObjectMeta,
+)
 from ..dbus_proxy_async_interface_base import DbusInterfaceBaseAsync
 from ..dbus_proxy_sync_interface_base import DbusInterfaceBase
 from ..default_bus import get_default_bus
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from typing import Optional, Union
 
     from ..sd_bus_internals import SdBus
@@ -135,7 +140,74 @@ def inspect_dbus_bus(
         raise TypeError(f"Expected D-Bus object got {obj!r}")
 
 
+def inspect_dbus_object(
+    object_path: str,
+    bus: Optional[SdBus] = None,
+) -> DbusInterfaceBaseAsync:
+    """Return the local D-Bus object exported at the path.
+
+    Objects are tracked once exported with ``export_to_dbus`` until
+    the export handle is stopped or the object is deallocated.
+    If several objects are exported at the same path the most recently
+    exported one is returned.
+
+    If no object is exported at the path raises ``LookupError``.
+
+    :param object_path:
+        D-Bus path to look up.
+    :param bus:
+        Bus to inspect.
+        If not given or is ``None`` the default bus will be used.
+    :returns:
+        Exported local D-Bus object.
+    """
+    if bus is None:
+        bus = get_default_bus()
+
+    registry = BUS_TO_EXPORTED_OBJECTS.get(bus)
+    exported_object = (
+        registry.get(object_path) if registry is not None else None
+    )
+    if exported_object is None:
+        raise LookupError(
+            f"No local D-Bus object exported at {object_path!r} "
+            f"path on bus {bus!r}"
+        )
+
+    return exported_object
+
+
+def inspect_dbus_subtree(
+    path_prefix: str,
+    bus: Optional[SdBus] = None,
+) -> Iterator[tuple[str, DbusInterfaceBaseAsync]]:
+    """Iterate over local D-Bus objects exported under the path.
+
+    Yields tuples of path and object including the object exported
+    at the path itself. Only the exported paths under the prefix are
+    visited.
+
+    :param path_prefix:
+        D-Bus path of the subtree root.
+    :param bus:
+        Bus to inspect.
+        If not given or is ``None`` the default bus will be used.
+    :returns:
+        Iterator of D-Bus paths and objects.
+    """
+    if bus is None:
+        bus = get_default_bus()
+
+    registry = BUS_TO_EXPORTED_OBJECTS.get(bus)
+    if registry is None:
+        return iter(())
+
+    return registry.iter_subtree(path_prefix)
+
+
 __all__ = (
     'inspect_dbus_bus',
+    "inspect_dbus_object",
     "inspect_dbus_path",
+    "inspect_dbus_subtree",
 )
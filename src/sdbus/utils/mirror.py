@@ -0,0 +1,464 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+# Copyright (C) 2024 igo95862
+
+# This file is part of python-sdbus
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
+from __future__ import annotations
+
+from asyncio import Queue
+from typing import TYPE_CHECKING
+
+from ..default_bus import get_default_bus
+from .parse import (
+    _create_interfaces_map,
+    _get_class_from_interfaces,
+    _get_member_map_from_class,
+    _interfaces_input_to_types,
+    _translate_and_merge_members,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from types import TracebackType
+    from typing import Any, Optional
+
+    from ..sd_bus_internals import SdBus, SdBusMessage, SdBusSlot
+    from .parse import (
+        InterfacesBaseTypes,
+        InterfacesInput,
+        OnUnknownMember,
+    )
+
+    MirroredInterfaces = dict[str, dict[str, tuple[str, Any]]]
+
+
+OBJECT_MANAGER_INTERFACE_NAME = 'org.freedesktop.DBus.ObjectManager'
+PROPERTIES_INTERFACE_NAME = 'org.freedesktop.DBus.Properties'
+
+
+class DbusMirroredObjectChange:
+    """Change of a single object in the :py:class:`DbusObjectManagerMirror`.
+
+    :ivar str object_path: Path of the changed object.
+    :ivar dict interfaces_added:
+        Added interfaces with their properties variants.
+    :ivar list interfaces_removed: Names of removed interfaces.
+    :ivar dict properties_changed:
+        Changed properties per interface name. Values are tuples of
+        old and new property variant. Invalidated properties have
+        the new variant of ``None``.
+    :ivar bool object_removed:
+        The object no longer exists in the mirror.
+    """
+
+    __slots__ = (
+        'object_path',
+        'interfaces_added',
+        'interfaces_removed',
+        'properties_changed',
+        'object_removed',
+    )
+
+    def __init__(
+        self,
+        object_path: str,
+        interfaces_added: Optional[MirroredInterfaces] = None,
+        interfaces_removed: Optional[list[str]] = None,
+        properties_changed: Optional[
+            dict[str, dict[str, tuple[Any, Any]]]] = None,
+        object_removed: bool = False,
+    ):
+        self.object_path = object_path
+        self.interfaces_added = interfaces_added or {}
+        self.interfaces_removed = interfaces_removed or []
+        self.properties_changed = properties_changed or {}
+        self.object_removed = object_removed
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.object_path!r}, "
+            f"interfaces_added={self.interfaces_added!r}, "
+            f"interfaces_removed={self.interfaces_removed!r}, "
+            f"properties_changed={self.properties_changed!r}, "
+            f"object_removed={self.object_removed!r})"
+        )
+
+
+class DbusObjectManagerMirror:
+    """Local mirror of the objects managed by a remote ObjectManager.
+
+    Loads the managed objects once and keeps them up to date by applying
+    ``InterfacesAdded``, ``InterfacesRemoved`` and ``PropertiesChanged``
+    signals. All signals are received with a single ``path_namespace``
+    match rule.
+
+    Objects are indexed by D-Bus interface name and by the interface
+    class matched from the passed interfaces so that lookups do not
+    need any D-Bus calls.
+
+    Can be used as an async context manager which starts and
+    stops the mirror.
+
+    :param service_name: Service name of the object manager.
+    :param object_manager_path: Path of the object manager.
+    :param interfaces:
+        Possible interfaces of the managed objects used for the class index.
+    :param bus:
+        Optional D-Bus connection object.
+        If not passed the default bus will be used.
+    :param use_interface_subsets:
+        Use the subset of interfaces as a valid class match.
+        See :py:func:`sdbus.utils.parse.parse_get_managed_objects`.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        object_manager_path: str,
+        interfaces: InterfacesInput = (),
+        bus: Optional[SdBus] = None,
+        *,
+        use_interface_subsets: bool = False,
+    ):
+        if bus is None:
+            bus = get_default_bus()
+
+        self.service_name = service_name
+        self.object_manager_path = object_manager_path
+        self.bus = bus
+        self.use_interface_subsets = use_interface_subsets
+        self._interfaces_to_class_map = _create_interfaces_map(
+            _interfaces_input_to_types(interfaces)
+        )
+
+        self.path_to_interfaces: dict[str, MirroredInterfaces] = {}
+        self.path_to_class: dict[str, Optional[InterfacesBaseTypes]] = {}
+        self.interface_to_paths: dict[str, set[str]] = {}
+        self.class_to_paths: dict[InterfacesBaseTypes, set[str]] = {}
+
+        self._match_slot: Optional[SdBusSlot] = None
+        # Signals received while the managed objects are loaded
+        self._loading_signals: Optional[list[SdBusMessage]] = None
+        # None is put in to the queues when the mirror stops
+        self._change_queues: set[
+            Queue[Optional[DbusMirroredObjectChange]]] = set()
+
+    def _match_rule(self) -> str:
+        return (
+            "type='signal',"
+            f"sender='{self.service_name}',"
+            f"path_namespace='{self.object_manager_path}'"
+        )
+
+    async def start(self) -> None:
+        """Subscribe to the signals and load the managed objects."""
+        if self._match_slot is not None:
+            raise RuntimeError("Mirror is already started")
+
+        loading_signals: list[SdBusMessage] = []
+        self._loading_signals = loading_signals
+        try:
+            self._match_slot = await self.bus.add_match_async(
+                self._match_rule(),
+                self._on_signal_message,
+            )
+
+            get_objects_message = self.bus.new_method_call_message(
+                self.service_name,
+                self.object_manager_path,
+                OBJECT_MANAGER_INTERFACE_NAME,
+                'GetManagedObjects',
+            )
+            reply_message = await self.bus.call_async(get_objects_message)
+        except BaseException:
+            self.stop()
+            raise
+        finally:
+            self._loading_signals = None
+
+        managed_objects: dict[str, MirroredInterfaces] = (
+            reply_message.get_contents()  # type: ignore[assignment]
+        )
+        for object_path, interfaces in managed_objects.items():
+            self._add_interfaces(object_path, interfaces)
+
+        # Signals sent before the reply are already accounted in it.
+        # Sender numbers its messages in the order they were sent.
+        reply_sender = reply_message.sender
+        reply_cookie = reply_message.cookie
+        assert reply_cookie is not None
+        for signal_message in loading_signals:
+            signal_cookie = signal_message.cookie
+            if (
+                signal_message.sender == reply_sender
+                and signal_cookie is not None
+                and signal_cookie > reply_cookie
+            ):
+                self._on_signal_message(signal_message)
+
+    def stop(self) -> None:
+        """Unsubscribe from the signals and clear the mirror.
+
+        Iterators returned by :py:meth:`catch_changes` are stopped.
+        """
+        if self._match_slot is not None:
+            self._match_slot.close()
+            self._match_slot = None
+
+        if self._loading_signals is not None:
+            self._loading_signals.clear()
+
+        for changes_queue in self._change_queues:
+            changes_queue.put_nowait(None)
+
+        self.path_to_interfaces.clear()
+        self.path_to_class.clear()
+        self.interface_to_paths.clear()
+        self.class_to_paths.clear()
+
+    async def __aenter__(self) -> DbusObjectManagerMirror:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    def get_paths_by_interface(self, interface_name: str) -> frozenset[str]:
+        """Paths of the objects implementing D-Bus interface.
+
+        :param interface_name: D-Bus interface name.
+        :returns: Set of objects paths.
+        """
+        return frozenset(self.interface_to_paths.get(interface_name, ()))
+
+    def get_paths_by_class(
+        self,
+        interface_class: InterfacesBaseTypes,
+    ) -> frozenset[str]:
+        """Paths of the objects matched to the interface class.
+
+        :param interface_class:
+            One of the interface classes passed to the mirror.
+        :returns: Set of objects paths.
+        """
+        return frozenset(self.class_to_paths.get(interface_class, ()))
+
+    def get_object(
+        self,
+        object_path: str,
+        on_unknown_member: OnUnknownMember = 'reuse',
+    ) -> tuple[Optional[InterfacesBaseTypes], dict[str, Any]]:
+        """Get the class and python named properties of mirrored object.
+
+        :param object_path: Path of the object.
+        :param on_unknown_member:
+            If an unknown D-Bus property was encountered either raise
+            an ``"error"``, ``"ignore"`` the property
+            or ``"reuse"`` (default) the D-Bus name for the member.
+        :returns: Tuple of object's class (or ``None``) and dictionary
+            of python translated members and their values.
+        :raises KeyError: Object is not in the mirror.
+        """
+        python_class = self.path_to_class[object_path]
+        return (
+            python_class,
+            _translate_and_merge_members(
+                self.path_to_interfaces[object_path],
+                _get_member_map_from_class(python_class),
+                on_unknown_member,
+            ),
+        )
+
+    async def catch_changes(self) -> AsyncIterator[DbusMirroredObjectChange]:
+        """Iterate over changes applied to the mirror.
+
+        Iteration ends when the mirror is stopped.
+
+        :returns: Async iterator of :py:class:`DbusMirroredObjectChange`.
+        """
+        changes_queue: Queue[Optional[DbusMirroredObjectChange]] = Queue()
+        self._change_queues.add(changes_queue)
+        try:
+            while True:
+                change = await changes_queue.get()
+                if change is None:
+                    return
+
+                yield change
+        finally:
+            self._change_queues.discard(changes_queue)
+
+    def _notify(self, change: DbusMirroredObjectChange) -> None:
+        for changes_queue in self._change_queues:
+            changes_queue.put_nowait(change)
+
+    def _reindex_class(self, object_path: str) -> None:
+        old_class = self.path_to_class.pop(object_path, None)
+        if old_class is not None:
+            old_class_paths = self.class_to_paths[old_class]
+            old_class_paths.discard(object_path)
+            if not old_class_paths:
+                del self.class_to_paths[old_class]
+
+        interfaces = self.path_to_interfaces.get(object_path)
+        if interfaces is None:
+            return
+
+        new_class = _get_class_from_interfaces(
+            self._interfaces_to_class_map,
+            interfaces.keys(),
+            False,
+            self.use_interface_subsets,
+        )
+        self.path_to_class[object_path] = new_class
+        if new_class is not None:
+            self.class_to_paths.setdefault(new_class, set()).add(object_path)
+
+    def _add_interfaces(
+        self,
+        object_path: str,
+        interfaces_added: MirroredInterfaces,
+    ) -> DbusMirroredObjectChange:
+        interfaces = self.path_to_interfaces.setdefault(object_path, {})
+        for interface_name, properties in interfaces_added.items():
+            interfaces[interface_name] = dict(properties)
+            self.interface_to_paths.setdefault(
+                interface_name, set()).add(object_path)
+
+        self._reindex_class(object_path)
+        return DbusMirroredObjectChange(
+            object_path,
+            interfaces_added=interfaces_added,
+        )
+
+    def _remove_interfaces(
+        self,
+        object_path: str,
+        interfaces_removed: list[str],
+    ) -> Optional[DbusMirroredObjectChange]:
+        interfaces = self.path_to_interfaces.get(object_path)
+        if interfaces is None:
+            return None
+
+        for interface_name in interfaces_removed:
+            if interfaces.pop(interface_name, None) is None:
+                continue
+
+            interface_paths = self.interface_to_paths[interface_name]
+            interface_paths.discard(object_path)
+            if not interface_paths:
+                del self.interface_to_paths[interface_name]
+
+        object_removed = not interfaces
+        if object_removed:
+            del self.path_to_interfaces[object_path]
+
+        self._reindex_class(object_path)
+        return DbusMirroredObjectChange(
+            object_path,
+            interfaces_removed=interfaces_removed,
+            object_removed=object_removed,
+        )
+
+    def _change_properties(
+        self,
+        object_path: str,
+        interface_name: str,
+        changed_properties: dict[str, tuple[str, Any]],
+        invalidated_properties: list[str],
+    ) -> Optional[DbusMirroredObjectChange]:
+        interfaces = self.path_to_interfaces.get(object_path)
+        if interfaces is None:
+            return None
+
+        properties = interfaces.get(interface_name)
+        if properties is None:
+            return None
+
+        properties_diff: dict[str, tuple[Any, Any]] = {}
+        for member_name, new_value in changed_properties.items():
+            old_value = properties.get(member_name)
+            if old_value != new_value:
+                properties_diff[member_name] = (old_value, new_value)
+                properties[member_name] = new_value
+
+        for member_name in invalidated_properties:
+            old_value = properties.pop(member_name, None)
+            if old_value is not None:
+                properties_diff[member_name] = (old_value, None)
+
+        if not properties_diff:
+            return None
+
+        return DbusMirroredObjectChange(
+            object_path,
+            properties_changed={interface_name: properties_diff},
+        )
+
+    def _on_signal_message(self, message: SdBusMessage) -> None:
+        loading_signals = self._loading_signals
+        if loading_signals is not None:
+            loading_signals.append(message)
+            return
+
+        interface_name = message.interface
+        member_name = message.member
+        change: Optional[DbusMirroredObjectChange] = None
+
+        if interface_name == OBJECT_MANAGER_INTERFACE_NAME:
+            if message.path != self.object_manager_path:
+                return
+
+            if member_name == 'InterfacesAdded':
+                object_path, interfaces_added = message.get_contents()
+                change = self._add_interfaces(
+                    object_path,  # type: ignore[arg-type]
+                    interfaces_added,  # type: ignore[arg-type]
+                )
+            elif member_name == 'InterfacesRemoved':
+                object_path, interfaces_removed = message.get_contents()
+                change = self._remove_interfaces(
+                    object_path,  # type: ignore[arg-type]
+                    interfaces_removed,  # type: ignore[arg-type]
+                )
+        elif (
+            interface_name == PROPERTIES_INTERFACE_NAME
+            and member_name == 'PropertiesChanged'
+        ):
+            object_path = message.path
+            assert object_path is not None
+            changed_interface, changed, invalidated = message.get_contents()
+            change = self._change_properties(
+                object_path,
+                changed_interface,  # type: ignore[arg-type]
+                changed,  # type: ignore[arg-type]
+                invalidated,  # type: ignore[arg-type]
+            )
+
+        if change is not None:
+            self._notify(change)
+
+
+__all__ = (
+    'DbusMirroredObjectChange',
+    'DbusObjectManagerMirror',
+)
@@ -22,8 +22,8 @@ from __future__ import annotations
 from asyncio import get_running_loop, wait_for
 from typing import Any
 
-from sdbus.dbus_common_elements import DbusLocalObjectMeta
 from sdbus.exceptions import DbusFailedError
+from sdbus.sd_bus_internals import SdBusInterface, SdBusMessage
 from sdbus.unittest import IsolatedDbusTestCase
 
 from sdbus import (
@@ -164,47 +164,74 @@ class TestLowLevelErrors(IsolatedDbusTestCase):
 
         await self.test_object_connection.hello_world()
 
+    def _export_failing_interface(self, object_path: str) -> SdBusInterface:
+        def failing_callback(message: SdBusMessage) -> None:
+            raise IndependentError
+
+        def derived_error_callback(message: SdBusMessage) -> None:
+            raise DbusDerivePropertydError
+
+        interface = SdBusInterface()
+        interface.add_method('Failing', '', (), 's', (), 0, failing_callback)
+        interface.add_method('FailingDerived', '', (), 's', (), 0,
+                             derived_error_callback)
+        interface.add_property('FailingProperty', 's',
+                               failing_callback, None, 0)
+        self.bus.add_interface(interface, object_path, 'org.example.errors')
+        return interface
+
     async def test_property_callback_error(self) -> None:
-        dbus_local_meta = self.test_object._dbus
-        if not isinstance(dbus_local_meta, DbusLocalObjectMeta):
-            raise TypeError
-        interface = dbus_local_meta.activated_interfaces[0]
-        interface.property_get_dict.pop(b'DerriveErrSettable')
+        interface = self._export_failing_interface('/failing')
 
-        with self.assertRaises(DbusFailedError):
-            await wait_for(
-                self.test_object_connection.derrive_err_settable,
-                timeout=1,
-            )
+        get_message = self.bus.new_property_get_message(
+            'org.test', '/failing',
+            'org.example.errors', 'FailingProperty',
+        )
+
+        with self.assertRaises(DbusFailedError) as cm:
+            await wait_for(self.bus.call_async(get_message), timeout=1)
+
+        self.assertIs(cm.exception.__class__, DbusFailedError)
+
+        await self.test_object_connection.hello_world()
+        interface._stop_export()
 
     async def test_method_callback_error(self) -> None:
-        TEST_KEY = b'HelloWorld'
-        dbus_local_meta = self.test_object._dbus
-        if not isinstance(dbus_local_meta, DbusLocalObjectMeta):
-            raise TypeError
-        interface = dbus_local_meta.activated_interfaces[0]
-        interface.method_dict.pop(TEST_KEY)
-
-        with self.assertRaises(DbusFailedError):
-            await wait_for(
-                self.test_object_connection.hello_world(),
-                timeout=1,
-            )
+        interface = self._export_failing_interface('/failing')
 
-        interface.method_dict[TEST_KEY] = None
+        call_message = self.bus.new_method_call_message(
+            'org.test', '/failing',
+            'org.example.errors', 'Failing',
+        )
 
-        with self.assertRaises(TypeError):
-            await wait_for(
-                self.test_object_connection.hello_world(),
-                timeout=1,
-            )
+        with self.assertRaises(DbusFailedError) as cm:
+            await wait_for(self.bus.call_async(call_message), timeout=1)
 
-        def test_raise(*args: Any, **kwargs: Any) -> None:
-            raise DbusDerivePropertydError
+        self.assertIs(cm.exception.__class__, DbusFailedError)
+
+        call_message = self.bus.new_method_call_message(
+            'org.test', '/failing',
+            'org.example.errors', 'FailingDerived',
+        )
 
-        interface.method_dict[TEST_KEY] = test_raise
         with self.assertRaises(DbusDerivePropertydError):
-            await wait_for(
-                self.test_object_connection.hello_world(),
-                timeout=1,
-            )
+            await wait_for(self.bus.call_async(call_message), timeout=1)
+
+        await self.test_object_connection.hello_world()
+        interface._stop_export()
+
+    async def test_interface_export_twice(self) -> None:
+        interface = self._export_failing_interface('/failing')
+
+        with self.assertRaises(RuntimeError):
+            self.bus.add_interface(
+                interface, '/failing_again', 'org.example.errors')
+
+        interface._stop_export()
+
+        with self.assertRaises(RuntimeError):
+            self.bus.add_interface(
+                interface, '/failing', 'org.example.errors')
+
+        # Previous export is not affected
+        await self.test_object_connection.hello_world()
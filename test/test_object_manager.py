@@ -19,6 +19,11 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
+from asyncio import sleep
+
+from sdbus.dbus_proxy_async_object_manager import (
+    DbusManagedObjectsSnapshot,
+)
 from sdbus.exceptions import DbusUnknownObjectError
 from sdbus.unittest import IsolatedDbusTestCase
 from sdbus.utils import (
@@ -53,6 +58,7 @@ OBJECT_MANAGER_PATH = '/object_manager'
 CONNECTION_NAME = 'org.example.test'
 
 MANAGED_INTERFACE_NAME = 'org.test.testing'
+MANAGED_SETTABLE_INTERFACE_NAME = 'org.test.settable'
 
 
 class ManagedInterface(
@@ -66,6 +72,8 @@ class ManagedInterface(
 
 
 MANAGED_PATH = '/object_manager/test'
+OTHER_OBJECT_MANAGER_PATH = '/other_object_manager'
+OTHER_MANAGED_PATH = '/other_object_manager/test'
 
 
 class TestObjectManager(IsolatedDbusTestCase):
@@ -116,6 +124,115 @@ class TestObjectManager(IsolatedDbusTestCase):
 
         self.assertIn(MANAGED_INTERFACE_NAME, interfaces_removed)
 
+    async def test_export_many_with_manager(self) -> None:
+        await self.bus.request_name_async(CONNECTION_NAME, 0)
+
+        object_manager = DbusObjectManagerInterfaceAsync()
+        object_manager.export_to_dbus(OBJECT_MANAGER_PATH)
+
+        object_manager_connection = DbusObjectManagerInterfaceAsync.new_proxy(
+            CONNECTION_NAME, OBJECT_MANAGER_PATH)
+
+        managed_paths = [f"{MANAGED_PATH}{x}" for x in range(5)]
+        managed_objects = [ManagedInterface() for _ in managed_paths]
+
+        async with self.assertDbusSignalEmits(
+            object_manager_connection.interfaces_added
+        ) as added_interfaces_catch:
+            handle = object_manager.export_many_with_manager(
+                zip(managed_paths, managed_objects),
+                batch_size=2,
+            )
+            # All objects are callable before being announced
+            self.assertEqual(
+                len(managed_paths),
+                len(await object_manager_connection.get_managed_objects()),
+            )
+
+            while len(object_manager._managed_object_to_path) < 5:
+                await sleep(0)
+
+            # Round trip to receive all signals
+            await object_manager_connection.get_managed_objects()
+
+        self.assertEqual(
+            managed_paths,
+            [path for path, _ in added_interfaces_catch.output],
+        )
+
+        async with self.assertDbusSignalEmits(
+            object_manager_connection.interfaces_removed
+        ) as removed_interfaces_catch:
+            handle.stop()
+            await object_manager_connection.get_managed_objects()
+
+        self.assertEqual(
+            managed_paths,
+            [path for path, _ in removed_interfaces_catch.output],
+        )
+        self.assertFalse(
+            await object_manager_connection.get_managed_objects())
+
+    async def test_managed_objects_snapshot(self) -> None:
+        await self.bus.request_name_async(CONNECTION_NAME, 0)
+
+        class SettableInterface(
+            DbusInterfaceCommonAsync,
+            interface_name=MANAGED_SETTABLE_INTERFACE_NAME,
+        ):
+            def __init__(self) -> None:
+                super().__init__()
+                self._test_str = HELLO_WORLD
+
+            @dbus_property_async('s')
+            def test_str(self) -> str:
+                return self._test_str
+
+            @test_str.setter
+            def _test_str_set(self, new_str: str) -> None:
+                self._test_str = new_str
+
+        object_manager = DbusObjectManagerInterfaceAsync()
+        object_manager.export_to_dbus(
+            OBJECT_MANAGER_PATH, managed_objects_snapshot=True)
+
+        object_manager_connection = DbusObjectManagerInterfaceAsync.new_proxy(
+            CONNECTION_NAME, OBJECT_MANAGER_PATH)
+
+        managed_object = SettableInterface()
+        object_manager.export_with_manager(MANAGED_PATH, managed_object)
+
+        managed_objects = await object_manager_connection.get_managed_objects()
+        self.assertEqual(
+            managed_objects[MANAGED_PATH][
+                MANAGED_SETTABLE_INTERFACE_NAME]['TestStr'],
+            ('s', HELLO_WORLD),
+        )
+
+        # Snapshots of other object managers observe the same object
+        other_snapshot = DbusManagedObjectsSnapshot(
+            self.bus, OTHER_OBJECT_MANAGER_PATH)
+        other_snapshot.add_object(OTHER_MANAGED_PATH, managed_object)
+
+        await managed_object.test_str.set_async('New string')
+
+        managed_objects = await object_manager_connection.get_managed_objects()
+        self.assertEqual(
+            managed_objects[MANAGED_PATH][
+                MANAGED_SETTABLE_INTERFACE_NAME]['TestStr'],
+            ('s', 'New string'),
+        )
+        self.assertEqual(
+            other_snapshot.path_to_interfaces[OTHER_MANAGED_PATH][
+                MANAGED_SETTABLE_INTERFACE_NAME]['TestStr'],
+            ('s', 'New string'),
+        )
+        other_snapshot.remove_object(OTHER_MANAGED_PATH, managed_object)
+
+        object_manager.remove_managed_object(managed_object)
+        self.assertFalse(
+            await object_manager_connection.get_managed_objects())
+
     def test_expot_with_no_manager(self) -> None:
         object_manager = ObjectManagerTestInterface()
 
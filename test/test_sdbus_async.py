@@ -19,18 +19,35 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
-from asyncio import Event, get_running_loop
+from asyncio import (
+    CancelledError,
+    Event,
+    Queue,
+    create_task,
+    ensure_future,
+    gather,
+    get_running_loop,
+    iscoroutine,
+)
 from asyncio import run as asyncio_run
 from asyncio import sleep, wait_for
 from asyncio.subprocess import create_subprocess_exec
-from typing import TYPE_CHECKING
+from gc import collect, disable, enable
+from threading import get_ident
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Optional
 from unittest import SkipTest
+from weakref import ReferenceType, ref
 
+from sdbus.dbus_common_elements import DbusLocalObjectMeta
+from sdbus.dbus_proxy_async_method import DbusMethodAsync
 from sdbus.exceptions import (
     DbusFailedError,
     DbusFileExistsError,
+    DbusLimitsExceededError,
     DbusNoReplyError,
     DbusPropertyReadOnlyError,
+    DbusTimeoutError,
     DbusUnknownObjectError,
     SdBusLibraryError,
     SdBusUnmappedMessageError,
@@ -38,11 +55,13 @@ from sdbus.exceptions import (
 from sdbus.sd_bus_internals import (
     DBUS_ERROR_TO_EXCEPTION,
     DbusPropertyEmitsChangeFlag,
+    sd_bus_open_user,
 )
 from sdbus.unittest import IsolatedDbusTestCase
 from sdbus.utils.parse import parse_properties_changed
 
 from sdbus import (
+    DbusCallLimiter,
     DbusInterfaceCommonAsync,
     DbusNoReplyFlag,
     dbus_method_async,
@@ -57,6 +76,7 @@ if TYPE_CHECKING:
     from sdbus.dbus_proxy_async_interfaces import (
         DBUS_PROPERTIES_CHANGED_TYPING,
     )
+    from sdbus.sd_bus_internals import SdBusMessage
 else:
     DBUS_PROPERTIES_CHANGED_TYPING = None
 
@@ -224,6 +244,10 @@ class TestInterface(
     async def looong_method(self) -> None:
         await sleep(100)
 
+    @dbus_method_async('d', max_queue_time=0.05)
+    async def sleep_queue_limited(self, duration: float) -> None:
+        await sleep(duration)
+
     @dbus_signal_async()
     def empty_signal(self) -> None:
         raise NotImplementedError
@@ -247,6 +271,10 @@ class TestInterface(
     async def return_length(self, input_str: str) -> int:
         return len(input_str)
 
+    @dbus_method_async("s", "sx")
+    async def upper_and_length(self, input_str: str) -> tuple[str, int]:
+        return input_str.upper(), len(input_str)
+
 
 class DbusErrorTest(DbusFailedError):
     dbus_error_name = 'org.example.Error'
@@ -310,6 +338,16 @@ class TestProxy(IsolatedDbusTestCase):
             await test_object_connection.kwargs_function(
                 input='ASD', is_upper=False))
 
+        self.assertEqual(
+            '',
+            await test_object_connection.kwargs_function(
+                input='', is_upper=False))
+
+        with self.assertRaises(TypeError):
+            await test_object_connection.kwargs_function(
+                not_an_arg=True,  # type: ignore[call-arg]
+            )
+
     async def test_method(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -358,6 +396,39 @@ class TestProxy(IsolatedDbusTestCase):
                 3024,
             )
 
+    async def test_method_call_coroutine(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        upper_call = test_object_connection.upper('test')
+        self.assertTrue(iscoroutine(upper_call))
+        self.assertEqual('TEST', await create_task(upper_call))
+
+        # No arguments
+        self.assertEqual(1, await test_object_connection.test_int())
+        await test_object_connection.returns_none_method()
+
+        # Multiple return values
+        self.assertEqual(
+            ('TEST', 4),
+            await test_object_connection.upper_and_length('test'),
+        )
+
+        with self.assertRaises(DbusErrorTest):
+            await create_task(test_object_connection.raise_custom_error())
+
+        # Call limiter wraps the call in the same coroutine
+        call_limiter = DbusCallLimiter(max_in_flight=1)
+        call_limiter.install()
+        try:
+            limited_call = test_object_connection.test_int()
+            self.assertTrue(iscoroutine(limited_call))
+            self.assertEqual(1, await limited_call)
+
+            with self.assertRaises(DbusErrorTest):
+                await test_object_connection.raise_custom_error()
+        finally:
+            call_limiter.close()
+
     async def test_subclass(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -502,6 +573,89 @@ class TestProxy(IsolatedDbusTestCase):
         self.assertEqual([test_tuple], local_signals_record.output)
         self.assertEqual([test_tuple], remote_signals_record.output)
 
+    async def test_signal_throttle(self) -> None:
+        class ThrottledInterface(
+            DbusInterfaceCommonAsync,
+            interface_name='org.example.throttled',
+        ):
+            @dbus_signal_async('x', max_emit_rate=10.0)
+            def progress(self) -> int:
+                raise NotImplementedError
+
+        test_object = ThrottledInterface()
+        test_object.export_to_dbus('/throttled')
+        test_object_connection = ThrottledInterface.new_proxy(
+            TEST_SERVICE_NAME, '/throttled')
+
+        async with self.assertDbusSignalEmits(
+                test_object.progress
+            ) as local_signals_record, self.assertDbusSignalEmits(
+                test_object_connection.progress
+        ) as remote_signals_record:
+            for i in range(100):
+                test_object.progress.emit(i)
+
+            await sleep(0.15)
+            await test_object_connection.dbus_ping()
+
+        # First value goes out right away and the latest one
+        # is emitted after the throttle interval.
+        self.assertEqual([0, 99], local_signals_record.output)
+        self.assertEqual([0, 99], remote_signals_record.output)
+
+        with self.subTest('Broadcast'):
+            caught: list[tuple[str, int]] = []
+
+            async def catch_broadcast() -> None:
+                async for x in ThrottledInterface.progress.catch_anywhere(
+                        TEST_SERVICE_NAME, self.bus):
+                    caught.append(x)
+                    if len(caught) == 4:
+                        return
+
+            catch_task = get_running_loop().create_task(catch_broadcast())
+            await sleep(0)
+
+            ThrottledInterface.progress.broadcast([('/a', 0), ('/b', 0)])
+            ThrottledInterface.progress.broadcast([('/a', 1)])
+            ThrottledInterface.progress.broadcast([('/a', 2), ('/b', 2)])
+
+            await wait_for(catch_task, timeout=1)
+            # Delayed broadcasts are merged per path
+            self.assertEqual(
+                [('/a', 0), ('/b', 0), ('/a', 2), ('/b', 2)],
+                caught,
+            )
+
+        with self.subTest('No running loop'):
+            unexported_object = ThrottledInterface()
+            emitted: list[int] = []
+            emitted_callback = emitted.append
+            progress_signal = unexported_object.progress
+            progress_signal.local_callbacks.add(  # type: ignore[attr-defined]
+                emitted_callback)
+
+            def emit_without_loop() -> None:
+                for i in range(3):
+                    unexported_object.progress.emit(i)
+
+            await get_running_loop().run_in_executor(None, emit_without_loop)
+            self.assertEqual([0, 1, 2], emitted)
+
+    async def test_signal_local_per_object(self) -> None:
+        test_object, _ = initialize_object()
+        other_object = TestInterface()
+
+        test_tuple = ('sgfsretg', 'asd')
+
+        async with self.assertDbusSignalEmits(
+            test_object.test_signal
+        ) as local_signals_record:
+            other_object.test_signal.emit(('other', 'object'))
+            test_object.test_signal.emit(test_tuple)
+
+        self.assertEqual([test_tuple], local_signals_record.output)
+
     async def test_signal_catch_anywhere(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -568,6 +722,29 @@ class TestProxy(IsolatedDbusTestCase):
                     timeout=1,
                 )
 
+    async def test_signal_broadcast(self) -> None:
+        test_tuple = ('sgfsretg', 'asd')
+        paths = [f'/broadcast/{i}' for i in range(3)]
+
+        caught: list[tuple[str, tuple[str, str]]] = []
+
+        async def catch_broadcast() -> None:
+            async for x in TestInterface.test_signal.catch_anywhere(
+                    TEST_SERVICE_NAME, self.bus):
+                caught.append(x)
+                if len(caught) == len(paths):
+                    return
+
+        catch_task = get_running_loop().create_task(catch_broadcast())
+        await sleep(0)
+
+        TestInterface.test_signal.broadcast(
+            (path, test_tuple) for path in paths
+        )
+
+        await wait_for(catch_task, timeout=1)
+        self.assertEqual([(path, test_tuple) for path in paths], caught)
+
     async def test_signal_multiple_readers(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -642,6 +819,23 @@ class TestProxy(IsolatedDbusTestCase):
 
         await wait_for(test_object.no_reply_sync.wait(), timeout=1)
 
+    async def test_no_reply_per_call(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        upper = test_object_connection.upper
+        self.assertIsNone(
+            upper.no_reply('test'))  # type: ignore[attr-defined]
+        raise_python_exc = test_object_connection.raise_python_exc
+        self.assertIsNone(
+            raise_python_exc.no_reply())  # type: ignore[attr-defined]
+
+        test_object_connection.test_property.set_no_reply('no_reply')
+        # Calls are processed in order they were sent
+        self.assertEqual(
+            'no_reply',
+            await wait_for(test_object_connection.test_property, timeout=1),
+        )
+
     async def test_interface_remove(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -674,6 +868,39 @@ class TestProxy(IsolatedDbusTestCase):
         self.assertTrue(
             getdoc(test_object_connection.test_signal))
 
+    def test_proxy_bound_members_cached(self) -> None:
+        _, test_object_connection = initialize_object()
+
+        self.assertIs(
+            test_object_connection.upper,
+            test_object_connection.upper,
+        )
+        self.assertIs(
+            test_object_connection.test_property,
+            test_object_connection.test_property,
+        )
+        self.assertIs(
+            test_object_connection.test_signal,
+            test_object_connection.test_signal,
+        )
+
+        self.assertIsInstance(TestInterface.upper, DbusMethodAsync)
+
+        # Cached members do not create reference cycles
+        del test_object_connection
+        collect()
+        disable()
+        try:
+            test_object_connection = TestInterface.new_proxy(
+                TEST_SERVICE_NAME, '/')
+            test_object_connection.upper
+            test_object_connection.test_property
+            test_object_connection.test_signal
+            del test_object_connection
+            self.assertEqual(0, collect())
+        finally:
+            enable()
+
     async def test_emits_properties_changed(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -723,6 +950,193 @@ class TestProxy(IsolatedDbusTestCase):
         with self.assertRaises(SdBusLibraryError):
             await wait_for(too_long_wait(), timeout=1)
 
+    async def test_bus_drain(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        # New connection queues messages until it is authenticated
+        server_bus = sd_bus_open_user()
+        for i in range(10):
+            signal_message = server_bus.new_signal_message(
+                '/', 'org.example.test', 'test_signal')
+            signal_message.append_data('s', str(i))
+            signal_message.send()
+
+        # Hello call is also queued
+        self.assertGreaterEqual(server_bus.n_queued_write, 10)
+
+        await wait_for(server_bus.drain(), timeout=1)
+        self.assertEqual(0, server_bus.n_queued_write)
+
+        await wait_for(self.bus.drain(), timeout=1)
+        self.assertEqual(0, self.bus.n_queued_write)
+        self.assertEqual(0, self.bus.n_queued_read)
+
+    async def test_call_limiter(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        limiter = DbusCallLimiter(max_in_flight_per_destination=2)
+
+        # Limiter does not apply until installed
+        self.assertEqual('TEST', await test_object_connection.upper('test'))
+        self.assertEqual(0, limiter.calls_waited)
+
+        limiter.install()
+        try:
+            with self.assertRaises(RuntimeError):
+                DbusCallLimiter(max_in_flight=1).install()
+
+            calls = [
+                ensure_future(test_object_connection.upper(str(i)))
+                for i in range(10)
+            ]
+            await sleep(0)
+            self.assertEqual(2, limiter.in_flight)
+            self.assertEqual(8, limiter.queue_depth)
+
+            results = await wait_for(gather(*calls), timeout=1)
+        finally:
+            limiter.close()
+
+        self.assertEqual([str(i).upper() for i in range(10)], results)
+        self.assertEqual(0, limiter.in_flight)
+        self.assertEqual(0, limiter.queue_depth)
+        self.assertEqual(8, limiter.calls_waited)
+        self.assertGreater(limiter.total_wait_time, 0)
+
+        # Limiter no longer applies once closed
+        self.assertEqual('TEST', await test_object_connection.upper('test'))
+        self.assertEqual(8, limiter.calls_waited)
+
+    async def test_call_limiter_other_destination(self) -> None:
+        test_object, test_object_connection = initialize_object()
+        dbus_daemon = DbusInterfaceCommonAsync.new_proxy(
+            'org.freedesktop.DBus', '/org/freedesktop/DBus')
+
+        limiter = DbusCallLimiter(max_in_flight_per_destination=1)
+        limiter.install()
+        try:
+            running_call = ensure_future(
+                test_object_connection.looong_method())
+            queued_call = ensure_future(test_object_connection.upper('test'))
+            await sleep(0)
+            self.assertEqual(1, limiter.queue_depth)
+
+            # Saturated destination does not hold back other ones
+            await wait_for(dbus_daemon.dbus_ping(), timeout=1)
+            self.assertEqual(1, limiter.queue_depth)
+
+            running_call.cancel()
+            self.assertEqual('TEST', await wait_for(queued_call, timeout=1))
+        finally:
+            limiter.close()
+
+    async def test_call_limits(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        test_object.set_call_limits(max_concurrent_per_method=1, max_queued=1)
+
+        running_call = ensure_future(test_object_connection.looong_method())
+        queued_call = ensure_future(test_object_connection.looong_method())
+
+        with self.assertRaises(DbusLimitsExceededError):
+            await wait_for(test_object_connection.looong_method(), timeout=1)
+
+        dbus_local_meta = test_object._dbus
+        if not isinstance(dbus_local_meta, DbusLocalObjectMeta):
+            raise TypeError
+
+        call_admission = dbus_local_meta.call_admission
+        assert call_admission is not None
+        self.assertEqual(1, call_admission.running)
+        self.assertEqual(1, len(call_admission.queued))
+        self.assertEqual(1, call_admission.calls_rejected)
+
+        # Other methods have their own limit
+        self.assertEqual(
+            'TEST',
+            await wait_for(test_object_connection.upper('test'), timeout=1),
+        )
+
+        # Removing limits starts queued calls
+        test_object.set_call_limits()
+        self.assertIsNone(dbus_local_meta.call_admission)
+        self.assertEqual(2, call_admission.running)
+        self.assertEqual(0, len(call_admission.queued))
+
+        running_call.cancel()
+        queued_call.cancel()
+
+    async def test_call_limits_export_stopped(self) -> None:
+        test_object = TestInterface()
+        export_handle = test_object.export_to_dbus('/')
+        test_object_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/')
+
+        test_object.set_call_limits(max_concurrent_per_method=1, max_queued=1)
+
+        running_call = ensure_future(test_object_connection.looong_method())
+        queued_call = ensure_future(test_object_connection.looong_method())
+        # Ping makes sure both calls reached the object
+        await test_object_connection.dbus_ping()
+
+        # Queued call gets an error reply instead of timing out
+        export_handle.stop()
+        with self.assertRaises(DbusUnknownObjectError):
+            await wait_for(queued_call, timeout=1)
+
+        running_call.cancel()
+
+    async def test_method_max_queue_time(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        test_object.set_call_limits(max_concurrent_per_method=1, max_queued=1)
+
+        running_call = ensure_future(
+            test_object_connection.sleep_queue_limited(0.2))
+        # Waits in the queue for longer than allowed
+        with self.assertRaises(DbusTimeoutError):
+            await wait_for(
+                test_object_connection.sleep_queue_limited(0.0),
+                timeout=1,
+            )
+
+        await wait_for(running_call, timeout=1)
+        await wait_for(
+            test_object_connection.sleep_queue_limited(0.0),
+            timeout=1,
+        )
+
+    async def test_negotiate_timestamp(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        messages: Queue[SdBusMessage] = Queue()
+
+        slot = await self.bus.match_signal_async(
+            TEST_SERVICE_NAME,
+            None, None, None,
+            messages.put_nowait)
+
+        test_object.test_signal.emit(('test', 'signal'))
+
+        message = await wait_for(messages.get(), timeout=1)
+        self.assertIsNone(message.monotonic_usec)
+        self.assertIsNone(message.realtime_usec)
+
+        # Can be enabled on a started connection
+        self.bus.negotiate_timestamp(True)
+        sent_at = monotonic()
+        test_object.test_signal.emit(('test', 'signal'))
+
+        message = await wait_for(messages.get(), timeout=1)
+        monotonic_usec = message.monotonic_usec
+        assert monotonic_usec is not None
+        self.assertGreaterEqual(monotonic_usec / 1_000_000, sent_at)
+        self.assertLessEqual(monotonic_usec / 1_000_000, monotonic())
+        self.assertIsNotNone(message.realtime_usec)
+
+        self.bus.negotiate_timestamp(False)
+        slot.close()
+
     async def test_bus_timerfd(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -780,6 +1194,72 @@ class TestProxy(IsolatedDbusTestCase):
         test_object = EnumedInterfaceAsync()
         test_object.export_to_dbus(ObjectPathEnum.FOO)
 
+    async def test_method_eager_and_suspended(self) -> None:
+        class EagerInterface(
+            DbusInterfaceCommonAsync,
+            interface_name='org.example.eager',
+        ):
+            @dbus_method_async(result_signature='sx')
+            async def no_suspend(self) -> tuple[str, int]:
+                return get_current_message().member or '', 1
+
+            @dbus_method_async(result_signature='(sx)')
+            async def suspend(self) -> tuple[str, int]:
+                await sleep(0)
+                return get_current_message().member or '', 2
+
+        test_object = EagerInterface()
+        test_object.export_to_dbus('/')
+        test_object_connection = EagerInterface.new_proxy(
+            TEST_SERVICE_NAME, '/')
+
+        self.assertEqual(
+            ('NoSuspend', 1),
+            await test_object_connection.no_suspend(),
+        )
+        self.assertEqual(
+            ('Suspend', 2),
+            await test_object_connection.suspend(),
+        )
+
+    async def test_method_sync_handlers(self) -> None:
+        loop_thread_id = get_ident()
+
+        class SyncHandlersInterface(
+            DbusInterfaceCommonAsync,
+            interface_name='org.example.synchandlers',
+        ):
+            @dbus_method_async(input_signature='x', result_signature='x')
+            def double(self, value: int) -> int:
+                return value * 2
+
+            @dbus_method_async(result_signature='sb', run_in_executor=True)
+            def in_thread(self) -> tuple[str, bool]:
+                return (
+                    get_current_message().member or '',
+                    get_ident() != loop_thread_id,
+                )
+
+            @dbus_method_async()
+            def raises(self) -> None:
+                raise DbusFileExistsError('Test')
+
+        test_object = SyncHandlersInterface()
+        test_object.export_to_dbus('/')
+        test_object_connection = SyncHandlersInterface.new_proxy(
+            TEST_SERVICE_NAME, '/')
+
+        self.assertEqual(4, await test_object_connection.double(2))
+        self.assertEqual(
+            ('InThread', True),
+            await test_object_connection.in_thread(),
+        )
+        with self.assertRaises(DbusFileExistsError):
+            await test_object_connection.raises()
+
+        # Local calls return results directly
+        self.assertEqual(6, test_object.double(3))
+
     async def test_properties_get_all_dict(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -798,6 +1278,87 @@ class TestProxy(IsolatedDbusTestCase):
             )['test_property'],
         )
 
+    async def test_properties_get_all_dict_concurrent(self) -> None:
+        class FirstInterface(
+            DbusInterfaceCommonAsync,
+            interface_name='org.example.first',
+        ):
+            @dbus_property_async('s')
+            def first(self) -> str:
+                return 'first'
+
+        class SecondInterface(
+            DbusInterfaceCommonAsync,
+            interface_name='org.example.second',
+        ):
+            @dbus_property_async('s')
+            def second(self) -> str:
+                return 'second'
+
+        class CombinedInterface(FirstInterface, SecondInterface):
+            ...
+
+        combined_object = CombinedInterface()
+        combined_object.export_to_dbus('/combined')
+        combined_connection = CombinedInterface.new_proxy(
+            TEST_SERVICE_NAME, '/combined')
+
+        self.assertEqual(
+            {'first': 'first', 'second': 'second'},
+            await combined_connection.properties_get_all_dict(),
+        )
+
+        with self.subTest('Calls are sent together'):
+            started_interfaces: list[str] = []
+            all_started = Event()
+
+            async def get_all_after_all_started(
+                interface_name: str,
+            ) -> dict[str, tuple[str, Any]]:
+                started_interfaces.append(interface_name)
+                if len(started_interfaces) == 2:
+                    all_started.set()
+
+                await all_started.wait()
+                return {}
+
+            setattr(
+                combined_connection,
+                '_properties_get_all',
+                get_all_after_all_started,
+            )
+            await wait_for(
+                combined_connection.properties_get_all_dict(),
+                timeout=1,
+            )
+
+        with self.subTest('Other calls are cancelled on failure'):
+            other_call_cancelled = Event()
+
+            async def get_all_first_fails(
+                interface_name: str,
+            ) -> dict[str, tuple[str, Any]]:
+                if interface_name == 'org.example.first':
+                    raise DbusFailedError('Failed')
+
+                try:
+                    await sleep(10)
+                except CancelledError:
+                    other_call_cancelled.set()
+                    raise
+
+                return {}
+
+            setattr(
+                combined_connection,
+                '_properties_get_all',
+                get_all_first_fails,
+            )
+            with self.assertRaises(DbusFailedError):
+                await combined_connection.properties_get_all_dict()
+
+            await wait_for(other_call_cancelled.wait(), timeout=1)
+
     async def test_empty_signal(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -845,6 +1406,158 @@ class TestProxy(IsolatedDbusTestCase):
         self.assertIsNone(
             parsed_dict_with_invalidation['invalidated_property'])
 
+    async def test_properties_changed_coalesced(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        remote_iter = (
+            test_object_connection.properties_changed_coalesced().__aiter__()
+        )
+        local_iter = test_object.properties_changed_coalesced().__aiter__()
+
+        remote_task = ensure_future(remote_iter.__anext__())
+        local_task = ensure_future(local_iter.__anext__())
+        await sleep(0)
+        # Let the match rule get registered
+        await test_object_connection.dbus_ping()
+
+        await test_object.test_property.set_async('first')
+        self.assertEqual(
+            {'test_property': 'first'},
+            await wait_for(local_task, timeout=1),
+        )
+        self.assertEqual(
+            {'test_property': 'first'},
+            await wait_for(remote_task, timeout=1),
+        )
+
+        # Changes of the interfaces not in the class are skipped
+        remote_task = ensure_future(remote_iter.__anext__())
+        local_task = ensure_future(local_iter.__anext__())
+        test_object.properties_changed.emit(
+            ('org.example.other', {'Other': ('s', 'other')}, []))
+        await test_object_connection.dbus_ping()
+        self.assertFalse(remote_task.done())
+        self.assertFalse(local_task.done())
+
+        # Changes queued before the consumer runs should be merged
+        await test_object.test_property.set_async('second')
+        await test_object.test_property_private.set_async(10)
+        await test_object.test_property.set_async('third')
+        await test_object_connection.dbus_ping()
+
+        self.assertEqual(
+            {'test_property': 'third', 'test_property_private': 10},
+            await wait_for(local_task, timeout=1),
+        )
+        self.assertEqual(
+            {'test_property': 'third', 'test_property_private': 10},
+            await wait_for(remote_task, timeout=1),
+        )
+
+    async def test_properties_batch(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        async with self.assertDbusSignalEmits(
+            test_object_connection.properties_changed
+        ) as properties_changed_catch:
+            with test_object.properties_batch():
+                await test_object.test_property.set_async('first')
+                await test_object.test_property_private.set_async(10)
+                await test_object.test_property.set_async('second')
+
+        self.assertEqual(1, len(properties_changed_catch.output))
+        self.assertEqual(
+            {'test_property': 'second', 'test_property_private': 10},
+            parse_properties_changed(
+                test_object, properties_changed_catch.output[0]),
+        )
+
+        with self.subTest('Auto flush'):
+            async with self.assertDbusSignalEmits(
+                test_object_connection.properties_changed
+            ) as auto_flush_catch:
+                test_object.properties_batch(auto_flush=True)
+                await test_object.test_property.set_async('third')
+                await test_object.test_property_private.set_async(20)
+                await test_object_connection.dbus_ping()
+
+            self.assertEqual(1, len(auto_flush_catch.output))
+
+    async def test_properties_cache(self) -> None:
+        test_object, test_object_connection = initialize_object()
+
+        await test_object_connection.properties_cache_enable()
+
+        # Property that emits change is served from cache
+        test_object.test_string = 'not_signaled'
+        self.assertEqual(
+            'test_property',
+            await test_object_connection.test_property,
+        )
+
+        # Property without change signal is not cached without time to live
+        test_object.test_string_read = 'new_read'
+        self.assertEqual(
+            'new_read',
+            await test_object_connection.test_property_read_only,
+        )
+
+        # Cache gets updated by PropertiesChanged signal
+        await test_object.test_property.set_async('signaled')
+        await test_object_connection.dbus_ping()
+        self.assertEqual(
+            'signaled',
+            await test_object_connection.test_property,
+        )
+
+        with self.subTest('Time to live'):
+            await test_object_connection.properties_cache_enable(
+                time_to_live=60.0)
+
+            test_object.test_string_read = 'after_ttl'
+            self.assertEqual(
+                'new_read',
+                await test_object_connection.test_property_read_only,
+            )
+
+        test_object_connection.properties_cache_disable()
+        self.assertEqual(
+            'after_ttl',
+            await test_object_connection.test_property_read_only,
+        )
+
+    async def test_properties_cache_service_restart(self) -> None:
+        service_name = 'org.example.restarting'
+        dbus_daemon = DbusInterfaceCommonAsync.new_proxy(
+            'org.freedesktop.DBus', '/org/freedesktop/DBus')
+
+        server_bus = sd_bus_open_user()
+        await server_bus.request_name_async(service_name, 0)
+        test_object = TestInterface()
+        test_object.export_to_dbus('/', server_bus)
+
+        test_object_connection = TestInterface.new_proxy(service_name, '/')
+        await test_object_connection.properties_cache_enable()
+        self.assertEqual(
+            'test_property',
+            await test_object_connection.test_property,
+        )
+
+        server_bus.close()
+        await dbus_daemon.dbus_ping()
+
+        restarted_bus = sd_bus_open_user()
+        await restarted_bus.request_name_async(service_name, 0)
+        restarted_object = TestInterface()
+        restarted_object.test_string = 'restarted'
+        restarted_object.export_to_dbus('/', restarted_bus)
+        await dbus_daemon.dbus_ping()
+
+        self.assertEqual(
+            'restarted',
+            await test_object_connection.test_property,
+        )
+
     async def test_property_private_setter(self) -> None:
         test_object, test_object_connection = initialize_object()
 
@@ -1030,6 +1743,129 @@ class TestProxy(IsolatedDbusTestCase):
         with self.assertRaises(DbusUnknownObjectError):
             await test_object_connection.returns_none_method()
 
+    async def test_export_subtree(self) -> None:
+        first_object = TestInterface()
+        second_object = TestInterface()
+        second_object.test_string = 'second'
+        subtree = {
+            '/subtree/first': first_object,
+            '/subtree/second': second_object,
+        }
+
+        first_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/subtree/first')
+        second_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/subtree/second')
+        missing_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/subtree/missing')
+
+        with TestInterface.export_subtree_to_dbus('/subtree', subtree.get):
+            self.assertEqual(
+                'TEST', await first_connection.upper('test'))
+            self.assertEqual(
+                'test_property', await first_connection.test_property)
+            self.assertEqual(
+                'second', await second_connection.test_property)
+
+            # Found objects are attached to the bus at their path
+            async with self.assertDbusSignalEmits(
+                second_connection.properties_changed
+            ) as properties_changed_record:
+                await second_connection.test_property.set_async('changed')
+
+            self.assertEqual('changed', second_object.test_string)
+            self.assertEqual('test_property', first_object.test_string)
+            self.assertEqual(
+                [({'TestProperty': ('s', 'changed')}, [])],
+                [
+                    (changed, invalidated)
+                    for _, changed, invalidated
+                    in properties_changed_record.output
+                ],
+            )
+
+            async with self.assertDbusSignalEmits(
+                first_connection.test_signal
+            ) as signals_record:
+                first_object.test_signal.emit(('test', 'signal'))
+
+            self.assertEqual([('test', 'signal')], signals_record.output)
+
+            with self.assertRaises(DbusUnknownObjectError):
+                await missing_connection.test_int()
+
+        with self.assertRaises(DbusUnknownObjectError):
+            await first_connection.test_int()
+
+        # Export lasts as long as its handle
+        TestInterface.export_subtree_to_dbus('/subtree', subtree.get)
+        with self.assertRaises(DbusUnknownObjectError):
+            await first_connection.test_int()
+
+    async def test_export_shared_vtable(self) -> None:
+        first_object = TestInterface()
+        second_object = TestInterface()
+        second_object.test_string = 'second'
+
+        first_object.export_to_dbus('/first')
+        second_object.export_to_dbus('/second')
+
+        first_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/first')
+        second_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/second')
+
+        self.assertIs(
+            TestInterface._dbus_shared_interfaces(),
+            TestInterface._dbus_shared_interfaces(),
+        )
+        self.assertEqual(
+            'test_property', await first_connection.test_property)
+        self.assertEqual('second', await second_connection.test_property)
+
+        # Export does not keep the object alive
+        del second_object
+        with self.assertRaises(DbusUnknownObjectError):
+            await second_connection.test_property
+        self.assertEqual(1, await first_connection.test_int())
+
+    async def test_export_subtree_factory(self) -> None:
+        created_paths: list[str] = []
+        created_devices: list[ReferenceType[TestInterface]] = []
+
+        def device_factory(path: str) -> Optional[TestInterface]:
+            if not path.startswith('/devices/'):
+                return None
+
+            created_paths.append(path)
+            new_device = TestInterface()
+            created_devices.append(ref(new_device))
+            return new_device
+
+        def enumerate_devices(prefix: str) -> list[str]:
+            return ['/devices/first', '/devices/second']
+
+        devices_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/devices')
+        first_device_connection = TestInterface.new_proxy(
+            TEST_SERVICE_NAME, '/devices/first')
+
+        with TestInterface.export_subtree_to_dbus(
+            '/devices', device_factory,
+            node_enumerator=enumerate_devices,
+        ):
+            self.assertEqual(
+                'TEST', await first_device_connection.upper('test'))
+            # Factory called once per incoming call
+            self.assertEqual(['/devices/first'], created_paths)
+            # Bus does not keep the found object after the call
+            self.assertIsNone(created_devices[0]())
+
+            introspection = await devices_connection.dbus_introspect()
+            self.assertIn('<node name="first"/>', introspection)
+            self.assertIn('<node name="second"/>', introspection)
+            self.assertEqual(['/devices/first'], created_paths)
+
     def test_asyncio_run_different_loops(self) -> None:
         bus = self.bus
 
@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 from unittest import main
+from weakref import ref
 
 from sdbus.exceptions import DbusPropertyReadOnlyError
 from sdbus.unittest import IsolatedDbusTestCase
@@ -64,6 +65,16 @@ class TestSync(IsolatedDbusTestCase):
         with self.subTest('Test properties_get_all_dict'):
             self.assertIn('features', s.properties_get_all_dict())
 
+        with self.subTest('Test no reply call'):
+            self.assertIsNone(
+                s.get_id.no_reply())  # type: ignore[attr-defined]
+            self.assertIsInstance(s.get_id(), str)
+
+        with self.subTest('Test property set no reply'):
+            features = s.features
+            FreedesktopDbus.features.set_no_reply(s, ['test'])
+            self.assertEqual(features, s.features)
+
     def test_docstring(self) -> None:
         from pydoc import getdoc
 
@@ -75,6 +86,26 @@ class TestSync(IsolatedDbusTestCase):
         with self.subTest('Property doc (through class dict)'):
             self.assertTrue(getdoc(s.__class__.__dict__['features']))
 
+        with self.subTest('Class access'):
+            self.assertTrue(getdoc(FreedesktopDbus.get_connection_pid))
+            self.assertTrue(getdoc(FreedesktopDbus.features))
+
+    def test_bound_members_cached(self) -> None:
+        s = FreedesktopDbus(self.bus)
+
+        get_id = s.get_id
+        self.assertIs(get_id, s.get_id)
+        self.assertEqual(
+            get_id(),
+            get_id.interface.get_id(),  # type: ignore[attr-defined]
+        )
+
+        # Cached members do not keep the proxy alive through a cycle
+        proxy_ref = ref(s)
+        del s
+        self.assertIsNone(proxy_ref())
+        self.assertTrue(get_id())
+
     def test_interface_composition(self) -> None:
         class OneInterface(
             DbusInterfaceCommon,
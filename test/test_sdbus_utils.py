@@ -19,21 +19,38 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from __future__ import annotations
 
+from asyncio import create_task, sleep, wait_for
+from time import sleep as blocking_sleep
+from typing import TYPE_CHECKING
 from unittest import TestCase
 
 from sdbus.unittest import IsolatedDbusTestCase
-from sdbus.utils.inspect import inspect_dbus_bus, inspect_dbus_path
+from sdbus.utils.inspect import (
+    inspect_dbus_bus,
+    inspect_dbus_object,
+    inspect_dbus_path,
+    inspect_dbus_subtree,
+)
+from sdbus.utils.mirror import (
+    DbusMirroredObjectChange,
+    DbusObjectManagerMirror,
+)
 from sdbus.utils.parse import parse_get_managed_objects
 
 from sdbus import (
     DbusInterfaceCommon,
     DbusInterfaceCommonAsync,
+    DbusObjectManagerInterfaceAsync,
     dbus_property,
     dbus_property_async,
     sd_bus_open_user,
 )
 
+if TYPE_CHECKING:
+    from sdbus.sd_bus_internals import SdBusMessage
+
 TEST_PATH = "/test"
+TEST_SERVICE_NAME = "org.example.test"
 
 
 class FooAsync(DbusInterfaceCommonAsync, interface_name="org.foo"):
@@ -279,3 +296,224 @@ class TestSdbusUtilsInspect(IsolatedDbusTestCase):
         local_obj.export_to_dbus("/")
 
         self.assertIs(inspect_dbus_bus(local_obj), self.bus)
+
+    def test_inspect_dbus_object_and_subtree(self) -> None:
+        with self.assertRaises(LookupError):
+            inspect_dbus_object(TEST_PATH)
+
+        self.assertEqual([], list(inspect_dbus_subtree("/")))
+
+        root_obj = FooAsync()
+        root_obj.export_to_dbus(TEST_PATH)
+        child_obj = BarAsync()
+        child_handle = child_obj.export_to_dbus(TEST_PATH + "/a/b")
+        other_obj = FooAsync()
+        other_obj.export_to_dbus("/other")
+
+        self.assertIs(inspect_dbus_object(TEST_PATH), root_obj)
+        self.assertIs(inspect_dbus_object(TEST_PATH + "/a/b"), child_obj)
+
+        with self.assertRaises(LookupError):
+            inspect_dbus_object(TEST_PATH + "/a")
+
+        self.assertEqual(
+            {(TEST_PATH, root_obj), (TEST_PATH + "/a/b", child_obj)},
+            set(inspect_dbus_subtree(TEST_PATH)),
+        )
+        self.assertEqual(3, len(list(inspect_dbus_subtree("/"))))
+
+        new_bus = sd_bus_open_user()
+        with self.assertRaises(LookupError):
+            inspect_dbus_object(TEST_PATH, new_bus)
+
+        child_handle.stop()
+
+        with self.assertRaises(LookupError):
+            inspect_dbus_object(TEST_PATH + "/a/b")
+
+        self.assertEqual(
+            [(TEST_PATH, root_obj)],
+            list(inspect_dbus_subtree(TEST_PATH)),
+        )
+
+        del other_obj
+        self.assertEqual(
+            [(TEST_PATH, root_obj)],
+            list(inspect_dbus_subtree("/")),
+        )
+
+
+class BazAsync(DbusInterfaceCommonAsync, interface_name="org.baz"):
+    def __init__(self) -> None:
+        super().__init__()
+        self._baz = "baz"
+
+    @dbus_property_async("s")
+    def baz(self) -> str:
+        return self._baz
+
+    @baz.setter
+    def _baz_setter(self, new_baz: str) -> None:
+        self._baz = new_baz
+
+
+class TestSdbusUtilsMirror(IsolatedDbusTestCase):
+    async def test_object_manager_mirror(self) -> None:
+        await self.bus.request_name_async(TEST_SERVICE_NAME, 0)
+
+        object_manager = DbusObjectManagerInterfaceAsync()
+        object_manager.export_to_dbus(TEST_PATH)
+
+        foo_bar = FooBarAsync()
+        object_manager.export_with_manager(TEST_PATH + "/foobar", foo_bar)
+
+        async with DbusObjectManagerMirror(
+            TEST_SERVICE_NAME,
+            TEST_PATH,
+            (FooBarAsync, BazAsync),
+        ) as mirror:
+            changes = mirror.catch_changes()
+
+            self.assertEqual(
+                {TEST_PATH + "/foobar"},
+                mirror.get_paths_by_interface("org.foo"),
+            )
+            self.assertEqual(
+                (FooBarAsync, {"foo": 1, "bar": 2}),
+                mirror.get_object(TEST_PATH + "/foobar"),
+            )
+
+            baz = BazAsync()
+            object_manager.export_with_manager(TEST_PATH + "/baz", baz)
+            added_change = await changes.__anext__()
+
+            self.assertEqual(TEST_PATH + "/baz", added_change.object_path)
+            self.assertIn("org.baz", added_change.interfaces_added)
+            self.assertEqual(
+                {TEST_PATH + "/baz"},
+                mirror.get_paths_by_class(BazAsync),
+            )
+
+            await baz.baz.set_async("new")
+            properties_change = await changes.__anext__()
+
+            self.assertEqual(
+                {"org.baz": {"Baz": (("s", "baz"), ("s", "new"))}},
+                properties_change.properties_changed,
+            )
+            self.assertEqual(
+                {"baz": "new"},
+                mirror.get_object(TEST_PATH + "/baz")[1],
+            )
+
+            object_manager.remove_managed_object(foo_bar)
+            removed_change = await changes.__anext__()
+
+            self.assertTrue(removed_change.object_removed)
+            self.assertFalse(mirror.get_paths_by_interface("org.foo"))
+            self.assertFalse(mirror.get_paths_by_class(FooBarAsync))
+
+    async def test_object_manager_mirror_stop(self) -> None:
+        await self.bus.request_name_async(TEST_SERVICE_NAME, 0)
+
+        object_manager = DbusObjectManagerInterfaceAsync()
+        object_manager.export_to_dbus(TEST_PATH)
+
+        mirror = DbusObjectManagerMirror(TEST_SERVICE_NAME, TEST_PATH)
+        await mirror.start()
+
+        async def collect_changes() -> list[DbusMirroredObjectChange]:
+            return [change async for change in mirror.catch_changes()]
+
+        collect_task = create_task(collect_changes())
+        await sleep(0)
+        mirror.stop()
+
+        self.assertEqual([], await wait_for(collect_task, timeout=1))
+
+    async def test_object_manager_mirror_signal_after_reply(self) -> None:
+        await self.bus.request_name_async(TEST_SERVICE_NAME, 0)
+
+        late_object_path = TEST_PATH + "/late"
+
+        object_manager = DbusObjectManagerInterfaceAsync()
+        object_manager.export_to_dbus(TEST_PATH)
+
+        def reply_then_add_object(message: SdBusMessage) -> None:
+            reply_message = message.create_reply()
+            reply_message.append_data("a{oa{sa{sv}}}", {})
+            reply_message.send()
+            object_manager.interfaces_added.emit(
+                (late_object_path, {"org.baz": {"Baz": ("s", "late")}})
+            )
+
+        filter_slot = self.bus.add_method_call_filter(
+            TEST_PATH,
+            "org.freedesktop.DBus.ObjectManager",
+            "GetManagedObjects",
+            reply_then_add_object,
+        )
+        self.addCleanup(filter_slot.close)
+
+        async with DbusObjectManagerMirror(
+            TEST_SERVICE_NAME,
+            TEST_PATH,
+            (BazAsync, ),
+        ) as mirror:
+            # Ping makes sure the late signal was received
+            await self.bus.request_name_async(TEST_SERVICE_NAME + ".ping", 0)
+
+            self.assertEqual(
+                (BazAsync, {"baz": "late"}),
+                mirror.get_object(late_object_path),
+            )
+
+    async def test_object_manager_mirror_signals_with_reply(self) -> None:
+        # Server on its own connection so that the reply and
+        # the signals are dispatched in one pass.
+        server_bus = sd_bus_open_user()
+        await server_bus.request_name_async(TEST_SERVICE_NAME, 0)
+
+        early_object_path = TEST_PATH + "/early"
+        late_object_path = TEST_PATH + "/late"
+
+        object_manager = DbusObjectManagerInterfaceAsync()
+        object_manager.export_to_dbus(TEST_PATH, server_bus)
+
+        def reply_between_signals(message: SdBusMessage) -> None:
+            # Reply already accounts the early signal
+            object_manager.interfaces_added.emit(
+                (early_object_path, {"org.baz": {"Baz": ("s", "early")}})
+            )
+            reply_message = message.create_reply()
+            reply_message.append_data("a{oa{sa{sv}}}", {})
+            reply_message.send()
+            object_manager.interfaces_added.emit(
+                (late_object_path, {"org.baz": {"Baz": ("s", "late")}})
+            )
+            # Let the broker deliver every message before the client
+            # connection is processed.
+            server_bus.flush()
+            blocking_sleep(0.1)
+
+        filter_slot = server_bus.add_method_call_filter(
+            TEST_PATH,
+            "org.freedesktop.DBus.ObjectManager",
+            "GetManagedObjects",
+            reply_between_signals,
+        )
+        self.addCleanup(filter_slot.close)
+
+        async with DbusObjectManagerMirror(
+            TEST_SERVICE_NAME,
+            TEST_PATH,
+            (BazAsync, ),
+        ) as mirror:
+            # Ping makes sure the late signal was received
+            await self.bus.request_name_async(TEST_SERVICE_NAME + ".ping", 0)
+
+            self.assertEqual(
+                (BazAsync, {"baz": "late"}),
+                mirror.get_object(late_object_path),
+            )
+            self.assertNotIn(early_object_path, mirror.path_to_interfaces)